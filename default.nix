@@ -5,7 +5,9 @@
 , click
 , nodriver
 , pythonOlder
+, orjson
 , pandas
+, pyarrow
 , requests
 , setuptools
 }:
@@ -15,7 +17,7 @@ buildPythonApplication {
   version = "1.0.0";
   pyproject = true;
 
-  disabled = pythonOlder "3.9";
+  disabled = pythonOlder "3.10";
 
   src = ./.;
 
@@ -30,6 +32,8 @@ buildPythonApplication {
     nodriver
     googlemaps
     click
+    orjson
+    pyarrow
   ];
 
   build-system = [ setuptools ];
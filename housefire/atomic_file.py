@@ -0,0 +1,23 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+
+@contextmanager
+def atomic_write(path: Path, mode: str = "wb") -> Iterator[IO[Any]]:
+    """
+    opens a temp file next to path and renames it over path once the block exits cleanly,
+    so a crash never leaves a torn file, the temp file is deleted if the block raises
+    """
+    with tempfile.NamedTemporaryFile(
+        mode, dir=Path(path).parent, delete=False
+    ) as temp_file:
+        try:
+            yield temp_file
+        except BaseException:
+            temp_file.close()
+            os.remove(temp_file.name)
+            raise
+    os.replace(temp_file.name, path)
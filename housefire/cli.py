@@ -1,20 +1,34 @@
+from __future__ import annotations
+
 import datetime
 import pathlib
 import click
-import nodriver as uc
 import os
 import uuid
 import configparser
+from logging import Logger
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
 
-from housefire.dependency.google_maps import GoogleGeocodeAPI
-from housefire.dependency.housefire_client.client import HousefireClient
-from housefire.dependency.housefire_client.housefire_object import Reit
 from housefire.logger import HousefireLoggerFactory
-from housefire.scraper.scraper_factory import ScraperFactory
-from housefire.scraper.scraper import ScrapeResult
-from housefire.transformer.transformer import TransformResult
-from housefire.transformer.transformer_factory import TransformerFactory
 from housefire.config import HousefireConfig
+from housefire.file_format import (
+    DEFAULT_FILE_FORMAT,
+    FILE_FORMATS,
+    check_file_format,
+    infer_file_format,
+)
+
+# the browser automation, geocoding, pandas, and API client stacks are imported by the
+# commands that use them, so --help and init load none of them and upload only the last
+if TYPE_CHECKING:
+    from housefire.dependency.housefire_client.client import (
+        HousefireClient,
+        PartialUploadError,
+    )
+    from housefire.dependency.housefire_client.housefire_object import Property
+    from housefire.dependency.housefire_client.property_batch import PropertyBatch
+    from housefire.scraper.scraper import Scraper, ScrapeResult
+    from housefire.transformer.transformer import Transformer
 
 
 def main():
@@ -225,17 +239,19 @@ def init(
 
 
 def _get_supported_tickers() -> list[str]:
-    ticker_set = (
-        ScraperFactory.supported_tickers() | TransformerFactory.supported_tickers()
-    )
+    # read from the registries, which import no scraper or transformer module
+    from housefire.registry import SCRAPERS, TRANSFORMERS
+
+    ticker_set = SCRAPERS.names() | TRANSFORMERS.names()
     return sorted(ticker.upper() for ticker in ticker_set)
 
 
-def sync_reits_main(config: HousefireConfig) -> tuple[list[str], list[str]]:
-    housefire_api = HousefireClient(
-        config.housefire_api_key,
-        config.housefire_base_url,
-    )
+def sync_reits_main(
+    config: HousefireConfig, housefire_api: Optional[HousefireClient] = None
+) -> tuple[list[str], list[str]]:
+    from housefire.dependency.housefire_client.housefire_object import Reit
+
+    housefire_api = housefire_api or _create_housefire_client(config)
     supported_tickers = _get_supported_tickers()
     existing_tickers = sorted(reit.ticker.upper() for reit in housefire_api.get_reits())
     existing_ticker_set = set(existing_tickers)
@@ -252,13 +268,16 @@ def sync_reits_main(config: HousefireConfig) -> tuple[list[str], list[str]]:
 @click.pass_context
 def sync_reits(ctx):
     """Create missing REIT records for registered scraper/transformer tickers."""
-    existing_tickers, created_tickers = sync_reits_main(ctx.obj["CONFIG"])
+    config: HousefireConfig = ctx.obj["CONFIG"]
+    housefire_api = _create_housefire_client(config)
+    existing_tickers, created_tickers = sync_reits_main(config, housefire_api)
     for ticker in created_tickers:
         click.echo(f"Created REIT {ticker}.")
     click.echo(
         f"REIT sync complete: created {len(created_tickers)}, "
         f"already present {len(existing_tickers)}."
     )
+    _echo_cache_stats(housefire_api)
 
 
 @housefire.command()
@@ -269,8 +288,52 @@ def sync_reits(ctx):
     is_flag=True,
     help="Whether to save the temporary directory after the data pipeline has run.",
 )
+@click.option(
+    "--format",
+    "file_format",
+    type=click.Choice(FILE_FORMATS),
+    default=DEFAULT_FILE_FORMAT,
+    show_default=True,
+    help="File format of the saved output.",
+)
+@click.option(
+    "--keep-raw-columns",
+    default=False,
+    is_flag=True,
+    help="Keep every column of downloaded exports instead of only the columns the transformer reads.",
+)
+@click.option(
+    "--no-transform-cache",
+    "use_transform_cache",
+    default=True,
+    flag_value=False,
+    help="Transform every row instead of reusing the properties of rows unchanged since the last run.",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=500,
+    show_default=True,
+    help="Hand scraped rows on to the transform, and transformed properties on to the upload, this many at a time.",
+)
+@click.option(
+    "--queue-size",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Chunks held between stages before a stage waits for the next to catch up.",
+)
 @click.pass_context
-def run_data_pipeline(ctx, ticker: str, save_output: bool):
+def run_data_pipeline(
+    ctx,
+    ticker: str,
+    save_output: bool,
+    file_format: str,
+    keep_raw_columns: bool,
+    use_transform_cache: bool,
+    chunk_size: int,
+    queue_size: int,
+):
     """
     Run the full data pipeline for scraping the TICKER website and uploading to housefire.
     """
@@ -279,47 +342,118 @@ def run_data_pipeline(ctx, ticker: str, save_output: bool):
     if not os.path.exists(config.temp_dir_path):
         os.makedirs(config.temp_dir_path)
 
-    uc.loop().run_until_complete(run_data_pipeline_main(config, ticker, save_output))
+    import nodriver as uc
+
+    uc.loop().run_until_complete(
+        run_data_pipeline_main(
+            config,
+            ticker,
+            save_output,
+            file_format,
+            keep_raw_columns,
+            use_transform_cache,
+            chunk_size,
+            queue_size,
+        )
+    )
 
 
 async def run_data_pipeline_main(
-    config: HousefireConfig, ticker: str, save_output: bool
+    config: HousefireConfig,
+    ticker: str,
+    save_output: bool,
+    file_format: str = DEFAULT_FILE_FORMAT,
+    keep_raw_columns: bool = False,
+    use_transform_cache: bool = False,
+    chunk_size: int = 500,
+    queue_size: int = 4,
 ):
+    from housefire.dependency.google_maps import GoogleGeocodeAPI
+    from housefire.dependency.housefire_client.client import (
+        HousefireClient,
+        PartialUploadError,
+    )
+    from housefire.dependency.housefire_client.property_batch import (
+        PropertyBatch,
+        PropertyBatchWriter,
+    )
+    from housefire.pipeline import PipelineSettings, StagedPipeline
+    from housefire.scraper.scraper_factory import ScraperFactory
+    from housefire.transformer.transformer_factory import TransformerFactory
+
     temp_dir_path = _create_temp_dir(config.temp_dir_path, ticker)
-    logger_factory = HousefireLoggerFactory(config.deploy_env, config.log_dir_path)
+    logger_factory = _create_logger_factory(config)
 
-    # scrape
+    # initialize dependencies
     scraper_factory = ScraperFactory(logger_factory, config.chrome_path)
     scraper = await scraper_factory.get_scraper(ticker, temp_dir_path)
-    scraped_data = await scraper.scrape()
-
-    if save_output:
-        path = os.path.join(temp_dir_path, f"{ticker}_scraped.csv")
-        ScrapeResult.to_csv(scraped_data, pathlib.Path(path))
-
-    # initialize dependencies
-    housefire_api = HousefireClient(config.housefire_api_key, config.housefire_base_url)
+    scraper.keep_raw_fields = keep_raw_columns
+    scraped_path = (
+        pathlib.Path(temp_dir_path, f"{ticker}_scraped.{file_format}")
+        if save_output
+        else None
+    )
+    housefire_api = _create_housefire_client(
+        config, logger_factory.get_logger(HousefireClient.__name__)
+    )
     geocode_api = GoogleGeocodeAPI(
         logger_factory.get_logger(GoogleGeocodeAPI.__name__),
         housefire_api,
         config.google_maps_api_key,
     )
-
-    # transform
-    transformer_factory = TransformerFactory(logger_factory, geocode_api)
+    transformer_factory = TransformerFactory(
+        logger_factory, geocode_api, config.transform_workers
+    )
     transformer = transformer_factory.get_transformer(ticker)
-    transformed_data = transformer.transform(scraped_data)
-
-    if save_output:
-        path = os.path.join(temp_dir_path, f"{ticker}_transformed.csv")
-        TransformResult.to_csv(transformed_data, pathlib.Path(path))
-
-    # upload
-    housefire_api.update_properties_by_ticker(
-        ticker.upper(), [d.property for d in transformed_data]
+    # only the properties are passed on, raw rows are reread from disk if needed
+    transformer.release_scrape_results = True
+    transformer.scrape_artifact = scraped_path
+    if use_transform_cache:
+        transformer.use_transform_cache(_transform_cache_dir(config))
+
+    # scrape, transform, and upload as concurrent stages
+    transformed_writer = (
+        PropertyBatchWriter(
+            pathlib.Path(temp_dir_path, f"{ticker}_transformed.{file_format}"),
+            file_format,
+        )
+        if save_output
+        else None
     )
-    if not save_output:
-        _delete_temp_dir(temp_dir_path)
+    dead_letter_path = _dead_letter_path(config.temp_dir_path, ticker)
+    pipeline = StagedPipeline(
+        scraper,
+        transformer,
+        housefire_api,
+        ticker,
+        PipelineSettings(chunk_size, queue_size),
+        scrape=lambda: _scrape(scraper, scraped_path, file_format),
+        on_transformed=(
+            (
+                lambda results: transformed_writer.write(
+                    PropertyBatch.from_properties(d.property for d in results)
+                )
+            )
+            if transformed_writer is not None
+            else None
+        ),
+        dead_letter_path=dead_letter_path,
+        logger=logger_factory.get_logger(StagedPipeline.__name__),
+    )
+    try:
+        try:
+            await pipeline.run()
+        except PartialUploadError as e:
+            _echo_partial_upload(e, ticker)
+            raise SystemExit(1)
+        finally:
+            if transformed_writer is not None:
+                transformed_writer.close()
+        _echo_transform_cache_stats(transformer)
+        if not save_output:
+            _delete_temp_dir(temp_dir_path)
+    finally:
+        _echo_cache_stats(housefire_api)
 
 
 @housefire.command()
@@ -336,8 +470,29 @@ async def run_data_pipeline_main(
     is_flag=True,
     help="Whether to save the temporary directory after the scraper has run.",
 )
+@click.option(
+    "--format",
+    "file_format",
+    type=click.Choice(FILE_FORMATS),
+    default=DEFAULT_FILE_FORMAT,
+    show_default=True,
+    help="File format of the saved output.",
+)
+@click.option(
+    "--keep-raw-columns",
+    default=False,
+    is_flag=True,
+    help="Keep every column of downloaded exports instead of only the columns the transformer reads.",
+)
 @click.pass_context
-def scrape(ctx, ticker: str, debug: bool, save_output: bool):
+def scrape(
+    ctx,
+    ticker: str,
+    debug: bool,
+    save_output: bool,
+    file_format: str,
+    keep_raw_columns: bool,
+):
     """
     Scrapes the TICKER website for property data.
     """
@@ -345,23 +500,37 @@ def scrape(ctx, ticker: str, debug: bool, save_output: bool):
     # create temp dir if it doesn't exist
     if not os.path.exists(config.temp_dir_path):
         os.makedirs(config.temp_dir_path)
-    uc.loop().run_until_complete(scrape_main(config, ticker, debug, save_output))
+    import nodriver as uc
+
+    uc.loop().run_until_complete(
+        scrape_main(config, ticker, debug, save_output, file_format, keep_raw_columns)
+    )
 
 
 async def scrape_main(
-    config: HousefireConfig, ticker: str, debug: bool, save_output: bool
+    config: HousefireConfig,
+    ticker: str,
+    debug: bool,
+    save_output: bool,
+    file_format: str = DEFAULT_FILE_FORMAT,
+    keep_raw_columns: bool = False,
 ):
+    from housefire.scraper.scraper import ScrapeResult
+    from housefire.scraper.scraper_factory import ScraperFactory
+
     temp_dir_path = _create_temp_dir(config.temp_dir_path, ticker)
-    logger_factory = HousefireLoggerFactory(config.deploy_env, config.log_dir_path)
+    logger_factory = _create_logger_factory(config)
     scraper_factory = ScraperFactory(logger_factory, config.chrome_path)
     scraper = await scraper_factory.get_scraper(ticker, temp_dir_path)
+    scraper.keep_raw_fields = keep_raw_columns
+    path = os.path.join(temp_dir_path, f"{ticker}_scraped.{file_format}")
     if debug:
         data = await scraper._debug_scrape()
+        if save_output:
+            ScrapeResult.write(data, pathlib.Path(path), file_format)
     else:
-        data = await scraper.scrape()
+        await _scrape(scraper, pathlib.Path(path) if save_output else None, file_format)
     if save_output:
-        path = os.path.join(temp_dir_path, f"{ticker}_scraped.csv")
-        ScrapeResult.to_csv(data, pathlib.Path(path))
         click.echo(f"Scraped data saved to {path}")
     else:
         _delete_temp_dir(temp_dir_path)
@@ -394,36 +563,109 @@ async def scrape_main(
     is_flag=True,
     help="Whether to save the transformation output.",
 )
+@click.option(
+    "--format",
+    "file_format",
+    type=click.Choice(FILE_FORMATS),
+    default=DEFAULT_FILE_FORMAT,
+    show_default=True,
+    help="File format of the saved output.",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Read, transform, and save the input this many rows at a time, so large files run in bounded memory.",
+)
+@click.option(
+    "--keep-raw-columns",
+    default=False,
+    is_flag=True,
+    help="Read every column of the input instead of only the columns the transformer reads.",
+)
+@click.option(
+    "--no-transform-cache",
+    "use_transform_cache",
+    default=True,
+    flag_value=False,
+    help="Transform every row instead of reusing the properties of rows unchanged since the last run.",
+)
 @click.pass_context
-def transform(ctx, ticker: str, csv_input_path: str, debug: bool, save_output: bool):
+def transform(
+    ctx,
+    ticker: str,
+    csv_input_path: str,
+    debug: bool,
+    save_output: bool,
+    file_format: str,
+    chunk_size: Optional[int],
+    keep_raw_columns: bool,
+    use_transform_cache: bool,
+):
     """
     Transforms the TICKER scraped data into a standardized format.
+
+    The input file is read as CSV, Parquet, or JSON lines based on its extension.
     """
+    from housefire.dependency.google_maps import GoogleGeocodeAPI
+    from housefire.dependency.housefire_client.client import HousefireClient
+    from housefire.scraper.scraper import ScrapeResult
+    from housefire.transformer.transformer import TransformResult
+    from housefire.transformer.transformer_factory import TransformerFactory
+
     config: HousefireConfig = ctx.obj["CONFIG"]
     # create temp dir if it doesn't exist
     if not os.path.exists(config.temp_dir_path):
         os.makedirs(config.temp_dir_path)
-    logger_factory = HousefireLoggerFactory(config.deploy_env, config.log_dir_path)
-    housefire_api = HousefireClient(config.housefire_api_key, config.housefire_base_url)
+    logger_factory = _create_logger_factory(config)
+    housefire_api = _create_housefire_client(
+        config, logger_factory.get_logger(HousefireClient.__name__)
+    )
     geocode_api = GoogleGeocodeAPI(
         logger_factory.get_logger(GoogleGeocodeAPI.__name__),
         housefire_api,
         config.google_maps_api_key,
     )
-    transformer_factory = TransformerFactory(logger_factory, geocode_api)
+    transformer_factory = TransformerFactory(
+        logger_factory, geocode_api, config.transform_workers
+    )
     transformer = transformer_factory.get_transformer(ticker)
     csv_path = pathlib.Path(csv_input_path)
+    transformer.release_scrape_results = True
+    transformer.scrape_artifact = csv_path
+    # a debug run sees only a few rows, saving the cache after it would drop the rest
+    if use_transform_cache and not debug:
+        transformer.use_transform_cache(_transform_cache_dir(config))
     click.echo(f"Reading scraped data from {csv_path}")
-    data: list[ScrapeResult] = ScrapeResult.from_csv(csv_path)
+    fields = None if keep_raw_columns else (transformer.input_fields or None)
+    if chunk_size is not None and not debug:
+        output_path = None
+        if save_output:
+            temp_dir_path = _create_temp_dir(config.temp_dir_path, ticker)
+            output_path = pathlib.Path(
+                temp_dir_path, f"{ticker}_transformed.{file_format}"
+            )
+        row_count = _transform_in_chunks(
+            transformer, csv_path, chunk_size, output_path, file_format, fields
+        )
+        click.echo(f"Transformed {row_count} properties")
+        if output_path is not None:
+            click.echo(f"Transformed data saved to {output_path}")
+        _echo_transform_cache_stats(transformer)
+        _echo_cache_stats(housefire_api)
+        return
     if debug:
+        data: list[ScrapeResult] = ScrapeResult.read(csv_path, fields=fields)
         transformed_data = transformer._debug_transform(data)
     else:
-        transformed_data = transformer.transform(data)
+        transformed_data = transformer.transform_file(csv_path, fields)
     if save_output:
         temp_dir_path = _create_temp_dir(config.temp_dir_path, ticker)
-        output_path = os.path.join(temp_dir_path, f"{ticker}_transformed.csv")
-        TransformResult.to_csv(transformed_data, pathlib.Path(output_path))
+        output_path = os.path.join(temp_dir_path, f"{ticker}_transformed.{file_format}")
+        TransformResult.write(transformed_data, pathlib.Path(output_path), file_format)
         click.echo(f"Transformed data saved to {output_path}")
+    _echo_transform_cache_stats(transformer)
+    _echo_cache_stats(housefire_api)
 
 
 @housefire.command()
@@ -440,22 +682,228 @@ def transform(ctx, ticker: str, csv_input_path: str, debug: bool, save_output: b
         allow_dash=True,
     ),
 )
+@click.option(
+    "--format",
+    "file_format",
+    type=click.Choice(FILE_FORMATS),
+    default=None,
+    help="File format of the input file, inferred from its extension by default.",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Read and upload the input this many rows at a time, so large files run in bounded memory.",
+)
 @click.pass_context
-def upload(ctx, ticker: str, csv_input_path: str):
+def upload(
+    ctx,
+    ticker: str,
+    csv_input_path: str,
+    file_format: Optional[str],
+    chunk_size: Optional[int],
+):
     """
-    Uploads the transformed TICKER data from a CSV file to the Housefire API.
+    Uploads the transformed TICKER data from a CSV, Parquet, or JSON lines file to the
+    Housefire API.
     """
     config: HousefireConfig = ctx.obj["CONFIG"]
-    housefire_api = HousefireClient(config.housefire_api_key, config.housefire_base_url)
+    housefire_api = _create_housefire_client(config)
 
     csv_path = pathlib.Path(csv_input_path)
     click.echo(f"Uploading transformed data from {csv_path} to Housefire API.")
 
-    data: list[TransformResult] = TransformResult.from_csv(csv_path)
-    housefire_api.update_properties_by_ticker(
-        ticker.upper(), [d.property for d in data]
+    if check_file_format(file_format or infer_file_format(csv_path)) == "csv":
+        from housefire.dependency.housefire_client.property_csv import (
+            iter_property_payloads,
+        )
+
+        # re-uploads skip Property objects and DataFrames, CSV rows become payloads
+        if chunk_size is None:
+            chunks = list(iter_property_payloads(csv_path))
+            data = lambda: chunks
+        else:
+            data = lambda: iter_property_payloads(csv_path, chunk_size)
+    else:
+        from housefire.transformer.transformer import TransformResult
+
+        if chunk_size is None:
+            data = TransformResult.read_properties(csv_path, file_format)
+        else:
+            data = lambda: TransformResult.iter_properties(
+                csv_path, chunk_size, file_format
+            )
+    try:
+        _upload_properties(housefire_api, ticker, data, config.temp_dir_path)
+        click.echo(f"Data for {ticker} uploaded successfully.")
+    finally:
+        _echo_cache_stats(housefire_api)
+
+
+async def _scrape(
+    scraper: Scraper, output_path: Optional[pathlib.Path], file_format: str
+) -> list[ScrapeResult]:
+    """
+    Scrape, saving the results to output_path if given, CSV output is streamed to a hidden
+    partial file as results arrive and renamed into place once the scrape completes, with
+    each result still passed on to any result sink the scraper already has
+    """
+    from housefire.scraper.scraper import ScrapeResult, ScrapeResultWriter
+
+    if output_path is None or file_format != "csv":
+        data = await scraper.scrape()
+        if output_path is not None:
+            ScrapeResult.write(data, output_path, file_format)
+        return data
+    # hidden, so scrapers that look for downloads in the temp dir do not pick it up
+    partial_path = output_path.with_name(f".{output_path.name}.partial")
+    previous_sink = scraper.result_sink
+    with ScrapeResultWriter(partial_path, scraper.result_fields) as writer:
+
+        def sink(result: ScrapeResult) -> None:
+            writer.write(result)
+            if previous_sink is not None:
+                previous_sink(result)
+
+        scraper.result_sink = sink
+        try:
+            data = await scraper.scrape()
+        finally:
+            scraper.result_sink = previous_sink
+    os.replace(partial_path, output_path)
+    return data
+
+
+def _transform_in_chunks(
+    transformer: Transformer,
+    input_path: pathlib.Path,
+    chunk_size: int,
+    output_path: Optional[pathlib.Path],
+    file_format: str,
+    fields: Optional[tuple[str, ...]] = None,
+) -> int:
+    """
+    Transform the input file chunk_size rows at a time, appending each transformed chunk
+    to output_path if given
+
+    param: fields: the input columns to read, every column if None
+
+    returns: the number of transformed properties
+    """
+    from housefire.dependency.housefire_client.property_batch import (
+        PropertyBatch,
+        PropertyBatchWriter,
+    )
+    from housefire.scraper.scraper import ScrapeResult
+
+    row_count = 0
+    chunks = transformer.transform_chunks(
+        ScrapeResult.iter_chunks(input_path, chunk_size, fields=fields)
+    )
+    if output_path is None:
+        for chunk in chunks:
+            row_count += len(chunk)
+        return row_count
+    with PropertyBatchWriter(output_path, file_format) as writer:
+        for chunk in chunks:
+            writer.write(PropertyBatch.from_properties(d.property for d in chunk))
+            row_count += len(chunk)
+    return row_count
+
+
+def _upload_properties(
+    housefire_api: HousefireClient,
+    ticker: str,
+    data: (
+        list[Property]
+        | PropertyBatch
+        | Callable[[], Iterable[PropertyBatch | list[dict]]]
+    ),
+    dead_letter_dir_path: str,
+) -> None:
+    """
+    Update the ticker's properties, exiting with an error after the valid rows are uploaded
+    if the API rejected any rows
+
+    param: data: the properties, or a function reading them in PropertyBatch or payload
+    chunks
+    param: dead_letter_dir_path: the directory to write the rejected rows CSV to
+    """
+    from housefire.dependency.housefire_client.client import PartialUploadError
+
+    dead_letter_path = _dead_letter_path(dead_letter_dir_path, ticker)
+    try:
+        if callable(data):
+            housefire_api.update_properties_by_ticker_in_chunks(
+                ticker.upper(), data, dead_letter_path=dead_letter_path
+            )
+        else:
+            housefire_api.update_properties_by_ticker(
+                ticker.upper(), data, dead_letter_path=dead_letter_path
+            )
+    except PartialUploadError as e:
+        _echo_partial_upload(e, ticker)
+        raise SystemExit(1)
+
+
+def _dead_letter_path(dead_letter_dir_path: str, ticker: str) -> pathlib.Path:
+    return pathlib.Path(
+        dead_letter_dir_path,
+        f"{ticker}_rejected_{datetime.datetime.now().isoformat()}.csv",
+    )
+
+
+def _echo_partial_upload(e: PartialUploadError, ticker: str) -> None:
+    click.echo(
+        f"Uploaded {len(e.created)} properties for {ticker}, but {len(e.rejected)} "
+        f"were rejected by the API. Rejected rows saved to {e.dead_letter_path}"
     )
-    click.echo(f"Data for {ticker} uploaded successfully.")
+
+
+def _create_logger_factory(config: HousefireConfig) -> HousefireLoggerFactory:
+    return HousefireLoggerFactory(
+        config.deploy_env,
+        config.log_dir_path,
+        json_lines=config.log_json_lines,
+        compress_rotated=config.log_compress_rotated,
+    )
+
+
+def _create_housefire_client(
+    config: HousefireConfig, logger: Optional[Logger] = None
+) -> HousefireClient:
+    """
+    Create a Housefire API client that journals uploads and caches reads in the temp directory
+    """
+    from housefire.dependency.housefire_client.client import HousefireClient
+
+    return HousefireClient(
+        config.housefire_api_key,
+        config.housefire_base_url,
+        logger,
+        max_chunks_in_flight=config.upload_workers,
+        journal_dir=pathlib.Path(config.temp_dir_path, "upload_journal"),
+        cache_dir=pathlib.Path(config.temp_dir_path, "http_cache"),
+        compress_min_bytes=(
+            HousefireClient.DEFAULT_COMPRESS_MIN_BYTES
+            if config.compress_uploads
+            else None
+        ),
+    )
+
+
+def _echo_cache_stats(housefire_api: HousefireClient) -> None:
+    if housefire_api.http_cache is not None:
+        click.echo(housefire_api.http_cache.summary())
+
+
+def _transform_cache_dir(config: HousefireConfig) -> pathlib.Path:
+    return pathlib.Path(config.temp_dir_path, "transform_cache")
+
+
+def _echo_transform_cache_stats(transformer: Transformer) -> None:
+    if transformer.transform_cache is not None:
+        click.echo(transformer.transform_cache.summary())
 
 
 def _create_temp_dir(base_dir_path: str, ticker: str) -> str:
@@ -12,6 +12,16 @@ class HousefireConfig:
     housefire_base_url: str
     deploy_env: str
     log_dir_path: str
+    # optional, worker processes for transformers that can run in parallel, and chunks
+    # run-data-pipeline transforms at once
+    transform_workers: int = 1
+    # optional, property upload chunks sent concurrently
+    upload_workers: int = 2
+    # optional, gzip large upload bodies, for servers that inflate request bodies
+    compress_uploads: bool = False
+    # optional, write log records as JSON lines and gzip rotated log files
+    log_json_lines: bool = False
+    log_compress_rotated: bool = False
     # set this at build time with nix
     chrome_path: str = "@NIX_TARGET_CHROME_PATH@"
 
@@ -24,6 +34,25 @@ class HousefireConfig:
         self.housefire_base_url = config_object["HOUSEFIRE"].get("HOUSEFIRE_BASE_URL")
         self.deploy_env = config_object["HOUSEFIRE"].get("DEPLOY_ENV")
         self.log_dir_path = config_object["HOUSEFIRE"].get("LOG_DIR_PATH")
+        self.transform_workers = config_object["HOUSEFIRE"].getint(
+            "TRANSFORM_WORKERS", fallback=1
+        )
+        self.upload_workers = config_object["HOUSEFIRE"].getint(
+            "UPLOAD_WORKERS", fallback=2
+        )
+        self.compress_uploads = config_object["HOUSEFIRE"].getboolean(
+            "COMPRESS_UPLOADS", fallback=False
+        )
+        self.log_json_lines = config_object["HOUSEFIRE"].getboolean(
+            "LOG_JSON_LINES", fallback=False
+        )
+        self.log_compress_rotated = config_object["HOUSEFIRE"].getboolean(
+            "LOG_COMPRESS_ROTATED", fallback=False
+        )
+        if self.transform_workers < 1:
+            raise ValueError("TRANSFORM_WORKERS must be at least 1")
+        if self.upload_workers < 1:
+            raise ValueError("UPLOAD_WORKERS must be at least 1")
 
     def is_initialized(self, config_object: configparser.ConfigParser):
         return (
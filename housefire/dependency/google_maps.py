@@ -1,9 +1,11 @@
 from logging import Logger
 import googlemaps
+import threading
 import time
 
 from housefire.dependency.housefire_client.client import HousefireClient
 from housefire.dependency.housefire_client.housefire_object import Geocode
+from housefire.logger import summarize
 
 
 class GoogleGeocodeAPI:
@@ -18,10 +20,14 @@ class GoogleGeocodeAPI:
         self.housefire_api_client = housefire_api_client
         self.wait_time = 72  # wait 72 seconds between geocoding requests to limit to 1200 requests per day
         self.logger = logger
+        # held for each google request and the wait after it, so threads geocoding at once
+        # still send google requests wait_time apart
+        self._google_lock = threading.Lock()
 
     def geocode_addresses(self, address_inputs: list[str]) -> dict[str, Geocode]:
         """
-        geocodes a list of addresses and returns a dictionary of address inputs to housefire geocode results
+        geocodes a list of addresses and returns a dictionary of address inputs to housefire geocode results,
+        safe to call from several threads at once
         """
         results: dict[str, Geocode] = dict()
         for address_input in address_inputs:
@@ -29,31 +35,41 @@ class GoogleGeocodeAPI:
                 address_input
             )
             if housefire_geocode is not None:
-                self.logger.debug(f"address input {address_input} already in housefire")
+                self.logger.debug(
+                    "address input %s already in housefire", address_input
+                )
                 results[address_input] = housefire_geocode
                 time.sleep(5)  # hacky rate limit
                 continue
-            self.logger.debug(f"geocoding address input with google: {address_input}")
-            google_geocode_response = self.client.geocode(address_input)
-            self.logger.debug(
-                f"geocoded address input {address_input} with response: {google_geocode_response}"
-            )
-            if len(google_geocode_response) == 0:
-                self.logger.error(f"no results found for address input {address_input}")
-                continue
+            with self._google_lock:
+                self.logger.debug(
+                    "geocoding address input with google: %s", address_input
+                )
+                google_geocode_response = self.client.geocode(address_input)
+                self.logger.debug(
+                    "geocoded address input %s with response: %s",
+                    address_input,
+                    summarize(google_geocode_response, sample=1),
+                )
+                if len(google_geocode_response) == 0:
+                    self.logger.error(
+                        "no results found for address input %s", address_input
+                    )
+                    continue
 
-            housefire_geocode = self._google_geocode_to_housefire_geocode(
-                google_geocode_response[0],
-                address_input,
-            )
-            self.logger.debug(
-                f"converted google geocode to housefire geocode: {housefire_geocode}"
-            )
-            housefire_geocode_response = self.housefire_api_client.post_geocode(
-                housefire_geocode
-            )
-            results[address_input] = housefire_geocode_response
-            time.sleep(self.wait_time)  # hacky rate limit for google
+                housefire_geocode = self._google_geocode_to_housefire_geocode(
+                    google_geocode_response[0],
+                    address_input,
+                )
+                self.logger.debug(
+                    "converted google geocode to housefire geocode: %s",
+                    housefire_geocode,
+                )
+                housefire_geocode_response = self.housefire_api_client.post_geocode(
+                    housefire_geocode
+                )
+                results[address_input] = housefire_geocode_response
+                time.sleep(self.wait_time)  # hacky rate limit for google
         return results
 
     def _google_geocode_to_housefire_geocode(
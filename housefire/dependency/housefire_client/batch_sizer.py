@@ -0,0 +1,58 @@
+import threading
+
+
+class BatchSizer:
+    """
+    Picks the number of rows to send in each upload chunk, either a fixed size or one tuned
+    from the payload size and server latency of the chunks that have already completed
+
+    Args:
+        initial_size (int): rows in the first chunk, or in every chunk when fixed
+        fixed (bool): whether to keep initial_size instead of tuning it
+        min_size (int): smallest chunk the tuner will pick
+        max_size (int): largest chunk the tuner will pick
+        target_bytes (int): desired request body size for one chunk
+        target_seconds (float): desired server round trip for one chunk
+    """
+
+    def __init__(
+        self,
+        initial_size: int = 250,
+        fixed: bool = False,
+        min_size: int = 1,
+        max_size: int = 5000,
+        target_bytes: int = 2_000_000,
+        target_seconds: float = 5.0,
+    ):
+        if initial_size < 1:
+            raise ValueError("chunk size must be at least 1")
+        self.fixed = fixed
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_bytes = target_bytes
+        self.target_seconds = target_seconds
+        self._size = initial_size if fixed else self._clamp(initial_size)
+        self._lock = threading.Lock()
+
+    def next_size(self) -> int:
+        with self._lock:
+            return self._size
+
+    def record(self, rows: int, payload_bytes: int, seconds: float) -> None:
+        """
+        records a completed chunk, resizing the next chunks so they approach both the byte
+        and latency targets, growing by at most 2x per chunk so one fast response cannot
+        overshoot
+        """
+        if self.fixed or rows <= 0:
+            return
+        with self._lock:
+            candidates = [self._size * 2]
+            if payload_bytes > 0:
+                candidates.append(self.target_bytes * rows / payload_bytes)
+            if seconds > 0:
+                candidates.append(self.target_seconds * rows / seconds)
+            self._size = self._clamp(int(min(candidates)))
+
+    def _clamp(self, size: int) -> int:
+        return max(self.min_size, min(self.max_size, size))
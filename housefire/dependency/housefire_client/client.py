@@ -1,10 +1,89 @@
+import csv
+import gzip
+import json
+import logging
 import requests as r
+import requests.exceptions as r_exceptions
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from logging import Logger
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
 from housefire.dependency.housefire_client.housefire_object import (
     Geocode,
     Property,
     Reit,
 )
+from housefire.dependency.housefire_client.batch_sizer import BatchSizer
+from housefire.dependency.housefire_client.http_cache import HttpCache, HttpCacheEntry
+from housefire.dependency.housefire_client import json_codec
+from housefire.dependency.housefire_client.json_stream import iter_json_array
+from housefire.dependency.housefire_client.property_batch import PropertyBatch
+from housefire.dependency.housefire_client.rate_limiter import RateLimiter
+from housefire.dependency.housefire_client.upload_journal import UploadJournal
+
+
+@dataclass
+class DeleteResult:
+    """Counts reported by a bulk delete"""
+
+    deleted: int = 0
+    failed: int = 0
+    retried: int = 0
+    failed_ids: list[str] = field(default_factory=list)
+
+
+@dataclass
+class RejectedProperty:
+    """A property payload the server rejected, with its position in the upload"""
+
+    index: int
+    payload: dict
+    status_code: int
+    error: str
+
+    @staticmethod
+    def keys() -> list[str]:
+        return ["index", *Property.keys(), "statusCode", "error"]
+
+    @staticmethod
+    def to_csv(data: list["RejectedProperty"], path: Path) -> None:
+        with open(path, "w") as f:
+            writer = csv.DictWriter(
+                f, fieldnames=RejectedProperty.keys(), dialect=csv.unix_dialect
+            )
+            writer.writeheader()
+            for d in data:
+                row = {
+                    key: json.dumps(value) if isinstance(value, (list, dict)) else value
+                    for key, value in d.payload.items()
+                }
+                row.update(index=d.index, statusCode=d.status_code, error=d.error)
+                writer.writerow(row)
+
+
+class PartialUploadError(ValueError):
+    """
+    Raised after an upload where some rows were rejected, once every valid row is created
+    """
+
+    def __init__(
+        self,
+        created: list[Property] | PropertyBatch,
+        rejected: list[RejectedProperty],
+        dead_letter_path: Optional[Path] = None,
+    ):
+        message = (
+            f"validation error while creating properties: {len(rejected)} rejected, "
+            f"{len(created)} created"
+        )
+        if dead_letter_path is not None:
+            message += f", rejected rows written to {dead_letter_path}"
+        super().__init__(message)
+        self.created = created
+        self.rejected = rejected
+        self.dead_letter_path = dead_letter_path
 
 
 class HousefireClient:
@@ -13,18 +92,75 @@ class HousefireClient:
 
     Args:
         api_key (str): Housefire API key
+        housefire_base_url (str): base URL of the Housefire API
+        logger (Logger): logger for progress reporting, defaults to a child of the housefire logger
+        max_concurrent_requests (int): number of single-item requests allowed in flight at once
+        requests_per_second (float): rate limit applied to single-item requests
+        delete_chunk_size (int): number of IDs sent per bulk delete request
+        max_retries (int): retries for a single-item request that hits a transient error
+        upload_chunk_size (int): fixed number of properties per upload chunk, tuned automatically when None
+        max_chunks_in_flight (int): number of property upload chunks sent concurrently
+        journal_dir (Path): directory for upload journals that let interrupted updates resume, no journaling when None
+        properties_page_size (int): properties requested per page when streaming a ticker, unpaginated when None
+        cache_dir (Path): directory for the conditional GET response cache, no caching when None
+        compress_min_bytes (int): gzip POST bodies at least this large, never compress when None, the default, since only servers that inflate request bodies accept them
     """
 
+    # status codes worth retrying, everything else >= 400 is a permanent failure
+    RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+    # a POST is only retried when the server says it did not process the request
+    SAFE_TO_RETRY_POST_STATUS_CODES = frozenset({429, 503})
+    # bytes read from a streamed response body at a time
+    STREAM_CHUNK_BYTES = 64 * 1024
+    # response encodings requests can decode in this environment, zstd and br included
+    # when urllib3 has their optional decoders installed
+    ACCEPT_ENCODING = r.utils.DEFAULT_ACCEPT_ENCODING
+    # repeated fact labels compress well at a low level, higher levels mostly cost CPU
+    GZIP_COMPRESS_LEVEL = 5
+    # compress_min_bytes used when request compression is turned on in the config
+    DEFAULT_COMPRESS_MIN_BYTES = 16 * 1024
+
     def __init__(
         self,
         housefire_api_key: str,
         housefire_base_url: str = "https://housefire.liammurphydev.com/api/",
+        logger: Optional[Logger] = None,
+        max_concurrent_requests: int = 4,
+        requests_per_second: float = 5.0,
+        delete_chunk_size: int = 100,
+        max_retries: int = 3,
+        upload_chunk_size: Optional[int] = None,
+        max_chunks_in_flight: int = 2,
+        journal_dir: Optional[Path] = None,
+        properties_page_size: Optional[int] = None,
+        cache_dir: Optional[Path] = None,
+        compress_min_bytes: Optional[int] = None,
     ):
         self.base_url = housefire_base_url
         self.headers = {
             "x-api-key": housefire_api_key,
             "Content-Type": "application/json",
+            "Accept-Encoding": self.ACCEPT_ENCODING,
         }
+        self.logger = logger or logging.getLogger("housefire").getChild(
+            HousefireClient.__name__
+        )
+        self.max_concurrent_requests = max_concurrent_requests
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self.delete_chunk_size = delete_chunk_size
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = 1.0
+        self.upload_chunk_size = upload_chunk_size
+        self.initial_upload_chunk_size = 250
+        self.max_chunks_in_flight = max_chunks_in_flight
+        self.journal_dir = journal_dir
+        self.properties_page_size = properties_page_size
+        self.http_cache = HttpCache(cache_dir) if cache_dir is not None else None
+        self.compress_min_bytes = compress_min_bytes
+        # flipped off the first time the server rejects a compressed request body
+        self._request_compression_supported = True
+        # flipped off the first time the server rejects the bulk delete route
+        self._bulk_delete_supported = True
 
     def _construct_url(self, endpoint: str):
         full_url = self.base_url + endpoint
@@ -32,44 +168,147 @@ class HousefireClient:
             full_url = self.base_url + endpoint[1:]
         return full_url
 
-    def _get(self, endpoint: str, params=None) -> r.Response:
-        response = r.get(
-            self._construct_url(endpoint), headers=self.headers, params=params
+    def _get(self, endpoint: str, params=None, stream: bool = False) -> r.Response:
+        """
+        sends a GET, as a conditional request when the client has an HTTP cache, in which
+        case a 304 is answered from the cached body and cacheable 200s are stored on disk
+        """
+        url = self._construct_url(endpoint)
+        if self.http_cache is None:
+            return r.get(url, headers=self.headers, params=params, stream=stream)
+
+        cache_entry = self.http_cache.lookup(url, params)
+        headers = (
+            {**self.headers, **cache_entry.conditional_headers()}
+            if cache_entry is not None
+            else self.headers
+        )
+        response = r.get(url, headers=headers, params=params, stream=stream)
+        if response.status_code == 304 and cache_entry is not None:
+            self.http_cache.record_hit()
+            response.close()
+            return self._cached_response(cache_entry, stream)
+        self.http_cache.record_miss()
+        if response.status_code != 200:
+            return response
+        stored_entry = self.http_cache.store(
+            url,
+            params,
+            response.headers,
+            response.iter_content(chunk_size=self.STREAM_CHUNK_BYTES),
         )
+        if stored_entry is None:
+            return response
+        response.close()
+        return self._cached_response(stored_entry, stream)
+
+    @staticmethod
+    def _cached_response(cache_entry: HttpCacheEntry, stream: bool) -> r.Response:
+        response = cache_entry.to_response()
+        if not stream:
+            # read the body now, like requests does for a non-streamed response
+            response.content
+            response.close()
         return response
 
-    def _post(self, endpoint: str, data=None) -> r.Response:
-        response = r.post(
-            self._construct_url(endpoint), headers=self.headers, json=data
+    def _post(
+        self, endpoint: str, data=None, body: Optional[bytes] = None
+    ) -> r.Response:
+        """
+        posts data as JSON, or a pre-encoded JSON body when given so callers can measure it
+
+        pre-encoded bodies of at least compress_min_bytes are sent gzipped, falling back to
+        an uncompressed body for this and later requests if the server answers 415, or
+        answers 400 and accepts the same body uncompressed, as a server that does not
+        inflate request bodies fails to parse them
+        """
+        if body is None:
+            return r.post(
+                self._construct_url(endpoint), headers=self.headers, json=data
+            )
+        if self._should_compress(body):
+            response = r.post(
+                self._construct_url(endpoint),
+                headers={**self.headers, "Content-Encoding": "gzip"},
+                data=gzip.compress(body, compresslevel=self.GZIP_COMPRESS_LEVEL),
+            )
+            if response.status_code not in (400, 415):
+                return response
+            uncompressed = r.post(
+                self._construct_url(endpoint), headers=self.headers, data=body
+            )
+            # a 400 to both bodies is a rejection of the rows, not of the encoding
+            if response.status_code == 415 or uncompressed.status_code != 400:
+                self.logger.warning(
+                    "server rejected a gzip request body, sending uncompressed bodies"
+                )
+                self._request_compression_supported = False
+            return uncompressed
+        return r.post(self._construct_url(endpoint), headers=self.headers, data=body)
+
+    def _should_compress(self, body: bytes) -> bool:
+        return (
+            self._request_compression_supported
+            and self.compress_min_bytes is not None
+            and len(body) >= self.compress_min_bytes
         )
-        return response
 
-    def _delete(self, endpoint: str) -> r.Response:
-        response = r.delete(self._construct_url(endpoint), headers=self.headers)
-        return response
+    def _delete(self, endpoint: str, data=None) -> r.Response:
+        if data is None:
+            return r.delete(self._construct_url(endpoint), headers=self.headers)
+        return r.delete(self._construct_url(endpoint), headers=self.headers, json=data)
 
     def get_properties_by_ticker(self, ticker: str) -> list[Property]:
         """
         gets all properties for a given ticker, returning an empty list if no properties are found,
         and raising an exception if an unexpected error occurs
         """
-        r = self._get(f"/properties/byTicker/{ticker}")
-        if r.status_code == 404:
-            return list()
-        elif self._is_error_response(r):
-            raise Exception(
-                f"unexpected error getting properties for ticker {ticker}: {r}"
+        return list(self.iter_properties_by_ticker(ticker))
+
+    def iter_properties_by_ticker(self, ticker: str) -> Iterator[Property]:
+        """
+        streams all properties for a given ticker, decoding the response body incrementally
+        and yielding one property at a time, yielding nothing if no properties are found,
+        and raising an exception if an unexpected error occurs
+
+        if the client has a properties_page_size, pages are requested with limit and cursor
+        query parameters, following the X-Next-Cursor response header until the server
+        stops sending it, servers that do not paginate ignore the parameters and return
+        everything in one response
+        """
+        cursor = None
+        while True:
+            params = {
+                k: v
+                for k, v in (("limit", self.properties_page_size), ("cursor", cursor))
+                if v is not None
+            }
+            r = self._get(
+                f"/properties/byTicker/{ticker}", params=params or None, stream=True
             )
-        return list(
-            map(lambda prop_dict: Property.from_dict(prop_dict), list(r.json()))
-        )
+            try:
+                if r.status_code == 404:
+                    return
+                elif self._is_error_response(r):
+                    raise Exception(
+                        f"unexpected error getting properties for ticker {ticker}: {r}"
+                    )
+                for prop_dict in iter_json_array(
+                    r.iter_content(chunk_size=self.STREAM_CHUNK_BYTES)
+                ):
+                    yield Property.from_dict(prop_dict)
+                cursor = r.headers.get("X-Next-Cursor")
+            finally:
+                r.close()
+            if not cursor:
+                return
 
     def get_reits(self) -> list[Reit]:
         """gets all REITs, raising an exception if an unexpected error occurs"""
         r = self._get("/reits")
         if self._is_error_response(r):
             raise Exception(f"unexpected error getting reits: {r}")
-        return list(map(lambda reit_dict: Reit.from_dict(reit_dict), list(r.json())))
+        return [Reit.from_dict(reit_dict) for reit_dict in self._json(r)]
 
     def post_reit(self, reit: Reit) -> Reit:
         """
@@ -81,7 +320,7 @@ class HousefireClient:
             raise ValueError(f"validation error while creating reit: {r}")
         elif self._is_error_response(r):
             raise Exception(f"unexpected error creating reit: {r}")
-        return Reit.from_dict(r.json())
+        return Reit.from_dict(self._json(r))
 
     def delete_properties_by_ticker(self, ticker: str) -> int:
         """
@@ -93,7 +332,7 @@ class HousefireClient:
             raise Exception(
                 f"unexpected error deleting properties for ticker {ticker}: {r}"
             )
-        return r.json()["count"]
+        return self._json(r)["count"]
 
     def delete_property_by_id(self, property_id: str):
         """
@@ -103,52 +342,501 @@ class HousefireClient:
         if self._is_error_response(r):
             raise Exception(f"unexpected error deleting property {property_id}: {r}")
 
-    def post_properties(self, data: list[Property]) -> list[Property]:
+    def delete_properties_by_ids(
+        self,
+        property_ids: Iterable[str],
+        on_deleted: Optional[Callable[[list[str]], None]] = None,
+    ) -> DeleteResult:
+        """
+        deletes many properties by ID, returning the deleted, failed, and retried counts,
+        calling on_deleted with the IDs of each batch as soon as it is deleted
+
+        IDs are sent in chunks to the bulk delete route (DELETE /properties with an
+        {"ids": [...]} body), falling back to concurrent,
+        rate limited single deletes if the server does not support bulk deletes or
+        a bulk chunk fails
+        """
+        ids = list(property_ids)
+        result = DeleteResult()
+        fallback_ids: list[str] = list()
+        for start in range(0, len(ids), self.delete_chunk_size):
+            chunk = ids[start : start + self.delete_chunk_size]
+            if not self._bulk_delete_supported:
+                fallback_ids.extend(chunk)
+                continue
+            r = self._delete("/properties", {"ids": chunk})
+            if r.status_code in (404, 405):
+                self.logger.info(
+                    "bulk property delete is not supported, falling back to single deletes"
+                )
+                self._bulk_delete_supported = False
+                fallback_ids.extend(chunk)
+            elif self._is_error_response(r):
+                self.logger.warning(
+                    f"bulk delete of {len(chunk)} properties failed with status {r.status_code}, "
+                    "retrying them one at a time"
+                )
+                fallback_ids.extend(chunk)
+            else:
+                result.deleted += len(chunk)
+                if on_deleted is not None:
+                    on_deleted(chunk)
+
+        if len(fallback_ids) > 0:
+            with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as pool:
+                outcomes = pool.map(self._delete_property_with_retry, fallback_ids)
+                for property_id, (deleted, retries) in zip(fallback_ids, outcomes):
+                    result.retried += retries
+                    if deleted:
+                        result.deleted += 1
+                        if on_deleted is not None:
+                            on_deleted([property_id])
+                    else:
+                        result.failed += 1
+                        result.failed_ids.append(property_id)
+        return result
+
+    def _delete_property_with_retry(self, property_id: str) -> tuple[bool, int]:
+        """
+        deletes a single property under the rate limiter, returning whether it was deleted
+        and how many retries it took, a 404 counts as deleted since the property is gone either way
+        """
+        r, retries = self._send_with_retry(
+            lambda: self._delete(f"/properties/{property_id}")
+        )
+        if r is not None and (r.status_code == 404 or not self._is_error_response(r)):
+            return True, retries
+        self.logger.error(
+            f"failed to delete property {property_id}: {r if r is not None else 'no response'}"
+        )
+        return False, retries
+
+    def _send_with_retry(
+        self,
+        send: Callable[[], r.Response],
+        retry_status_codes: frozenset[int] = RETRYABLE_STATUS_CODES,
+        retry_request_errors: bool = True,
+    ) -> tuple[Optional[r.Response], int]:
+        """
+        sends a request under the rate limiter, retrying connection errors and retryable
+        status codes with exponential backoff, returning the last response (None if the
+        request never got one) and the number of retries used
         """
-        creates many properties, returning a list of the created properties,
+        retries = 0
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                response = send()
+            except r_exceptions.RequestException as e:
+                if not retry_request_errors:
+                    raise
+                self.logger.warning("request failed: %s", e)
+                response = None
+            if (
+                response is not None and response.status_code not in retry_status_codes
+            ) or retries >= self.max_retries:
+                return response, retries
+            time.sleep(self.retry_backoff_seconds * 2**retries)
+            retries += 1
+
+    def post_properties(
+        self,
+        data: list[Property] | PropertyBatch,
+        chunk_size: Optional[int] = None,
+        dead_letter_path: Optional[Path] = None,
+        on_created: Optional[Callable[[list[dict]], None]] = None,
+    ) -> list[Property] | PropertyBatch:
+        """
+        creates many properties, returning a list of the created properties in input order,
         raising an exception in the case of a validation error, or any other unexpected error
+
+        properties are uploaded in chunks with several chunks in flight at once, chunk_size
+        (or the client's upload_chunk_size) fixes the rows per chunk, otherwise the chunk
+        size is tuned from the payload size and latency of completed chunks
+
+        a chunk rejected with a validation error is split in half until the invalid rows
+        are isolated, so every valid row is still created, the rejected rows are written to
+        dead_letter_path (if given) with the server's error body, and a PartialUploadError
+        is raised afterwards
+
+        on_created is called with the payloads of each chunk as soon as it is created
+
+        a PropertyBatch is uploaded from its columns and the created properties are
+        returned as a PropertyBatch
         """
         if data is None or len(data) == 0:
             raise Exception("data must be a non-empty list of Property objects")
-        r = self._post(f"/properties", list(map(lambda prop: prop.to_dict(), data)))
+        created, rejected = self._post_property_payloads(
+            self._property_payloads(data), chunk_size, on_created
+        )
+        created_properties = (
+            PropertyBatch.from_records(created)
+            if isinstance(data, PropertyBatch)
+            else [Property.from_dict(prop_dict) for prop_dict in created]
+        )
+        if len(rejected) > 0:
+            if dead_letter_path is not None:
+                RejectedProperty.to_csv(rejected, dead_letter_path)
+            raise PartialUploadError(created_properties, rejected, dead_letter_path)
+        return created_properties
+
+    @staticmethod
+    def _property_payloads(
+        data: list[Property] | list[dict] | PropertyBatch,
+    ) -> list[dict]:
+        """
+        the upload payloads of properties, a batch, or payloads built elsewhere
+        """
+        if isinstance(data, PropertyBatch):
+            return data.to_payloads()
+        return [prop if isinstance(prop, dict) else prop.to_dict() for prop in data]
+
+    def _post_property_payloads(
+        self,
+        payloads: list[dict],
+        chunk_size: Optional[int] = None,
+        on_created: Optional[Callable[[list[dict]], None]] = None,
+    ) -> tuple[list[dict], list["RejectedProperty"]]:
+        """
+        uploads property payloads in chunks, keeping up to max_chunks_in_flight requests
+        running, and returns the created property dicts merged back in input order along
+        with the rows the server rejected
+        """
+        chunk_size = chunk_size or self.upload_chunk_size
+        sizer = (
+            BatchSizer(chunk_size, fixed=True)
+            if chunk_size is not None
+            else BatchSizer(self.initial_upload_chunk_size)
+        )
+        results_by_chunk: dict[int, tuple[list[dict], list[RejectedProperty]]] = dict()
+        with ThreadPoolExecutor(max_workers=self.max_chunks_in_flight) as pool:
+            in_flight: dict[Future, int] = dict()
+            start, chunk_count = 0, 0
+            while start < len(payloads) or len(in_flight) > 0:
+                while (
+                    start < len(payloads) and len(in_flight) < self.max_chunks_in_flight
+                ):
+                    chunk = payloads[start : start + sizer.next_size()]
+                    future = pool.submit(
+                        self._post_property_chunk, chunk, start, sizer, on_created
+                    )
+                    in_flight[future] = chunk_count
+                    start += len(chunk)
+                    chunk_count += 1
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results_by_chunk[in_flight.pop(future)] = future.result()
+        created: list[dict] = list()
+        rejected: list[RejectedProperty] = list()
+        for index in range(chunk_count):
+            chunk_created, chunk_rejected = results_by_chunk[index]
+            created.extend(chunk_created)
+            rejected.extend(chunk_rejected)
+        self.logger.debug(
+            "uploaded %d properties in %d chunks, rejected %d",
+            len(created),
+            chunk_count,
+            len(rejected),
+        )
+        return created, rejected
+
+    def _post_property_chunk(
+        self,
+        chunk: list[dict],
+        offset: int,
+        sizer: BatchSizer,
+        on_created: Optional[Callable[[list[dict]], None]] = None,
+    ) -> tuple[list[dict], list["RejectedProperty"]]:
+        """
+        uploads one chunk of property payloads, starting at offset in the full upload, and
+        reports its size and latency to the sizer, only retrying responses that guarantee
+        the server did not create anything
+
+        a validation error splits the chunk in half and uploads each half, bisecting down to
+        the invalid rows, which costs O(log n) extra requests per invalid row
+        """
+        body = json_codec.dumps(chunk)
+        started = time.monotonic()
+        r, _ = self._send_with_retry(
+            lambda: self._post("/properties", body=body),
+            retry_status_codes=self.SAFE_TO_RETRY_POST_STATUS_CODES,
+            retry_request_errors=False,
+        )
         if r.status_code == 400:
-            raise ValueError(f"validation error while creating properties: {r}")
+            if len(chunk) == 1:
+                self.logger.warning(
+                    f"property {chunk[0].get('addressInput')} rejected: {r.text}"
+                )
+                return list(), [RejectedProperty(offset, chunk[0], 400, r.text)]
+            middle = len(chunk) // 2
+            left_created, left_rejected = self._post_property_chunk(
+                chunk[:middle], offset, sizer, on_created
+            )
+            right_created, right_rejected = self._post_property_chunk(
+                chunk[middle:], offset + middle, sizer, on_created
+            )
+            return left_created + right_created, left_rejected + right_rejected
         elif self._is_error_response(r):
             raise Exception(f"unexpected error creating properties: {r}")
-        return list(
-            map(lambda prop_dict: Property.from_dict(prop_dict), list(r.json()))
-        )
+        sizer.record(len(chunk), len(body), time.monotonic() - started)
+        if on_created is not None:
+            on_created(chunk)
+        return self._json(r), list()
 
     def update_properties_by_ticker(
-        self, ticker: str, data: list[Property]
-    ) -> list[Property]:
+        self,
+        ticker: str,
+        data: list[Property] | PropertyBatch,
+        dead_letter_path: Optional[Path] = None,
+    ) -> list[Property] | PropertyBatch:
         """
         updates many properties for a given ticker, returning a list of the updated properties,
         raising an exception in the case of a validation error, or any other unexpected error
+
+        rows rejected by the server are handled as in post_properties
+
+        if the client has a journal_dir, the planned diff and every committed delete and
+        upload chunk are journaled, and a rerun with the same data resumes from the journal
+        without fetching the existing properties again
+
+        a PropertyBatch is diffed and uploaded column-wise, returning a PropertyBatch
         """
         if data is None or len(data) == 0:
             raise Exception("data must be a non-empty list of property objects")
-        existing_properties = self.get_properties_by_ticker(ticker)
-        existing_property_dict_by_addressInput = {
-            p.address_input: p for p in existing_properties
-        }
-        new_property_address_input_set = {p.address_input for p in data}
+        journal = (
+            UploadJournal.open(self.journal_dir, ticker, self._property_payloads(data))
+            if self.journal_dir is not None
+            else None
+        )
+        if journal is not None and journal.has_plan:
+            to_delete = journal.remaining_deletes()
+            remaining_creates = journal.remaining_creates()
+            to_create = (
+                data.select(remaining_creates)
+                if isinstance(data, PropertyBatch)
+                else [p for p in data if p.address_input in remaining_creates]
+            )
+            self.logger.info(
+                f"resuming update for ticker {ticker} from {journal.path}, "
+                f"{len(to_delete)} deletes and {len(to_create)} creates remaining"
+            )
+        else:
+            to_create, to_delete = self._diff_properties(ticker, data)
+            if journal is not None:
+                journal.record_plan(
+                    to_delete,
+                    (
+                        to_create.address_inputs()
+                        if isinstance(to_create, PropertyBatch)
+                        else [p.address_input for p in to_create]
+                    ),
+                )
+
+        self._delete_stale_properties(
+            ticker,
+            to_delete,
+            on_deleted=journal.record_deleted if journal is not None else None,
+        )
+        created = (
+            self.post_properties(
+                to_create,
+                dead_letter_path=dead_letter_path,
+                on_created=(
+                    (
+                        lambda chunk: journal.record_created(
+                            p["addressInput"] for p in chunk
+                        )
+                    )
+                    if journal is not None
+                    else None
+                ),
+            )
+            if len(to_create) > 0
+            else (
+                PropertyBatch.from_records([])
+                if isinstance(data, PropertyBatch)
+                else list()
+            )
+        )
+        if journal is not None:
+            journal.complete()
+        return created
+
+    def update_properties_by_ticker_in_chunks(
+        self,
+        ticker: str,
+        read_chunks: Callable[[], Iterable[PropertyBatch | list[dict]]],
+        dead_letter_path: Optional[Path] = None,
+    ) -> PropertyBatch:
+        """
+        updates a ticker's properties like update_properties_by_ticker, from data too large
+        to hold in memory, returning a PropertyBatch of the IDs and address inputs of the
+        created properties
 
-        to_create: list[Property] = list()
-        for new_property in data:
-            if new_property.address_input in existing_property_dict_by_addressInput:
+        read_chunks is called twice to read the data as a sequence of chunks, first for the
+        address inputs to diff against the existing properties, then to upload the rows to
+        create one chunk at a time, so only one chunk and the address inputs are held in
+        memory
+
+        a chunk is a PropertyBatch or a list of upload payloads, such as those read by
+        property_csv.iter_property_payloads, which are uploaded as they are
+        """
+        address_inputs: list[str] = list()
+
+        def payloads() -> Iterator[dict]:
+            for chunk in read_chunks():
+                chunk_payloads = self._property_payloads(chunk)
+                address_inputs.extend(p["addressInput"] for p in chunk_payloads)
+                yield from chunk_payloads
+
+        if self.journal_dir is not None:
+            journal = UploadJournal.open(self.journal_dir, ticker, payloads())
+        else:
+            journal = None
+            for chunk in read_chunks():
+                address_inputs.extend(
+                    chunk.address_inputs()
+                    if isinstance(chunk, PropertyBatch)
+                    else (p["addressInput"] for p in chunk)
+                )
+        if len(address_inputs) == 0:
+            raise Exception("data must be a non-empty list of property objects")
+        if journal is not None and journal.has_plan:
+            to_delete = journal.remaining_deletes()
+            remaining_creates = journal.remaining_creates()
+            self.logger.info(
+                f"resuming update for ticker {ticker} from {journal.path}, "
+                f"{len(to_delete)} deletes and {len(remaining_creates)} creates remaining"
+            )
+        else:
+            to_create, to_delete = self._diff_properties(
+                ticker, PropertyBatch.from_columns({"addressInput": address_inputs})
+            )
+            remaining_creates = set(to_create.address_inputs())
+            if journal is not None:
+                journal.record_plan(to_delete, to_create.address_inputs())
+
+        self._delete_stale_properties(
+            ticker,
+            to_delete,
+            on_deleted=journal.record_deleted if journal is not None else None,
+        )
+        created_ids: list[Optional[str]] = list()
+        created_address_inputs: list[str] = list()
+        rejected: list[RejectedProperty] = list()
+        offset = 0
+        for chunk in read_chunks():
+            to_create = (
+                chunk.select(remaining_creates).to_payloads()
+                if isinstance(chunk, PropertyBatch)
+                else [p for p in chunk if p["addressInput"] in remaining_creates]
+            )
+            if len(to_create) == 0:
                 continue
-            to_create.append(new_property)
-        for existing_property in existing_properties:
+            chunk_created, chunk_rejected = self._post_property_payloads(
+                to_create,
+                on_created=(
+                    (
+                        lambda created: journal.record_created(
+                            p["addressInput"] for p in created
+                        )
+                    )
+                    if journal is not None
+                    else None
+                ),
+            )
+            created_ids.extend(p.get("id") for p in chunk_created)
+            created_address_inputs.extend(p.get("addressInput") for p in chunk_created)
+            for rejected_property in chunk_rejected:
+                rejected_property.index += offset
+            rejected.extend(chunk_rejected)
+            offset += len(to_create)
+        created = PropertyBatch.from_columns(
+            {"id": created_ids, "addressInput": created_address_inputs}
+        )
+        if len(rejected) > 0:
+            if dead_letter_path is not None:
+                RejectedProperty.to_csv(rejected, dead_letter_path)
+            raise PartialUploadError(created, rejected, dead_letter_path)
+        if journal is not None:
+            journal.complete()
+        return created
+
+    def _delete_stale_properties(
+        self,
+        ticker: str,
+        to_delete: list[str],
+        on_deleted: Optional[Callable[[list[str]], None]] = None,
+    ) -> None:
+        """
+        deletes the ticker's stale properties by ID, raising an exception if any could not
+        be deleted
+        """
+        if len(to_delete) == 0:
+            return
+        delete_result = self.delete_properties_by_ids(to_delete, on_deleted=on_deleted)
+        self.logger.info(
+            f"deleted {delete_result.deleted} stale properties for ticker {ticker}, "
+            f"failed: {delete_result.failed}, retried: {delete_result.retried}"
+        )
+        if delete_result.failed > 0:
+            raise Exception(
+                f"failed to delete {delete_result.failed} stale properties for ticker {ticker}: "
+                f"{delete_result.failed_ids}"
+            )
+
+    def start_streaming_update(
+        self, ticker: str, dead_letter_path: Optional[Path] = None
+    ) -> "StreamingPropertyUpdate":
+        """
+        starts an update of a ticker's properties from data that arrives in chunks while it
+        is produced, such as rows still being scraped, fetching the existing properties once
+        up front, see StreamingPropertyUpdate
+        """
+        existing: dict[str, Optional[str]] = dict()
+        for existing_property in self.iter_properties_by_ticker(ticker):
+            existing[existing_property.address_input] = existing_property.id
+        self.logger.info(
+            f"streaming update for ticker {ticker} against {len(existing)} existing properties"
+        )
+        return StreamingPropertyUpdate(self, ticker, existing, dead_letter_path)
+
+    def _diff_properties(
+        self, ticker: str, data: list[Property] | PropertyBatch
+    ) -> tuple[list[Property] | PropertyBatch, list[str]]:
+        """
+        compares data with the ticker's existing properties by address input, returning the
+        properties to create and the IDs of stale existing properties to delete
+
+        existing properties are streamed, so only their address inputs are kept in memory
+        """
+        if isinstance(data, PropertyBatch):
+            existing_ids: list[Optional[str]] = list()
+            existing_address_inputs: list[str] = list()
+            for existing_property in self.iter_properties_by_ticker(ticker):
+                existing_ids.append(existing_property.id)
+                existing_address_inputs.append(existing_property.address_input)
+            return data.diff(
+                PropertyBatch.from_columns(
+                    {"id": existing_ids, "addressInput": existing_address_inputs}
+                )
+            )
+        new_property_address_input_set = {p.address_input for p in data}
+        existing_address_input_set: set[str] = set()
+        to_delete: list[str] = list()
+        for existing_property in self.iter_properties_by_ticker(ticker):
+            existing_address_input_set.add(existing_property.address_input)
             if existing_property.address_input in new_property_address_input_set:
                 continue
             if existing_property.id is None:
                 raise Exception(
                     f"existing property {existing_property.address_input} has no ID"
                 )
-            self.delete_property_by_id(existing_property.id)
-            time.sleep(1)
-        return self.post_properties(to_create) if len(to_create) > 0 else list()
+            to_delete.append(existing_property.id)
+        to_create = [
+            p for p in data if p.address_input not in existing_address_input_set
+        ]
+        return to_create, to_delete
 
     def get_geocode_by_address_input(self, address_input: str) -> Geocode | None:
         """
@@ -162,7 +850,7 @@ class HousefireClient:
             raise Exception(
                 f"unexpected error getting geocode for address input {address_input}: {r}"
             )
-        return Geocode.from_dict(r.json())
+        return Geocode.from_dict(self._json(r))
 
     def post_geocode(self, data: Geocode) -> Geocode:
         """
@@ -174,8 +862,99 @@ class HousefireClient:
             raise ValueError(f"validation error while creating geocode: {r}")
         elif self._is_error_response(r):
             raise Exception(f"unexpected error creating geocode: {r}")
-        return Geocode.from_dict(r.json())
+        return Geocode.from_dict(self._json(r))
+
+    @staticmethod
+    def _json(response: r.Response):
+        """
+        decodes a response body with the fastest available JSON codec
+        """
+        return json_codec.loads(response.content)
 
     @staticmethod
     def _is_error_response(response: r.Response) -> bool:
         return response.status_code >= 400
+
+
+class StreamingPropertyUpdate:
+    """
+    An update of a ticker's properties fed one chunk at a time, created by
+    HousefireClient.start_streaming_update
+
+    Each chunk's rows that do not exist yet are uploaded as soon as the chunk arrives.
+    Stale properties can only be known once every row has been seen, so they are deleted by
+    finish, and an update that is abandoned before finish only ever adds properties. A
+    rerun sees the rows an abandoned update created as existing, so it is not journaled.
+
+    Args:
+        client (HousefireClient): the client to upload and delete with
+        ticker (str): the ticker being updated
+        existing (dict[str, Optional[str]]): IDs of the existing properties by address input
+        dead_letter_path (Path): file to write rejected rows to, not written when None
+    """
+
+    def __init__(
+        self,
+        client: HousefireClient,
+        ticker: str,
+        existing: dict[str, Optional[str]],
+        dead_letter_path: Optional[Path] = None,
+    ):
+        self.client = client
+        self.ticker = ticker
+        self.existing = existing
+        self.dead_letter_path = dead_letter_path
+        self.seen_address_inputs: set[str] = set()
+        self.created_ids: list[Optional[str]] = list()
+        self.created_address_inputs: list[str] = list()
+        self.rejected: list[RejectedProperty] = list()
+        self._offset = 0
+
+    def upload(self, chunk: list[Property] | list[dict] | PropertyBatch) -> int:
+        """
+        uploads the chunk's new rows, skipping rows that exist or were already seen, and
+        returns the number created
+        """
+        to_create = list()
+        for payload in self.client._property_payloads(chunk):
+            address_input = payload["addressInput"]
+            if address_input in self.seen_address_inputs:
+                continue
+            self.seen_address_inputs.add(address_input)
+            if address_input not in self.existing:
+                to_create.append(payload)
+        if len(to_create) == 0:
+            return 0
+        created, rejected = self.client._post_property_payloads(to_create)
+        self.created_ids.extend(p.get("id") for p in created)
+        self.created_address_inputs.extend(p.get("addressInput") for p in created)
+        for rejected_property in rejected:
+            rejected_property.index += self._offset
+        self.rejected.extend(rejected)
+        self._offset += len(to_create)
+        return len(created)
+
+    def finish(self) -> PropertyBatch:
+        """
+        deletes the existing properties no uploaded chunk had and returns a PropertyBatch
+        of the IDs and address inputs of the created properties, raising PartialUploadError
+        if the server rejected any rows
+        """
+        if len(self.seen_address_inputs) == 0:
+            raise Exception("data must be a non-empty list of property objects")
+        to_delete = list()
+        for address_input, property_id in self.existing.items():
+            if address_input in self.seen_address_inputs:
+                continue
+            if property_id is None:
+                raise Exception(f"existing property {address_input} has no ID")
+            to_delete.append(property_id)
+        self.client._delete_stale_properties(self.ticker, to_delete)
+        created = PropertyBatch.from_columns(
+            {"id": self.created_ids, "addressInput": self.created_address_inputs}
+        )
+        if len(self.rejected) > 0:
+            if self.dead_letter_path is not None:
+                RejectedProperty.to_csv(self.rejected, self.dead_letter_path)
+            raise PartialUploadError(created, self.rejected, self.dead_letter_path)
+        return created
@@ -1,13 +1,119 @@
 import csv
+import itertools
 import json
+import sys
 from pathlib import Path
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Iterator, Optional, TypeVar
+
+from housefire.dependency.housefire_client import json_codec
+
+T = TypeVar("T")
+
+# rows per chunk of the chunked file readers, enough to amortize per-chunk overhead while
+# keeping a chunk of even the widest rows to a few megabytes
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def iter_chunks(iterable: Iterable[T], chunk_size: int) -> Iterator[list[T]]:
+    """
+    splits iterable into lists of chunk_size items, the last one possibly shorter
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _intern(value):
+    """
+    interns low-cardinality strings such as tickers, states, and countries, which repeat
+    on every row of a portfolio, so each distinct value is stored once
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_facts(facts):
+    """
+    interns the labels and values of a facts list in place, labels always repeat and values
+    are often one of a few flags or types
+    """
+    if isinstance(facts, list):
+        for fact in facts:
+            if not isinstance(fact, dict):
+                continue
+            for key, value in fact.items():
+                if type(value) is str:
+                    fact[key] = sys.intern(value)
+    return facts
+
+
+def _parse_datetime(raw: str) -> Optional[datetime]:
+    return datetime.fromisoformat(raw) if raw else None
+
+
+def _parse_facts(raw: str) -> Optional[list[dict[str, str]]]:
+    return _intern_facts(json_codec.loads(raw)) if raw else None
+
+
+class _LazyField:
+    """
+    Data descriptor wrapped around a dataclass slot that accepts the raw string form of a
+    field, as read from the API or a CSV, and parses it the first time the field is read,
+    caching the parsed value in the slot, so rows whose field is never read never pay for
+    parsing it
+
+    Args:
+        slot: the slot member descriptor created by dataclass(slots=True)
+        parse (Callable[[str], Any]): converts the raw string to the field value
+        prepare (Callable[[Any], Any]): applied to non-string values when they are set
+    """
+
+    def __init__(self, slot, parse, prepare=None):
+        self.slot = slot
+        self.parse = parse
+        self.prepare = prepare
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, objtype)
+        if type(value) is str:
+            value = self.parse(value)
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        if self.prepare is not None and type(value) is not str:
+            value = self.prepare(value)
+        self.slot.__set__(obj, value)
+
+    def __delete__(self, obj):
+        self.slot.__delete__(obj)
+
+
+def _lazy_fields(**parsers):
+    """
+    class decorator, applied above dataclass(slots=True), that makes the named fields lazy,
+    each keyword maps a field name to its parse function or a (parse, prepare) tuple
+    """
+
+    def decorate(cls):
+        for name, parser in parsers.items():
+            parse, prepare = parser if isinstance(parser, tuple) else (parser, None)
+            setattr(cls, name, _LazyField(cls.__dict__[name], parse, prepare))
+        return cls
+
+    return decorate
 
 
 class SerializableHousefireObject(ABC):
+    # subclasses are slotted dataclasses, an empty base __slots__ keeps them free of __dict__
+    __slots__ = ()
+
     @abstractmethod
     def to_dict(self) -> dict:
         pass
@@ -17,32 +123,79 @@ class SerializableHousefireObject(ABC):
     def from_dict(data: dict) -> "SerializableHousefireObject":
         pass
 
+    def to_json(self) -> bytes:
+        """
+        encodes the object as JSON bytes, using orjson when it is installed
+        """
+        return json_codec.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, data: bytes | str) -> "SerializableHousefireObject":
+        return cls.from_dict(json_codec.loads(data))
+
+    @staticmethod
+    def list_to_json(objects: Iterable["SerializableHousefireObject"]) -> bytes:
+        """
+        encodes objects as one JSON array, the request body format of the bulk endpoints
+        """
+        return json_codec.dumps([o.to_dict() for o in objects])
+
+    @classmethod
+    def list_from_json(cls, data: bytes | str) -> list["SerializableHousefireObject"]:
+        return [cls.from_dict(d) for d in json_codec.loads(data)]
+
     @staticmethod
     @abstractmethod
     def keys() -> list[str]:
         pass
 
     @staticmethod
-    def to_csv(data: list["SerializableHousefireObject"], path: Path):
+    def to_csv(data: Iterable["SerializableHousefireObject"], path: Path):
+        """
+        writes objects to a CSV file one row at a time, so data may be a lazy iterable
+        such as HousefireClient.iter_properties_by_ticker
+        """
+        iterator = iter(data)
+        first = next(iterator, None)
+        if first is None:
+            raise ValueError("cannot write an empty list of objects to CSV")
         with open(path, "w") as f:
             writer = csv.DictWriter(
-                f, fieldnames=data[0].keys(), dialect=csv.unix_dialect
+                f, fieldnames=first.keys(), dialect=csv.unix_dialect
             )
             writer.writeheader()
-            for d in data:
-                data_dict = {
-                    key: json.dumps(value) if isinstance(value, (list, dict)) else value
-                    for key, value in d.to_dict().items()
-                }
-                writer.writerow(data_dict)
+            for d in itertools.chain((first,), iterator):
+                writer.writerow(d.to_csv_row())
+
+    def to_csv_row(self) -> dict:
+        """
+        the object's dict with list and dict values encoded as JSON, as written to CSV
+        """
+        return {
+            key: json.dumps(value) if isinstance(value, (list, dict)) else value
+            for key, value in self.to_dict().items()
+        }
 
     @staticmethod
     @abstractmethod
     def from_csv(path: Path) -> list["SerializableHousefireObject"]:
         pass
 
+    @classmethod
+    def iter_csv(
+        cls, path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[list["SerializableHousefireObject"]]:
+        """
+        reads a CSV file written by to_csv in lists of up to chunk_size objects, so only
+        one chunk is held in memory at a time
+        """
+        with open(path, "r") as f:
+            reader = csv.DictReader(f, dialect=csv.unix_dialect)
+            yield from iter_chunks(map(cls.from_dict, reader), chunk_size)
+
 
-@dataclass
+@_lazy_fields(created_at=_parse_datetime, updated_at=_parse_datetime)
+@dataclass(slots=True)
 class Geocode(SerializableHousefireObject):
     address_input: str
     latitude: float
@@ -60,6 +213,12 @@ class Geocode(SerializableHousefireObject):
     formatted_address: Optional[str] = None
     global_plus_code: Optional[str] = None
 
+    def __post_init__(self):
+        self.administrative_area_level1 = _intern(self.administrative_area_level1)
+        self.administrative_area_level2 = _intern(self.administrative_area_level2)
+        self.locality = _intern(self.locality)
+        self.country = _intern(self.country)
+
     def to_dict(self) -> dict:
         """
         Creates a dictionary representation of the Geocode object, omitting None values and the id, created_at, and
@@ -84,39 +243,19 @@ class Geocode(SerializableHousefireObject):
     @staticmethod
     def from_dict(data: dict) -> "Geocode":
         return Geocode(
-            id=data["id"] if "id" in data else None,
-            created_at=(
-                datetime.fromisoformat(data["createdAt"])
-                if data.get("createdAt")
-                else None
-            ),
-            updated_at=(
-                datetime.fromisoformat(data["updatedAt"])
-                if data.get("updatedAt")
-                else None
-            ),
+            id=data.get("id"),
+            created_at=data.get("createdAt") or None,
+            updated_at=data.get("updatedAt") or None,
             address_input=data["addressInput"],
-            street_number=data["streetNumber"] if "streetNumber" in data else None,
-            route=data["route"] if "route" in data else None,
-            locality=data["locality"] if "locality" in data else None,
-            administrative_area_level1=(
-                data["administrativeAreaLevel1"]
-                if "administrativeAreaLevel1" in data
-                else None
-            ),
-            administrative_area_level2=(
-                data["administrativeAreaLevel2"]
-                if "administrativeAreaLevel2" in data
-                else None
-            ),
-            country=data["country"] if "country" in data else None,
-            postal_code=data["postalCode"] if "postalCode" in data else None,
-            formatted_address=(
-                data["formattedAddress"] if "formattedAddress" in data else None
-            ),
-            global_plus_code=(
-                data["globalPlusCode"] if "globalPlusCode" in data else None
-            ),
+            street_number=data.get("streetNumber"),
+            route=data.get("route"),
+            locality=data.get("locality"),
+            administrative_area_level1=data.get("administrativeAreaLevel1"),
+            administrative_area_level2=data.get("administrativeAreaLevel2"),
+            country=data.get("country"),
+            postal_code=data.get("postalCode"),
+            formatted_address=data.get("formattedAddress"),
+            global_plus_code=data.get("globalPlusCode"),
             latitude=float(data["latitude"]),
             longitude=float(data["longitude"]),
         )
@@ -143,15 +282,11 @@ class Geocode(SerializableHousefireObject):
 
     @staticmethod
     def from_csv(path: Path) -> list["Geocode"]:
-        with open(path, "r") as f:
-            reader = csv.DictReader(f, dialect=csv.unix_dialect)
-            data: list["Geocode"] = []
-            for row in reader:
-                data.append(Geocode.from_dict(row))
-            return data
+        return [d for chunk in Geocode.iter_csv(path) for d in chunk]
 
 
-@dataclass
+@_lazy_fields(created_at=_parse_datetime, updated_at=_parse_datetime)
+@dataclass(slots=True)
 class Reit(SerializableHousefireObject):
     ticker: str
     id: Optional[str] = None
@@ -165,17 +300,9 @@ class Reit(SerializableHousefireObject):
     def from_dict(data: dict) -> "Reit":
         return Reit(
             ticker=data["ticker"],
-            id=data["id"] if "id" in data else None,
-            created_at=(
-                datetime.fromisoformat(data["createdAt"])
-                if data.get("createdAt")
-                else None
-            ),
-            updated_at=(
-                datetime.fromisoformat(data["updatedAt"])
-                if data.get("updatedAt")
-                else None
-            ),
+            id=data.get("id"),
+            created_at=data.get("createdAt") or None,
+            updated_at=data.get("updatedAt") or None,
         )
 
     @staticmethod
@@ -184,15 +311,15 @@ class Reit(SerializableHousefireObject):
 
     @staticmethod
     def from_csv(path: Path) -> list["Reit"]:
-        with open(path, "r") as f:
-            reader = csv.DictReader(f, dialect=csv.unix_dialect)
-            data: list["Reit"] = []
-            for row in reader:
-                data.append(Reit.from_dict(row))
-            return data
+        return [d for chunk in Reit.iter_csv(path) for d in chunk]
 
 
-@dataclass
+@_lazy_fields(
+    created_at=_parse_datetime,
+    updated_at=_parse_datetime,
+    facts=(_parse_facts, _intern_facts),
+)
+@dataclass(slots=True)
 class Property(SerializableHousefireObject):
     address_input: str
     reit_ticker: str
@@ -212,6 +339,12 @@ class Property(SerializableHousefireObject):
     square_footage: Optional[float] = None
     facts: Optional[list[dict[str, str]]] = None
 
+    def __post_init__(self):
+        self.reit_ticker = _intern(self.reit_ticker)
+        self.city = _intern(self.city)
+        self.state = _intern(self.state)
+        self.country = _intern(self.country)
+
     def to_dict(self) -> dict:
         """
         Creates a dictionary representation of the Property object, omitting None values and the id, created_at, and
@@ -237,31 +370,19 @@ class Property(SerializableHousefireObject):
 
     @staticmethod
     def from_dict(data: dict) -> "Property":
-        facts = data.get("facts")
-        if isinstance(facts, str):
-            facts = json.loads(facts) if facts else None
-
         return Property(
-            id=data["id"] if "id" in data else None,
-            created_at=(
-                datetime.fromisoformat(data["createdAt"])
-                if data.get("createdAt")
-                else None
-            ),
-            updated_at=(
-                datetime.fromisoformat(data["updatedAt"])
-                if data.get("updatedAt")
-                else None
-            ),
-            name=data["name"] if "name" in data else None,
+            id=data.get("id"),
+            created_at=data.get("createdAt") or None,
+            updated_at=data.get("updatedAt") or None,
+            name=data.get("name"),
             address_input=data["addressInput"],
-            address=data["address"] if "address" in data else None,
-            address2=data["address2"] if "address2" in data else None,
-            neighborhood=data["neighborhood"] if "neighborhood" in data else None,
-            city=data["city"] if "city" in data else None,
-            state=data["state"] if "state" in data else None,
-            zip=data["zip"] if "zip" in data else None,
-            country=data["country"] if "country" in data else None,
+            address=data.get("address"),
+            address2=data.get("address2"),
+            neighborhood=data.get("neighborhood"),
+            city=data.get("city"),
+            state=data.get("state"),
+            zip=data.get("zip"),
+            country=data.get("country"),
             latitude=(
                 float(data["latitude"])
                 if data.get("latitude") not in (None, "")
@@ -277,7 +398,7 @@ class Property(SerializableHousefireObject):
                 if data.get("squareFootage") not in (None, "")
                 else None
             ),
-            facts=facts,
+            facts=data.get("facts"),
             reit_ticker=data["reitTicker"],
         )
 
@@ -305,9 +426,4 @@ class Property(SerializableHousefireObject):
 
     @staticmethod
     def from_csv(path: Path) -> list["Property"]:
-        with open(path, "r") as f:
-            reader = csv.DictReader(f, dialect=csv.unix_dialect)
-            data: list["Property"] = []
-            for row in reader:
-                data.append(Property.from_dict(row))
-            return data
+        return [d for chunk in Property.iter_csv(path) for d in chunk]
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+import requests as r
+from requests.structures import CaseInsensitiveDict
+
+from housefire.atomic_file import atomic_write
+
+
+@dataclass
+class HttpCacheEntry:
+    """A cached GET response body on disk with the validators needed to revalidate it"""
+
+    url: str
+    body_path: Path
+    headers: dict[str, str]
+
+    def conditional_headers(self) -> dict[str, str]:
+        """
+        request headers asking the server to answer 304 if the cached body is still current
+        """
+        conditional_headers = dict()
+        if "ETag" in self.headers:
+            conditional_headers["If-None-Match"] = self.headers["ETag"]
+        if "Last-Modified" in self.headers:
+            conditional_headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return conditional_headers
+
+    def to_response(self) -> r.Response:
+        """
+        builds a 200 response whose body is streamed from the cached file
+        """
+        response = r.Response()
+        response.status_code = 200
+        response.url = self.url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = "utf-8"
+        response.raw = open(self.body_path, "rb")
+        return response
+
+
+class HttpCache:
+    """
+    On-disk cache of GET responses keyed by URL and query parameters, storing the ETag and
+    Last-Modified validators so reads can be sent as conditional requests and a 304 served
+    from the local copy
+
+    Every distinct URL and query adds an entry, so opening the cache deletes the entries
+    not used for max_age_seconds, then the least recently used ones until the rest fit in
+    max_bytes.
+
+    Args:
+        cache_dir (Path): directory holding one body and one metadata file per cached URL
+        max_age_seconds (float): entries unused for longer are deleted when the cache opens
+        max_bytes (int): the size the cache is pruned to when it opens
+    """
+
+    # response headers kept with a cached body, everything else is connection specific
+    STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "X-Next-Cursor")
+    DEFAULT_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.cache_dir = Path(cache_dir)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.max_age_seconds = max_age_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._prune()
+
+    def lookup(
+        self, url: str, params: Optional[dict] = None
+    ) -> Optional[HttpCacheEntry]:
+        key = self._key(url, params)
+        metadata_path = self.cache_dir / f"{key}.json"
+        body_path = self.cache_dir / f"{key}.body"
+        if not metadata_path.exists() or not body_path.exists():
+            return None
+        with open(metadata_path, "r") as f:
+            headers = json.load(f)
+        # the metadata file's modification time is when the entry was last used
+        os.utime(metadata_path)
+        return HttpCacheEntry(url, body_path, headers)
+
+    def store(
+        self,
+        url: str,
+        params: Optional[dict],
+        headers: CaseInsensitiveDict,
+        body_chunks: Iterable[bytes],
+    ) -> Optional[HttpCacheEntry]:
+        """
+        writes a response to the cache if it carries a validator, returning the new entry,
+        or None (without consuming body_chunks) if the response cannot be revalidated
+        """
+        if "ETag" not in headers and "Last-Modified" not in headers:
+            return None
+        key = self._key(url, params)
+        stored_headers = {h: headers[h] for h in self.STORED_HEADERS if h in headers}
+        body_path = self.cache_dir / f"{key}.body"
+        with atomic_write(body_path) as body_file:
+            for chunk in body_chunks:
+                body_file.write(chunk)
+        with atomic_write(self.cache_dir / f"{key}.json", "w") as metadata_file:
+            json.dump(stored_headers, metadata_file)
+        return HttpCacheEntry(url, body_path, stored_headers)
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def summary(self) -> str:
+        return f"HTTP cache: {self.hits} hits, {self.misses} misses"
+
+    def _prune(self) -> None:
+        """
+        deletes the entries unused for max_age_seconds, then the least recently used until
+        the cache fits in max_bytes, along with temp files left by interrupted stores
+        """
+        # last use, total size, and files of each entry, by key
+        entries: dict[str, tuple[float, int, list[Path]]] = dict()
+        for path in self.cache_dir.iterdir():
+            stat = path.stat()
+            used, size, paths = entries.get(path.stem, (0.0, 0, []))
+            entries[path.stem] = (
+                max(used, stat.st_mtime),
+                size + stat.st_size,
+                paths + [path],
+            )
+        total = sum(size for _, size, _ in entries.values())
+        expired = time.time() - self.max_age_seconds
+        for used, size, paths in sorted(entries.values(), key=lambda e: e[0]):
+            if used >= expired and total <= self.max_bytes:
+                break
+            for path in paths:
+                path.unlink(missing_ok=True)
+            total -= size
+
+    @staticmethod
+    def _key(url: str, params: Optional[dict]) -> str:
+        encoded_params = json.dumps(params or {}, sort_keys=True, default=str)
+        return hashlib.sha256(f"{url}?{encoded_params}".encode()).hexdigest()
@@ -0,0 +1,74 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    incrementally decodes a top-level JSON array from a stream of UTF-8 byte chunks,
+    yielding each element as soon as it is complete, so only one element and one
+    chunk are held in memory at a time
+
+    raises json.JSONDecodeError if the stream is not a complete JSON array
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    # start -> first_value -> separator -> value -> separator ... -> end
+    state = "start"
+    chunk_iterator = iter(chunks)
+    at_eof = False
+    while state != "end":
+        chunk = next(chunk_iterator, None)
+        if chunk is None:
+            at_eof = True
+            buffer = buffer[position:] + text_decoder.decode(b"", final=True)
+        else:
+            buffer = buffer[position:] + text_decoder.decode(chunk)
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position == len(buffer):
+                break
+            if state == "start":
+                if buffer[position] != "[":
+                    raise json.JSONDecodeError("Expecting '['", buffer, position)
+                position += 1
+                state = "first_value"
+            elif state in ("first_value", "value"):
+                if state == "first_value" and buffer[position] == "]":
+                    position += 1
+                    state = "end"
+                    break
+                try:
+                    value, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if at_eof:
+                        raise
+                    break  # the element is incomplete, wait for the next chunk
+                if end == len(buffer) and not at_eof:
+                    break  # a number at the end of the buffer may continue in the next chunk
+                position = end
+                state = "separator"
+                yield value
+            else:
+                if buffer[position] == "]":
+                    position += 1
+                    state = "end"
+                    break
+                if buffer[position] != ",":
+                    raise json.JSONDecodeError(
+                        "Expecting ',' delimiter", buffer, position
+                    )
+                position += 1
+                state = "value"
+        if at_eof and state != "end":
+            raise json.JSONDecodeError("Unterminated JSON array", buffer, position)
+    if buffer[position:].strip(_WHITESPACE) or any(
+        c.strip(_WHITESPACE.encode()) for c in chunk_iterator
+    ):
+        raise json.JSONDecodeError("Extra data after JSON array", buffer, position)
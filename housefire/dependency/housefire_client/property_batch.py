@@ -0,0 +1,390 @@
+import csv
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+import pandas as pd
+
+from housefire.dependency.housefire_client import json_codec
+from housefire.dependency.housefire_client.housefire_object import (
+    DEFAULT_CHUNK_SIZE,
+    Property,
+    iter_chunks,
+)
+
+
+class PropertyBatch:
+    """
+    Columnar batch of properties, one pandas column per API field, so bulk operations such
+    as diffing, deduplication, file I/O, and upload payload building run column by column
+    instead of one Property object at a time
+
+    Columns are named with the API's camelCase field names, as returned by Property.keys(),
+    and missing values are None or NaN. The facts column holds lists of fact dicts, or the
+    raw JSON strings they were read from.
+
+    Args:
+        frame (pd.DataFrame): one row per property, missing columns are added empty
+    """
+
+    COLUMNS = Property.keys()
+    # the field order of Property.to_dict, which omits the API metadata columns
+    PAYLOAD_COLUMNS = (
+        "name",
+        "addressInput",
+        "address",
+        "address2",
+        "neighborhood",
+        "city",
+        "state",
+        "zip",
+        "country",
+        "latitude",
+        "longitude",
+        "squareFootage",
+        "facts",
+        "reitTicker",
+    )
+    NUMERIC_COLUMNS = ("latitude", "longitude", "squareFootage")
+    # columns Property parses from strings, where an empty string means no value
+    PARSED_COLUMNS = ("createdAt", "updatedAt", "facts")
+    # Property attribute for each column
+    ATTRIBUTES = {
+        "id": "id",
+        "createdAt": "created_at",
+        "updatedAt": "updated_at",
+        "name": "name",
+        "addressInput": "address_input",
+        "address": "address",
+        "address2": "address2",
+        "neighborhood": "neighborhood",
+        "city": "city",
+        "state": "state",
+        "zip": "zip",
+        "country": "country",
+        "latitude": "latitude",
+        "longitude": "longitude",
+        "squareFootage": "square_footage",
+        "facts": "facts",
+        "reitTicker": "reit_ticker",
+    }
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame.reindex(columns=self.COLUMNS).reset_index(drop=True)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @classmethod
+    def from_properties(cls, properties: Iterable[Property]) -> "PropertyBatch":
+        properties = list(properties)
+        return cls(
+            pd.DataFrame(
+                {
+                    column: [getattr(p, attribute) for p in properties]
+                    for column, attribute in cls.ATTRIBUTES.items()
+                }
+            )
+        )
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, list]) -> "PropertyBatch":
+        """
+        builds a batch from a list of values per column, other columns are left empty
+        """
+        return cls(pd.DataFrame(columns))
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> "PropertyBatch":
+        """
+        builds a batch from API-style dicts, such as upload payloads or created properties
+        """
+        return cls(pd.DataFrame.from_records(list(records), columns=cls.COLUMNS))
+
+    def to_properties(self) -> list[Property]:
+        columns = [self._column_values(column) for column in self.COLUMNS]
+        attributes = [self.ATTRIBUTES[column] for column in self.COLUMNS]
+        return [Property(**dict(zip(attributes, row))) for row in zip(*columns)]
+
+    def to_payloads(self) -> list[dict]:
+        """
+        builds the upload payload of each row, identical to Property.to_dict
+        """
+        columns = []
+        for column in self.PAYLOAD_COLUMNS:
+            values = self._column_values(column)
+            if column == "facts":
+                # only an empty string means no facts, an empty list is kept as is
+                values = [
+                    (json_codec.loads(v) if v else None) if isinstance(v, str) else v
+                    for v in values
+                ]
+            columns.append(values)
+        return [
+            {k: v for k, v in zip(self.PAYLOAD_COLUMNS, row) if v is not None}
+            for row in zip(*columns)
+        ]
+
+    def to_json(self) -> bytes:
+        return json_codec.dumps(self.to_payloads())
+
+    def address_inputs(self) -> list[str]:
+        return self.frame["addressInput"].tolist()
+
+    def select(self, address_inputs: Iterable[str]) -> "PropertyBatch":
+        """
+        returns the rows whose address input is in address_inputs, in batch order
+        """
+        return PropertyBatch(
+            self.frame[self._address_inputs_in(self.frame, list(address_inputs))]
+        )
+
+    def dedup(self, keep: str = "last") -> "PropertyBatch":
+        """
+        drops rows with a repeated address input, keeping the first or last occurrence
+        """
+        return PropertyBatch(
+            self.frame.drop_duplicates(subset="addressInput", keep=keep)
+        )
+
+    def diff(self, existing: "PropertyBatch") -> tuple["PropertyBatch", list[str]]:
+        """
+        compares the batch with existing properties by address input, returning the rows
+        to create and the IDs of the stale existing properties to delete
+        """
+        to_create = self.frame[
+            ~self._address_inputs_in(self.frame, existing.frame["addressInput"])
+        ]
+        stale = existing.frame[
+            ~self._address_inputs_in(existing.frame, self.frame["addressInput"])
+        ]
+        missing_ids = stale["id"].isna()
+        if missing_ids.any():
+            raise Exception(
+                f"existing property {stale['addressInput'][missing_ids].iloc[0]} has no ID"
+            )
+        return PropertyBatch(to_create), stale["id"].tolist()
+
+    def to_csv(self, path: Path, header: bool = True, mode: str = "w") -> None:
+        """
+        writes the batch in the same CSV format as Property.to_csv, mode "a" without a
+        header appends the rows to a file already written this way
+        """
+        frame = self.frame.copy()
+        frame["facts"] = [
+            json.dumps(v) if isinstance(v, (list, dict)) else v
+            for v in self._column_values("facts")
+        ]
+        frame.to_csv(
+            path,
+            index=False,
+            header=header,
+            mode=mode,
+            quoting=csv.QUOTE_ALL,
+            lineterminator="\n",
+        )
+
+    @classmethod
+    def from_csv(cls, path: Path) -> "PropertyBatch":
+        """
+        reads a CSV written by Property.to_csv or PropertyBatch.to_csv, leaving the facts
+        column as JSON strings that are decoded when payloads or properties are built
+        """
+        frame = pd.read_csv(path, dtype=str, keep_default_na=False)
+        return cls._from_string_frame(frame)
+
+    @classmethod
+    def iter_csv(
+        cls, path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator["PropertyBatch"]:
+        """
+        reads a CSV as from_csv does, in batches of up to chunk_size rows
+        """
+        with pd.read_csv(
+            path, dtype=str, keep_default_na=False, chunksize=chunk_size
+        ) as reader:
+            for frame in reader:
+                yield cls._from_string_frame(frame)
+
+    def to_parquet(self, path: Path) -> None:
+        """
+        writes the batch to a zstd-compressed Parquet file, which needs pyarrow installed,
+        with typed numeric columns and string columns otherwise
+
+        facts are stored as JSON strings, since decoding a nested list of structs back into
+        dicts costs more than the whole rest of the file, and the strings are only decoded
+        when payloads or properties are built, as with CSV
+        """
+        self._parquet_frame().to_parquet(path, index=False, compression="zstd")
+
+    @classmethod
+    def from_parquet(cls, path: Path) -> "PropertyBatch":
+        return cls(pd.read_parquet(path))
+
+    @classmethod
+    def iter_parquet(
+        cls, path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator["PropertyBatch"]:
+        import pyarrow.parquet as pq
+
+        for record_batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield cls(record_batch.to_pandas())
+
+    def to_jsonl(self, path: Path, mode: str = "w") -> None:
+        """
+        writes one upload payload per line, the metadata columns are not written
+        """
+        with open(path, mode + "b") as f:
+            for payload in self.to_payloads():
+                f.write(json_codec.dumps(payload))
+                f.write(b"\n")
+
+    @classmethod
+    def from_jsonl(cls, path: Path) -> "PropertyBatch":
+        with open(path, "rb") as f:
+            return cls.from_records(
+                json_codec.loads(line) for line in f if line.strip()
+            )
+
+    @classmethod
+    def iter_jsonl(
+        cls, path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator["PropertyBatch"]:
+        with open(path, "rb") as f:
+            lines = (json_codec.loads(line) for line in f if line.strip())
+            for records in iter_chunks(lines, chunk_size):
+                yield cls.from_records(records)
+
+    def _parquet_frame(self) -> pd.DataFrame:
+        """
+        the frame as written to Parquet, with every non-numeric column as strings
+        """
+        frame = self.frame.copy()
+        for column in self.COLUMNS:
+            if column == "facts":
+                frame[column] = [
+                    json_codec.dumps(v).decode() if isinstance(v, (list, dict)) else v
+                    for v in self._column_values(column)
+                ]
+            elif column in self.NUMERIC_COLUMNS:
+                frame[column] = frame[column].astype("float64")
+            else:
+                frame[column] = pd.Series(
+                    [self._string(v) for v in self._column_values(column)],
+                    dtype=object,
+                )
+        return frame
+
+    @classmethod
+    def _from_string_frame(cls, frame: pd.DataFrame) -> "PropertyBatch":
+        """
+        converts a frame of strings the way Property.from_dict converts a CSV row, empty
+        strings are kept for text columns and become missing values everywhere else
+        """
+        for column in cls.NUMERIC_COLUMNS:
+            if column in frame:
+                frame[column] = pd.to_numeric(frame[column].replace("", None))
+        for column in cls.PARSED_COLUMNS:
+            if column in frame:
+                frame[column] = frame[column].replace("", None)
+        return cls(frame)
+
+    @staticmethod
+    def _address_inputs_in(frame: pd.DataFrame, address_inputs) -> pd.Series:
+        """
+        row mask of frame's address inputs found in address_inputs, compared as Python
+        objects because isin on Arrow-backed string columns converts values one by one
+        """
+        return (
+            frame["addressInput"]
+            .astype(object)
+            .isin(pd.Series(address_inputs, dtype=object))
+        )
+
+    def _column_values(self, column: str) -> list:
+        """
+        the column as a list of Python values with None for every missing value
+        """
+        series = self.frame[column]
+        return series.astype(object).where(series.notna(), None).tolist()
+
+    @staticmethod
+    def _string(value: Any) -> Optional[str]:
+        if value is None:
+            return None
+        return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+class PropertyBatchWriter:
+    """
+    Appends property batches to one CSV, Parquet, or JSON lines file, so a large input can
+    be transformed and written a chunk at a time
+
+    Args:
+        destination_file (Path): the file to write
+        file_format (str): csv, parquet, or jsonl
+    """
+
+    def __init__(self, destination_file: Path, file_format: str):
+        self.destination_file = Path(destination_file)
+        self.file_format = file_format
+        self.rows_written = 0
+        self._parquet_writer = None
+
+    def write(self, batch: PropertyBatch) -> None:
+        if self.file_format == "csv":
+            batch.to_csv(
+                self.destination_file,
+                header=self.rows_written == 0,
+                mode="w" if self.rows_written == 0 else "a",
+            )
+        elif self.file_format == "parquet":
+            self._write_parquet(batch)
+        else:
+            batch.to_jsonl(
+                self.destination_file, mode="w" if self.rows_written == 0 else "a"
+            )
+        self.rows_written += len(batch)
+
+    def close(self) -> None:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def __enter__(self) -> "PropertyBatchWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _write_parquet(self, batch: PropertyBatch) -> None:
+        """
+        appends a row group, with a fixed schema so a chunk whose column is all missing
+        values still matches the chunks before it
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema(
+            [
+                (
+                    column,
+                    (
+                        pa.float64()
+                        if column in PropertyBatch.NUMERIC_COLUMNS
+                        else pa.string()
+                    ),
+                )
+                for column in PropertyBatch.COLUMNS
+            ]
+        )
+        if self._parquet_writer is None:
+            self._parquet_writer = pq.ParquetWriter(
+                self.destination_file, schema, compression="zstd"
+            )
+        self._parquet_writer.write_table(
+            pa.Table.from_pandas(
+                batch._parquet_frame(), schema=schema, preserve_index=False
+            )
+        )
@@ -0,0 +1,79 @@
+import csv
+from pathlib import Path
+from typing import Iterator
+
+from housefire.dependency.housefire_client import json_codec
+from housefire.dependency.housefire_client.housefire_object import (
+    DEFAULT_CHUNK_SIZE,
+    iter_chunks,
+)
+
+# payload fields in Property.to_dict order, with how each CSV value is converted
+_TEXT, _NUMBER, _JSON = range(3)
+PAYLOAD_FIELDS = (
+    ("name", _TEXT),
+    ("addressInput", _TEXT),
+    ("address", _TEXT),
+    ("address2", _TEXT),
+    ("neighborhood", _TEXT),
+    ("city", _TEXT),
+    ("state", _TEXT),
+    ("zip", _TEXT),
+    ("country", _TEXT),
+    ("latitude", _NUMBER),
+    ("longitude", _NUMBER),
+    ("squareFootage", _NUMBER),
+    ("facts", _JSON),
+    ("reitTicker", _TEXT),
+)
+REQUIRED_FIELDS = ("addressInput", "reitTicker")
+
+
+def iter_property_payloads(
+    path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[list[dict]]:
+    """
+    reads a CSV written by Property.to_csv straight into upload payloads, in lists of up to
+    chunk_size, without building Property objects or a DataFrame
+
+    each payload is identical to Property.from_dict(row).to_dict(), and a row that could
+    not be converted raises a ValueError naming its line and column
+    """
+    with open(path, "r", newline="") as f:
+        yield from iter_chunks(_iter_payloads(f, path), chunk_size)
+
+
+def _iter_payloads(f, path: Path) -> Iterator[dict]:
+    reader = csv.reader(f, dialect=csv.unix_dialect)
+    header = next(reader, None)
+    if header is None:
+        return
+    missing = [field for field in REQUIRED_FIELDS if field not in header]
+    if missing:
+        raise ValueError(f"{path} is missing required columns: {', '.join(missing)}")
+    columns = [
+        (field, header.index(field), kind)
+        for field, kind in PAYLOAD_FIELDS
+        if field in header
+    ]
+    loads = json_codec.loads
+    for row in reader:
+        if not row:
+            continue
+        payload = dict()
+        for field, index, kind in columns:
+            if index >= len(row):
+                continue
+            value = row[index]
+            if kind == _TEXT:
+                payload[field] = value
+            elif value:
+                try:
+                    value = float(value) if kind == _NUMBER else loads(value)
+                except ValueError as e:
+                    raise ValueError(
+                        f"{path}:{reader.line_num}: invalid {field} {value!r}"
+                    ) from e
+                if value is not None:
+                    payload[field] = value
+        yield payload
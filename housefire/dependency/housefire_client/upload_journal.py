@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+class UploadJournal:
+    """
+    Local, append-only record of one property update run, so an interrupted run can resume
+    from the work it already committed instead of recomputing against a half-updated server
+
+    The journal is a JSON-lines file named after the run ID, which is a hash of the ticker
+    and the uploaded payloads, so rerunning with the same inputs finds the same journal.
+    It holds the planned diff followed by one entry per completed delete or upload chunk,
+    and is removed once the run completes. A run with other inputs never resumes an older
+    run's journal, so opening one deletes the ticker's other journals and any journal older
+    than MAX_AGE_SECONDS.
+
+    Args:
+        path (Path): path of the journal file
+    """
+
+    MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.planned_deletes: Optional[list[str]] = None
+        self.planned_creates: Optional[list[str]] = None
+        self.deleted_ids: set[str] = set()
+        self.created_address_inputs: set[str] = set()
+        self._lock = threading.Lock()
+        if path.exists():
+            self._load()
+
+    @classmethod
+    def open(
+        cls, journal_dir: Path, ticker: str, payloads: Iterable[dict]
+    ) -> "UploadJournal":
+        """
+        opens the journal for a run, creating the journal directory if needed
+        """
+        os.makedirs(journal_dir, exist_ok=True)
+        run_id = cls.run_id(ticker, payloads)
+        path = Path(journal_dir, f"{ticker}_{run_id}.jsonl")
+        cls._prune(journal_dir, ticker, keep=path)
+        return cls(path)
+
+    @classmethod
+    def _prune(cls, journal_dir: Path, ticker: str, keep: Path) -> None:
+        """
+        deletes the journals of the ticker's other runs, left behind by interrupted runs
+        whose inputs changed before the rerun, and every journal past MAX_AGE_SECONDS
+        """
+        expired = time.time() - cls.MAX_AGE_SECONDS
+        for journal_path in Path(journal_dir).glob("*.jsonl"):
+            if journal_path == keep:
+                continue
+            try:
+                if (
+                    journal_path.name.rsplit("_", 1)[0] == ticker
+                    or journal_path.stat().st_mtime < expired
+                ):
+                    journal_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def run_id(ticker: str, payloads: Iterable[dict]) -> str:
+        digest = hashlib.sha256(ticker.encode())
+        for payload in payloads:
+            digest.update(json.dumps(payload, sort_keys=True).encode())
+        return digest.hexdigest()[:16]
+
+    @property
+    def has_plan(self) -> bool:
+        return self.planned_deletes is not None and self.planned_creates is not None
+
+    def remaining_deletes(self) -> list[str]:
+        return [i for i in self.planned_deletes or [] if i not in self.deleted_ids]
+
+    def remaining_creates(self) -> set[str]:
+        return {
+            a
+            for a in self.planned_creates or []
+            if a not in self.created_address_inputs
+        }
+
+    def record_plan(self, to_delete: list[str], to_create: list[str]) -> None:
+        self.planned_deletes = list(to_delete)
+        self.planned_creates = list(to_create)
+        self._append({"event": "plan", "delete": to_delete, "create": to_create})
+
+    def record_deleted(self, property_ids: Iterable[str]) -> None:
+        property_ids = list(property_ids)
+        with self._lock:
+            self.deleted_ids.update(property_ids)
+        self._append({"event": "deleted", "ids": property_ids})
+
+    def record_created(self, address_inputs: Iterable[str]) -> None:
+        address_inputs = list(address_inputs)
+        with self._lock:
+            self.created_address_inputs.update(address_inputs)
+        self._append({"event": "created", "addressInputs": address_inputs})
+
+    def complete(self) -> None:
+        """
+        removes the journal once every planned change is committed
+        """
+        if self.path.exists():
+            os.remove(self.path)
+
+    def _append(self, entry: dict) -> None:
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            with open(self.path, "a") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _load(self) -> None:
+        with open(self.path, "rb") as f:
+            content = f.read()
+        complete_length = content.rfind(b"\n") + 1
+        if complete_length < len(content):
+            # a crash mid-write can leave a torn last line, which never committed, cut it
+            # off so the next entry is not appended onto it
+            with open(self.path, "r+b") as f:
+                f.truncate(complete_length)
+        for line in content[:complete_length].splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry["event"] == "plan":
+                self.planned_deletes = entry["delete"]
+                self.planned_creates = entry["create"]
+            elif entry["event"] == "deleted":
+                self.deleted_ids.update(entry["ids"])
+            elif entry["event"] == "created":
+                self.created_address_inputs.update(entry["addressInputs"])
@@ -0,0 +1,21 @@
+from pathlib import Path
+
+# formats the CLI can write scrape and transform artifacts in, and read them back from
+FILE_FORMATS = ("csv", "parquet", "jsonl")
+DEFAULT_FILE_FORMAT = "csv"
+
+
+def infer_file_format(path: Path) -> str:
+    """
+    the format of a file from its extension, defaulting to CSV for unknown extensions
+    """
+    suffix = Path(path).suffix.lower().lstrip(".")
+    return suffix if suffix in FILE_FORMATS else DEFAULT_FILE_FORMAT
+
+
+def check_file_format(file_format: str) -> str:
+    if file_format not in FILE_FORMATS:
+        raise ValueError(
+            f"unsupported file format {file_format}, expected one of {FILE_FORMATS}"
+        )
+    return file_format
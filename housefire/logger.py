@@ -1,38 +1,218 @@
+import atexit
+import copy
+import gzip
+import json
 import logging
 import logging.handlers
+import multiprocessing
+import os
+import queue
+import shutil
 import sys
-import os.path
+import threading
+from collections.abc import Mapping, Sized
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+
+class Summary:
+    """
+    Lazy summary of a possibly large value for log messages, rendering only its size and
+    the first few items, and only when a handler formats the record
+
+    Args:
+        value (Any): the value to summarize
+        sample (int): how many items to show
+        max_chars (int): longest rendering of a single item before it is truncated
+    """
+
+    __slots__ = ("value", "sample", "max_chars")
+
+    def __init__(self, value: Any, sample: int = 3, max_chars: int = 200):
+        self.value = value
+        self.sample = sample
+        self.max_chars = max_chars
+
+    def __str__(self) -> str:
+        value = self.value
+        if isinstance(value, (str, bytes)) or not isinstance(value, Sized):
+            return self._truncate(repr(value))
+        items = value.items() if isinstance(value, Mapping) else value
+        head = []
+        for item in items:
+            if len(head) == self.sample:
+                break
+            head.append(self._truncate(repr(item)))
+        more = ", ..." if len(value) > len(head) else ""
+        return f"{len(value)} items [{', '.join(head)}{more}]"
+
+    __repr__ = __str__
+
+    def _truncate(self, text: str) -> str:
+        if len(text) <= self.max_chars:
+            return text
+        return f"{text[: self.max_chars]}... ({len(text)} chars)"
+
+
+class Lazy:
+    """
+    Log argument computed by function only when a handler formats the record, for values
+    that cost something to build, such as the text of a list of page elements
+    """
+
+    __slots__ = ("function",)
+
+    def __init__(self, function: Callable[[], Any]):
+        self.function = function
+
+    def __str__(self) -> str:
+        return str(self.function())
+
+    __repr__ = __str__
+
+
+def summarize(value: Any, sample: int = 3, max_chars: int = 200) -> Summary:
+    """
+    a lazy summary of value to pass as a %s argument of a log call
+    """
+    return Summary(value, sample, max_chars)
+
+
+def log_event(logger: logging.Logger, level: int, event: str, **fields: Any) -> None:
+    """
+    logs event followed by key=value pairs, building nothing unless logger is enabled for
+    level, with collection values summarized and the raw fields attached to the record
+    as record.fields for structured handlers
+    """
+    if not logger.isEnabledFor(level):
+        return
+    rendered = {
+        key: (
+            summarize(value)
+            if isinstance(value, Sized) and not isinstance(value, (str, bytes))
+            else value
+        )
+        for key, value in fields.items()
+    }
+    logger.log(
+        level,
+        "%s %s",
+        event,
+        Lazy(lambda: " ".join(f"{key}={value}" for key, value in rendered.items())),
+        extra={"fields": fields},
+        stacklevel=2,
+    )
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats each record as one JSON object per line, with the fields given to log_event as
+    top level keys, collections among them summarized
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in getattr(record, "fields", {}).items():
+            entry.setdefault(
+                key,
+                (
+                    value
+                    if value is None or isinstance(value, (str, int, float, bool))
+                    else str(summarize(value))
+                ),
+            )
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Queues records with their message rendered and their traceback kept as exc_text, so
+    the listener's formatter, not the queue, decides where the traceback goes
+
+    The stock prepare formats the whole record into msg and clears exc_info and exc_text,
+    which leaves JsonLinesFormatter with the traceback inside the message.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = record.getMessage()
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        if record.exc_info:
+            # the traceback cannot be pickled or kept alive, only its text is queued
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _init_worker_logging(log_queue: multiprocessing.Queue, level: int) -> None:
+    """
+    runs in each worker process, replacing the handler a forked worker inherits, whose
+    queue no listener drains, with one queueing records for the parent's listener
+    """
+    base_housefire_logger = logging.getLogger("housefire")
+    for handler in list(base_housefire_logger.handlers):
+        base_housefire_logger.removeHandler(handler)
+    base_housefire_logger.setLevel(level)
+    base_housefire_logger.addHandler(_QueueHandler(log_queue))
+
+
+def _gzip_rotator(source: str, destination: str) -> None:
+    with open(source, "rb") as f_in, gzip.open(destination, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
 
 
 class HousefireLoggerFactory:
+    """
+    Configures the housefire logger once per process and hands out its child loggers
+
+    Log calls only put records on a queue, and a QueueListener thread writes them to the
+    rotating log file, and the console in development, so file I/O never runs on the
+    thread that logged, such as the asyncio thread driving the browser. Creating another
+    factory with the same settings reuses the running pipeline, and different settings
+    replace it, so records are never written twice.
+
+    Args:
+        deploy_env (str): development logs at DEBUG and to the console too, otherwise INFO
+        log_dir_path (str): directory of housefire.log
+        json_lines (bool): write one JSON object per record instead of text lines
+        compress_rotated (bool): gzip log files as they are rotated out
+    """
+
+    _lock = threading.Lock()
+    _settings: Optional[tuple] = None
+    _queue_handler: Optional[_QueueHandler] = None
+    _listener: Optional[logging.handlers.QueueListener] = None
+
     def __init__(
-        self, deploy_env: str, log_dir_path: str
-    ):  # Add log_dir_path parameter
+        self,
+        deploy_env: str,
+        log_dir_path: str,
+        json_lines: bool = False,
+        compress_rotated: bool = False,
+    ):
         base_housefire_logger = logging.getLogger("housefire")
         base_housefire_logger.setLevel(
             logging.DEBUG if deploy_env == "development" else logging.INFO
         )
-
-        base_housefire_format = logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(name)s - %(message)s",
-            datefmt="%Y-%m-%dT%H:%M:%SZ",
-        )
-
-        if not os.path.exists(log_dir_path) or not os.path.isdir(log_dir_path):
-            os.mkdir(log_dir_path)
-        base_housefire_handler = logging.handlers.RotatingFileHandler(
-            os.path.join(log_dir_path, "housefire.log"),  # Use log_dir_path
-            backupCount=5,
-            maxBytes=5000000,
-        )
-
-        base_housefire_handler.setFormatter(base_housefire_format)
-        base_housefire_logger.addHandler(base_housefire_handler)
-
-        if deploy_env == "development":
-            base_housefire_console_handler = logging.StreamHandler()
-            base_housefire_console_handler.setFormatter(base_housefire_format)
-            base_housefire_logger.addHandler(base_housefire_console_handler)
+        settings = (deploy_env, log_dir_path, json_lines, compress_rotated)
+        with HousefireLoggerFactory._lock:
+            if HousefireLoggerFactory._settings != settings:
+                HousefireLoggerFactory._stop()
+                HousefireLoggerFactory._start(base_housefire_logger, *settings)
 
         # catch all uncaught exceptions for logging
         def handle_exception(exc_type, exc_value, exc_traceback):
@@ -51,3 +231,99 @@ class HousefireLoggerFactory:
 
     def get_logger(self, name: str) -> logging.Logger:
         return self._base_housefire_logger.getChild(name)
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        writes every queued record and detaches the pipeline, also run at exit
+        """
+        with cls._lock:
+            cls._stop()
+
+    @classmethod
+    @contextmanager
+    def process_pool_logging(
+        cls, mp_context: Optional[Any] = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        keyword arguments for a ProcessPoolExecutor whose workers, started with mp_context
+        or the default start method, log to this process's handlers, through a queue
+        drained until the context exits, so the pool must be shut down inside it, only
+        mp_context if no factory has configured logging
+        """
+        with cls._lock:
+            listener = cls._listener
+        mp_context = mp_context or multiprocessing.get_context()
+        if listener is None:
+            yield dict(mp_context=mp_context)
+            return
+        log_queue: multiprocessing.Queue = mp_context.Queue()
+        worker_listener = logging.handlers.QueueListener(log_queue, *listener.handlers)
+        worker_listener.start()
+        try:
+            yield dict(
+                mp_context=mp_context,
+                initializer=_init_worker_logging,
+                initargs=(log_queue, logging.getLogger("housefire").level),
+            )
+        finally:
+            worker_listener.stop()
+            log_queue.close()
+            log_queue.join_thread()
+
+    @classmethod
+    def _start(
+        cls,
+        base_housefire_logger: logging.Logger,
+        deploy_env: str,
+        log_dir_path: str,
+        json_lines: bool,
+        compress_rotated: bool,
+    ) -> None:
+        base_housefire_format = (
+            JsonLinesFormatter(datefmt="%Y-%m-%dT%H:%M:%SZ")
+            if json_lines
+            else logging.Formatter(
+                "%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+                datefmt="%Y-%m-%dT%H:%M:%SZ",
+            )
+        )
+
+        if not os.path.exists(log_dir_path) or not os.path.isdir(log_dir_path):
+            os.mkdir(log_dir_path)
+        base_housefire_handler = logging.handlers.RotatingFileHandler(
+            os.path.join(log_dir_path, "housefire.log"),
+            backupCount=5,
+            maxBytes=5000000,
+        )
+        if compress_rotated:
+            base_housefire_handler.namer = lambda name: f"{name}.gz"
+            base_housefire_handler.rotator = _gzip_rotator
+        handlers: list[logging.Handler] = [base_housefire_handler]
+
+        if deploy_env == "development":
+            handlers.append(logging.StreamHandler())
+        for handler in handlers:
+            handler.setFormatter(base_housefire_format)
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        cls._queue_handler = _QueueHandler(log_queue)
+        cls._listener = logging.handlers.QueueListener(log_queue, *handlers)
+        cls._listener.start()
+        base_housefire_logger.addHandler(cls._queue_handler)
+        cls._settings = (deploy_env, log_dir_path, json_lines, compress_rotated)
+
+    @classmethod
+    def _stop(cls) -> None:
+        if cls._listener is None:
+            return
+        logging.getLogger("housefire").removeHandler(cls._queue_handler)
+        cls._listener.stop()
+        for handler in cls._listener.handlers:
+            handler.close()
+        cls._queue_handler = None
+        cls._listener = None
+        cls._settings = None
+
+
+atexit.register(HousefireLoggerFactory.shutdown)
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from logging import Logger
+from pathlib import Path
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
+
+from housefire.logger import log_event
+
+if TYPE_CHECKING:
+    from housefire.dependency.housefire_client.client import HousefireClient
+    from housefire.dependency.housefire_client.property_batch import PropertyBatch
+    from housefire.scraper.scraper import Scraper, ScrapeResult
+    from housefire.transformer.transformer import Transformer, TransformResult
+
+    # a chunk and the future of its transform
+    RunningChunk = tuple[list[ScrapeResult], asyncio.Future[list[TransformResult]]]
+
+
+@dataclass
+class PipelineSettings:
+    """Sizes of the chunks handed between pipeline stages and of the queues holding them"""
+
+    # rows per chunk handed from the scrape to the transform and on to the upload
+    chunk_size: int = 500
+    # chunks each queue holds before the stage feeding it waits for the next to catch up
+    queue_size: int = 4
+
+    def __post_init__(self):
+        if self.chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if self.queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+
+
+class StagedPipeline:
+    """
+    Scrapes a ticker, transforms the scraped rows, and uploads the transformed properties as
+    concurrent stages joined by bounded queues, so a chunk is transformed, geocoded
+    included, as soon as it is scraped and uploaded as soon as it is transformed
+
+    The run takes about as long as its slowest stage instead of the sum of all three.
+    Up to the transformer's transform_workers chunks are transformed at once, in threads,
+    or in its process pool if it is side effect free, and are then finished in the order
+    they were scraped, so duplicates are dropped the same way however long each chunk
+    took. Uploads run up to the client's max_chunks_in_flight requests at once.
+
+    Transformed chunks wait for the upload, and a chunk keeps its transform slot until it
+    is queued for upload, so a slow upload holds back the transform. The scrape is never
+    held back: scrapers call the result sink without awaiting, so rows arriving while the
+    transform queue is full wait in an unbounded buffer in the sink until it has room.
+    Every scraper also keeps its own list of results until the scrape returns, so memory
+    still grows with the size of the scrape, only the transformed and uploaded chunks in
+    flight are bounded.
+
+    Stale properties are deleted once the last chunk is uploaded, see
+    StreamingPropertyUpdate, so a failed run never deletes anything.
+
+    Args:
+        scraper (Scraper): scraper for the ticker
+        transformer (Transformer): transformer for the ticker
+        client (HousefireClient): client to upload with
+        ticker (str): the ticker to update
+        settings (PipelineSettings): chunk and queue sizes
+        scrape (Callable[[], Awaitable]): runs the scrape, scraper.scrape by default, for
+            callers that also save the scraped rows
+        on_transformed (Callable[[list[TransformResult]], None]): called with each
+            transformed chunk before it is queued for upload, for example to save it
+        dead_letter_path (Path): file to write rejected rows to, not written when None
+        logger (Logger): logger for progress reporting, defaults to a child of the housefire logger
+    """
+
+    def __init__(
+        self,
+        scraper: Scraper,
+        transformer: Transformer,
+        client: HousefireClient,
+        ticker: str,
+        settings: Optional[PipelineSettings] = None,
+        scrape: Optional[Callable[[], Awaitable[object]]] = None,
+        on_transformed: Optional[Callable[[list[TransformResult]], None]] = None,
+        dead_letter_path: Optional[Path] = None,
+        logger: Optional[Logger] = None,
+    ):
+        self.scraper = scraper
+        self.transformer = transformer
+        self.client = client
+        self.ticker = ticker
+        self.settings = settings or PipelineSettings()
+        self.scrape = scrape or scraper.scrape
+        self.on_transformed = on_transformed
+        self.dead_letter_path = dead_letter_path
+        self.logger = logger or logging.getLogger("housefire").getChild(
+            StagedPipeline.__name__
+        )
+        self.scraped_rows = 0
+        self.transformed_rows = 0
+        self.uploaded_rows = 0
+
+    async def run(self) -> PropertyBatch:
+        """
+        runs every stage to completion, returning a PropertyBatch of the IDs and address
+        inputs of the created properties, the other stages are cancelled if any stage fails
+        and PartialUploadError is raised if the API rejected any rows
+        """
+        scraped: asyncio.Queue[Optional[list[ScrapeResult]]] = asyncio.Queue(
+            self.settings.queue_size
+        )
+        # chunks being transformed, in the order they were scraped, at most one per slot
+        running: asyncio.Queue[Optional[RunningChunk]] = asyncio.Queue()
+        slots = asyncio.Semaphore(self.transformer.transform_workers)
+        transformed: asyncio.Queue[Optional[list[TransformResult]]] = asyncio.Queue(
+            self.settings.queue_size
+        )
+        with self.transformer.chunk_stages(concurrent=True) as (execute, finish):
+            tasks = [
+                asyncio.ensure_future(self._scrape_stage(scraped)),
+                asyncio.ensure_future(
+                    self._transform_stage(scraped, running, slots, execute)
+                ),
+                asyncio.ensure_future(
+                    self._finish_stage(running, transformed, slots, finish)
+                ),
+                asyncio.ensure_future(self._upload_stage(transformed)),
+            ]
+            try:
+                *_, created = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        log_event(
+            self.logger,
+            logging.INFO,
+            "pipeline complete",
+            ticker=self.ticker,
+            scraped=self.scraped_rows,
+            transformed=self.transformed_rows,
+            created=len(created),
+        )
+        return created
+
+    async def _scrape_stage(
+        self, scraped: asyncio.Queue[Optional[list[ScrapeResult]]]
+    ) -> None:
+        chunk_size = self.settings.chunk_size
+        # full chunks the queue had no room for, unbounded since the scrape is never held
+        # back, and the chunk being filled
+        pending: deque[list[ScrapeResult]] = deque()
+        current: list[ScrapeResult] = list()
+        previous_sink = self.scraper.result_sink
+
+        def sink(result: ScrapeResult) -> None:
+            nonlocal current
+            if previous_sink is not None:
+                previous_sink(result)
+            self.scraped_rows += 1
+            current.append(result)
+            if len(current) >= chunk_size:
+                pending.append(current)
+                current = list()
+            while pending and not scraped.full():
+                scraped.put_nowait(pending.popleft())
+
+        self.scraper.result_sink = sink
+        try:
+            # the scraper's own list of results is dropped, the chunks carry the rows
+            await self.scrape()
+        finally:
+            self.scraper.result_sink = previous_sink
+        if current:
+            pending.append(current)
+        while pending:
+            await scraped.put(pending.popleft())
+        await scraped.put(None)
+
+    async def _transform_stage(
+        self,
+        scraped: asyncio.Queue[Optional[list[ScrapeResult]]],
+        running: asyncio.Queue[Optional[RunningChunk]],
+        slots: asyncio.Semaphore,
+        execute: Callable[[list[ScrapeResult]], list[TransformResult]],
+    ) -> None:
+        while True:
+            # the slot is released by the finish stage once the chunk is queued for upload
+            await slots.acquire()
+            if (chunk := await scraped.get()) is None:
+                break
+            # geocoding blocks, so chunks are transformed off the event loop
+            execution = asyncio.ensure_future(asyncio.to_thread(execute, chunk))
+            running.put_nowait((chunk, execution))
+        running.put_nowait(None)
+
+    async def _finish_stage(
+        self,
+        running: asyncio.Queue[Optional[RunningChunk]],
+        transformed: asyncio.Queue[Optional[list[TransformResult]]],
+        slots: asyncio.Semaphore,
+        finish: Callable[
+            [list[ScrapeResult], list[TransformResult]], list[TransformResult]
+        ],
+    ) -> None:
+        try:
+            while (item := await running.get()) is not None:
+                chunk, execution = item
+                results = finish(chunk, await execution)
+                self.transformed_rows += len(results)
+                if self.on_transformed is not None:
+                    self.on_transformed(results)
+                await transformed.put(results)
+                slots.release()
+        except BaseException:
+            # the transforms of later chunks are abandoned with this one
+            while not running.empty():
+                if (item := running.get_nowait()) is not None:
+                    item[1].cancel()
+            raise
+        await transformed.put(None)
+
+    async def _upload_stage(
+        self, transformed: asyncio.Queue[Optional[list[TransformResult]]]
+    ) -> PropertyBatch:
+        # the existing properties are fetched while the first chunks are scraped
+        update = await asyncio.to_thread(
+            self.client.start_streaming_update,
+            self.ticker.upper(),
+            self.dead_letter_path,
+        )
+        while (results := await transformed.get()) is not None:
+            self.uploaded_rows += await asyncio.to_thread(
+                update.upload, [d.property for d in results]
+            )
+        return await asyncio.to_thread(update.finish)
@@ -0,0 +1,107 @@
+import importlib.metadata
+import threading
+from typing import Any, Optional
+
+# the distribution whose entry points register the built-in tickers
+DISTRIBUTION = "housefire"
+
+# entry point groups other packages can register REIT scrapers and transformers under
+SCRAPER_GROUP = "housefire.scrapers"
+TRANSFORMER_GROUP = "housefire.transformers"
+
+# the built-in tickers for a source checkout that is not installed and so has no entry
+# points, they must match the entry points pyproject.toml registers, which test_registry checks
+SCRAPER_MANIFEST = {
+    "pld": "housefire.scraper.reits_by_ticker.pld:PldScraper",
+    "spg": "housefire.scraper.reits_by_ticker.spg:SpgScraper",
+    "dlr": "housefire.scraper.reits_by_ticker.dlr:DlrScraper",
+    "well": "housefire.scraper.reits_by_ticker.well:WellScraper",
+    "eqix": "housefire.scraper.reits_by_ticker.eqix:EqixScraper",
+}
+TRANSFORMER_MANIFEST = {
+    "pld": "housefire.transformer.reits_by_ticker.pld:PldTransformer",
+    "spg": "housefire.transformer.reits_by_ticker.spg:SpgTransformer",
+    "dlr": "housefire.transformer.reits_by_ticker.dlr:DlrTransformer",
+    "well": "housefire.transformer.reits_by_ticker.well:WellTransformer",
+    "eqix": "housefire.transformer.reits_by_ticker.eqix:EqixTransformer",
+}
+
+
+class TickerRegistry:
+    """
+    Ticker names mapped to "module:Class" references, read from installed entry points and
+    a built-in manifest without importing any ticker module, so listing tickers costs the
+    same however many REITs are registered and a ticker's module is only imported when its
+    class is loaded
+
+    Installed entry points are the single source of tickers, the manifest is only a
+    fallback for the built-in tickers when housefire itself is not installed, such as when
+    running from a source checkout, and entry points still take precedence over it there.
+
+    Args:
+        group (str): the entry point group to read
+        manifest (dict[str, str]): the built-in references by ticker
+    """
+
+    def __init__(self, group: str, manifest: dict[str, str]):
+        self.group = group
+        self.manifest = manifest
+        self._references: Optional[dict[str, importlib.metadata.EntryPoint]] = None
+        self._loaded: dict[str, Any] = dict()
+        self._lock = threading.Lock()
+
+    def names(self) -> set[str]:
+        return set(self._get_references())
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._get_references()
+
+    def reference(self, ticker: str) -> str:
+        """
+        the "module:Class" the ticker loads, without importing it
+        """
+        return self._get_references()[ticker].value
+
+    def load(self, ticker: str) -> Any:
+        """
+        imports and returns the ticker's class, raising ValueError for unknown tickers
+        """
+        references = self._get_references()
+        if ticker not in references:
+            raise ValueError(f"Unsupported ticker: {ticker}")
+        if ticker not in self._loaded:
+            self._loaded[ticker] = references[ticker].load()
+        return self._loaded[ticker]
+
+    def _get_references(self) -> dict[str, importlib.metadata.EntryPoint]:
+        """
+        reads the entry points once, since scanning installed distributions is the slow part
+        """
+        with self._lock:
+            if self._references is None:
+                references = (
+                    dict()
+                    if _is_installed()
+                    else {
+                        ticker: importlib.metadata.EntryPoint(
+                            name=ticker, value=value, group=self.group
+                        )
+                        for ticker, value in self.manifest.items()
+                    }
+                )
+                for entry_point in importlib.metadata.entry_points(group=self.group):
+                    references[entry_point.name] = entry_point
+                self._references = references
+            return self._references
+
+
+def _is_installed() -> bool:
+    try:
+        importlib.metadata.distribution(DISTRIBUTION)
+    except importlib.metadata.PackageNotFoundError:
+        return False
+    return True
+
+
+SCRAPERS = TickerRegistry(SCRAPER_GROUP, SCRAPER_MANIFEST)
+TRANSFORMERS = TickerRegistry(TRANSFORMER_GROUP, TRANSFORMER_MANIFEST)
@@ -0,0 +1,37 @@
+# columns of the Prologis property search export, shared by the scraper, which saves
+# only these, and the transformer, which reads them, without either importing the other
+
+# export columns mapped to Property fields
+COLUMN_NAMES_MAP = {
+    "Property Name": "name",
+    "Street Address 1": "address",
+    "Street Address 2": "address2",
+    "Neighborhood": "neighborhood",
+    "City": "city",
+    "State": "state",
+    "Postal Code": "zip",
+    "Country": "country",
+    "Latitude": "latitude",
+    "Longitude": "longitude",
+    "Available Square Footage": "squareFootage",
+}
+# export columns kept as facts, with their fact labels
+FACTS_FIELD_MAP = (
+    ("Available Date", "Available Date"),
+    ("Market Property Type", "Market Property Type"),
+    ("Truck Court Depth", "Truck Court Depth"),
+    ("Rail Served", "Rail Served"),
+    *((f"Key Feature {index}", f"Key Feature {index}") for index in range(1, 7)),
+    ("Unit Name", "Unit Name"),
+    ("Unit Office Size", "Unit Office Size"),
+    ("# of Grade Level Doors", "Grade Level Doors"),
+    ("Warehouse Lighting Type", "Warehouse Lighting Type"),
+    ("Clear Height", "Clear Height"),
+    ("Main Breaker Size (AMPS)", "Main Breaker Size (AMPS)"),
+    ("Fire Suppression System", "Fire Suppression System"),
+    ("# of Dock High Doors", "Dock High Doors"),
+)
+EXPORT_FIELDS = (
+    *COLUMN_NAMES_MAP,
+    *(source_field for source_field, _ in FACTS_FIELD_MAP),
+)
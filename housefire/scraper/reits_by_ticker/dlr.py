@@ -5,10 +5,28 @@ from urllib.parse import urljoin
 import nodriver as uc
 
 from housefire.scraper.scraper import Scraper, ScrapeResult
+from housefire.logger import summarize
 
 
 class DlrScraper(Scraper):
     base_url = "https://www.digitalrealty.com"
+    result_fields = (
+        "name",
+        "facility_code",
+        "description",
+        "address_input",
+        "facility_brochure_url",
+        "square_footage",
+        "building_structure",
+        "total_building_size",
+        "ups_redundancy",
+        "cooling_redundancy",
+        "compliance_certifications",
+        "sustainability_energy_label",
+        "sustainability_energy_value",
+        "sustainability_certifications",
+        "security_infrastructure",
+    )
 
     async def execute_scrape(self) -> list[ScrapeResult]:
         start_url = f"{self.base_url}/data-centers"
@@ -20,7 +38,7 @@ class DlrScraper(Scraper):
         try:
             root_tab = await self.driver.get(start_url)
             region_urls = await self._digital_realty_scrape_region_urls(root_tab)
-            self.logger.debug(f"found property urls: {region_urls}")
+            self.logger.debug("found region urls: %s", summarize(region_urls))
 
             for region_url in region_urls:
                 await self._jiggle()
@@ -36,7 +54,7 @@ class DlrScraper(Scraper):
                             detail_urls.append(detail_url)
                 except Exception as error:
                     self.logger.warning(
-                        f"error scraping property: {region_url}, {error}"
+                        "error scraping region: %s, %s", region_url, error
                     )
                 finally:
                     if metro_tab is not None:
@@ -49,11 +67,13 @@ class DlrScraper(Scraper):
                     detail_tab = await self.driver.get(detail_url, new_tab=True)
                     await self._wait(30)
                     results.append(
-                        await self._digital_realty_scrape_single_detail(detail_tab)
+                        self._emit(
+                            await self._digital_realty_scrape_single_detail(detail_tab)
+                        )
                     )
                 except Exception as error:
                     self.logger.warning(
-                        f"error scraping property: {detail_url}, {error}"
+                        "error scraping property: %s, %s", detail_url, error
                     )
                 finally:
                     if detail_tab is not None:
@@ -224,7 +244,7 @@ class DlrScraper(Scraper):
 
     async def _debug_scrape(self) -> list[ScrapeResult]:
         start_url = f"{self.base_url}/data-centers/americas/chicago/ch1"
-        self.logger.debug(f"debug scraping for {self.ticker} at {start_url}")
+        self.logger.debug("debug scraping for %s at %s", self.ticker, start_url)
         tab = await self.driver.get(start_url)
         try:
             await self._wait(30)
@@ -1,5 +1,7 @@
 from housefire.scraper.scraper import Scraper, ScrapeResult
+from housefire.logger import summarize
 from housefire.dependency.housefire_client.housefire_object import Property
+from housefire.scraper.pld_export import EXPORT_FIELDS
 import nodriver as uc
 import os
 import csv
@@ -10,6 +12,9 @@ class PldScraper(Scraper):
     scraper for Prologis, scrapes CSV from website
     """
 
+    # the export has many more columns than the transformer reads
+    result_fields = EXPORT_FIELDS
+
     def __init__(self):
         super().__init__()
 
@@ -45,17 +50,19 @@ class PldScraper(Scraper):
             raise Exception("could not find downloaded csv")
 
         self.logger.debug(
-            f"downloaded pld csv, self.temp_dir_path: {self.temp_dir_path}, files: {file_list}"
+            "downloaded pld csv, self.temp_dir_path: %s, files: %s",
+            self.temp_dir_path,
+            summarize(file_list),
         )
 
         # get the downloaded file, hacky but works
         filepath = os.path.join(self.temp_dir_path, file_list[0])
-        self.logger.debug(f"reading csv file: {filepath}")
+        self.logger.debug("reading csv file: %s", filepath)
         data: list[ScrapeResult] = []
         with open(filepath, "r") as f:
             reader = csv.DictReader(f, dialect=csv.unix_dialect)
             for row in reader:
-                data.append(ScrapeResult(row))
+                data.append(self._emit(ScrapeResult(self._project(row))))
         self.logger.debug("deleting csv")
         os.remove(filepath)
         return data
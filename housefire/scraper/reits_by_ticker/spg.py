@@ -1,9 +1,12 @@
 import nodriver as uc
 from housefire.scraper.scraper import Scraper, ScrapeResult
+from housefire.logger import summarize
 from housefire.dependency.housefire_client.housefire_object import Property
 
 
 class SpgScraper(Scraper):
+    result_fields = ("name", "address_input")
+
     def __init__(self):
         super().__init__()
 
@@ -43,25 +46,25 @@ class SpgScraper(Scraper):
         properties_div = await tab.query_selector(".mall-list")
         property_link_elements = await properties_div.query_selector_all("a")
         property_links = [element.attrs["href"] for element in property_link_elements]
-        self.logger.debug(f"found property links: {property_links}")
+        self.logger.debug("found property links: %s", summarize(property_links))
 
         property_names = [
             (await element.query_selector(".mall-list-item-name")).text
             for element in property_link_elements
         ]
-        self.logger.debug(f"found property names: {property_names}")
+        self.logger.debug("found property names: %s", summarize(property_names))
 
         property_locations = [
             (await element.query_selector(".mall-list-item-location")).text
             for element in property_link_elements
         ]
-        self.logger.debug(f"found property locations: {property_locations}")
+        self.logger.debug("found property locations: %s", summarize(property_locations))
 
         return property_links, property_names, property_locations
 
     async def _debug_scrape(self):
         start_url = "https://www.simon.com/mall"
-        self.logger.debug(f"starting debug scrape for {self.ticker} on {start_url}")
+        self.logger.debug("starting debug scrape for %s on %s", self.ticker, start_url)
         tab = await self.driver.get(start_url)
         links, names, locations = await self._simon_scrape_property_mall(tab)
 
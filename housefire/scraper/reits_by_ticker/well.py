@@ -1,9 +1,12 @@
 import nodriver as uc
 from housefire.scraper.scraper import Scraper, ScrapeResult
+from housefire.logger import summarize
 from housefire.dependency.housefire_client.housefire_object import Property
 
 
 class WellScraper(Scraper):
+    result_fields = ("name", "address_input")
+
     def __init__(self):
         super().__init__()
 
@@ -13,16 +16,16 @@ class WellScraper(Scraper):
 
         results: list[ScrapeResult] = list()
         property_urls = await self._welltower_scrape_property_urls(tab)
-        self.logger.debug(f"found property urls: {property_urls}")
+        self.logger.debug("found property urls: %s", summarize(property_urls))
 
         for property_url in property_urls:
             await self._jiggle()
             property_tab = await self.driver.get(property_url, new_tab=True)
             try:
                 result = await self._welltower_scrape_single_property(property_tab)
-                results.append(result)
+                results.append(self._emit(result))
             except Exception as e:
-                self.logger.warning(f"error scraping property: {property_url}, {e}")
+                self.logger.warning("error scraping property: %s, %s", property_url, e)
             finally:
                 await property_tab.close()
 
@@ -1,18 +1,39 @@
 from abc import ABC, abstractmethod
 import csv
+import os
 from dataclasses import dataclass
 from logging import Logger
-import nodriver as uc
 import random as r
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional
+
+import pandas as pd
+
+from housefire.dependency.housefire_client import json_codec
+from housefire.dependency.housefire_client.housefire_object import (
+    DEFAULT_CHUNK_SIZE,
+    iter_chunks,
+)
+from housefire.file_format import check_file_format, infer_file_format
+from housefire.logger import summarize
+
+if TYPE_CHECKING:
+    import nodriver as uc
 
 
 class Scraper(ABC):
 
-    driver: uc.Browser
+    driver: "uc.Browser"
     temp_dir_path: str
     ticker: str
     logger: Logger
+    # property info keys the scraper usually produces, in output column order
+    result_fields: tuple[str, ...] = ()
+    # called with each result as soon as it is scraped, for example to stream it to disk
+    result_sink: Optional[Callable[["ScrapeResult"], None]] = None
+    # keep every column of a downloaded export instead of projecting it to result_fields
+    keep_raw_fields: bool = False
+    _emitted_results = 0
 
     def __init__(self):
         pass
@@ -31,12 +52,41 @@ class Scraper(ABC):
     async def scrape(self) -> list["ScrapeResult"]:
         """
         Scrape data and log
+
+        results a scraper does not pass to _emit as it goes are sent to the result sink
+        once the scrape finishes
         """
-        self.logger.debug(f"Scraping data for REIT: {self.ticker}")
+        self.logger.debug("Scraping data for REIT: %s", self.ticker)
+        self._emitted_results = 0
         scraped_data = await self.execute_scrape()
-        self.logger.debug(f"Scraped data for REIT: {self.ticker}")
+        if self.result_sink is not None and self._emitted_results == 0:
+            for result in scraped_data:
+                self.result_sink(result)
+        self.logger.debug(
+            "Scraped data for REIT: %s, results: %s",
+            self.ticker,
+            summarize(scraped_data),
+        )
         return scraped_data
 
+    def _emit(self, result: "ScrapeResult") -> "ScrapeResult":
+        """
+        passes a freshly scraped result to the result sink, returning it
+        """
+        if self.result_sink is not None:
+            self.result_sink(result)
+        self._emitted_results += 1
+        return result
+
+    def _project(self, row: dict[str, str]) -> dict[str, str]:
+        """
+        keeps only the result_fields of a raw row, such as a row of a downloaded export,
+        unless keep_raw_fields is set or the scraper declares no result_fields
+        """
+        if self.keep_raw_fields or not self.result_fields:
+            return row
+        return {key: row[key] for key in self.result_fields if key in row}
+
     async def _jiggle(self):
         """
         pauses for a random amount of seconds between 10 and 70
@@ -44,7 +94,7 @@ class Scraper(ABC):
         returns the amount of time jiggled
         """
         jiggle_time = r.randint(10, 70)
-        self.logger.debug(f"Jiggling for {jiggle_time} seconds")
+        self.logger.debug("Jiggling for %d seconds", jiggle_time)
         await self.driver.wait(jiggle_time)
         return jiggle_time
 
@@ -54,7 +104,7 @@ class Scraper(ABC):
 
         returns the amount of time waited
         """
-        self.logger.debug(f"Waiting for {seconds} seconds")
+        self.logger.debug("Waiting for %s seconds", seconds)
         await self.driver.wait(seconds)
         return seconds
 
@@ -64,18 +114,260 @@ class ScrapeResult:
     property_info: dict[str, str]
 
     @staticmethod
-    def to_csv(data: list["ScrapeResult"], destination_file: Path) -> None:
-        all_property_info_keys = {k for d in data for k in d.property_info.keys()}
-        with open(destination_file, "w") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=all_property_info_keys, dialect=csv.unix_dialect
-            )
-            writer.writeheader()
+    def to_csv(data: Iterable["ScrapeResult"], destination_file: Path) -> None:
+        """
+        writes results in a single pass, with columns in the order keys are first seen
+        """
+        with ScrapeResultWriter(destination_file) as writer:
             for d in data:
-                writer.writerow(d.property_info)
+                writer.write(d)
 
     @staticmethod
-    def from_csv(file_path: Path) -> list["ScrapeResult"]:
+    def from_csv(
+        file_path: Path, fields: Optional[Iterable[str]] = None
+    ) -> list["ScrapeResult"]:
+        """
+        reads results from CSV, keeping only the columns in fields if given
+        """
         with open(file_path, "r") as f:
-            reader = csv.DictReader(f, dialect=csv.unix_dialect)
-            return [ScrapeResult(property_info=row) for row in reader]
+            return [
+                ScrapeResult(property_info=row) for row in _iter_csv_rows(f, fields)
+            ]
+
+    @staticmethod
+    def to_parquet(data: list["ScrapeResult"], destination_file: Path) -> None:
+        """
+        writes a zstd-compressed Parquet file with one string column per property info key,
+        null where a row does not have the key
+        """
+        frame = pd.DataFrame.from_records([d.property_info for d in data])
+        frame.to_parquet(destination_file, index=False, compression="zstd")
+
+    @staticmethod
+    def from_parquet(
+        file_path: Path, fields: Optional[Iterable[str]] = None
+    ) -> list["ScrapeResult"]:
+        frame = pd.read_parquet(file_path, columns=_parquet_columns(file_path, fields))
+        return [
+            ScrapeResult(
+                property_info={k: v for k, v in row.items() if isinstance(v, str)}
+            )
+            for row in frame.to_dict(orient="records")
+        ]
+
+    @staticmethod
+    def to_jsonl(data: list["ScrapeResult"], destination_file: Path) -> None:
+        with open(destination_file, "wb") as f:
+            for d in data:
+                f.write(json_codec.dumps(d.property_info))
+                f.write(b"\n")
+
+    @staticmethod
+    def from_jsonl(
+        file_path: Path, fields: Optional[Iterable[str]] = None
+    ) -> list["ScrapeResult"]:
+        with open(file_path, "rb") as f:
+            return [
+                ScrapeResult(property_info=row) for row in _iter_jsonl_rows(f, fields)
+            ]
+
+    @staticmethod
+    def write(
+        data: list["ScrapeResult"], destination_file: Path, file_format: str
+    ) -> None:
+        """
+        writes scrape results as csv, parquet, or jsonl
+        """
+        writers = {
+            "csv": ScrapeResult.to_csv,
+            "parquet": ScrapeResult.to_parquet,
+            "jsonl": ScrapeResult.to_jsonl,
+        }
+        writers[check_file_format(file_format)](data, destination_file)
+
+    @staticmethod
+    def read(
+        file_path: Path,
+        file_format: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> list["ScrapeResult"]:
+        """
+        reads scrape results in the given format, inferred from the extension when None,
+        projected to the property info keys in fields if given, so columns nothing reads
+        are never held in memory
+        """
+        readers = {
+            "csv": ScrapeResult.from_csv,
+            "parquet": ScrapeResult.from_parquet,
+            "jsonl": ScrapeResult.from_jsonl,
+        }
+        return readers[check_file_format(file_format or infer_file_format(file_path))](
+            file_path, fields
+        )
+
+    @staticmethod
+    def iter_chunks(
+        file_path: Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        file_format: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Iterator[list["ScrapeResult"]]:
+        """
+        reads scrape results as read does, in lists of up to chunk_size results, so only one
+        chunk is held in memory at a time
+        """
+        file_format = check_file_format(file_format or infer_file_format(file_path))
+        if file_format == "parquet":
+            import pyarrow.parquet as pq
+
+            for record_batch in pq.ParquetFile(file_path).iter_batches(
+                batch_size=chunk_size, columns=_parquet_columns(file_path, fields)
+            ):
+                yield [
+                    ScrapeResult(
+                        property_info={
+                            k: v for k, v in row.items() if isinstance(v, str)
+                        }
+                    )
+                    for row in record_batch.to_pylist()
+                ]
+            return
+        with open(file_path, "r" if file_format == "csv" else "rb") as f:
+            rows = (
+                _iter_csv_rows(f, fields)
+                if file_format == "csv"
+                else _iter_jsonl_rows(f, fields)
+            )
+            for chunk in iter_chunks(rows, chunk_size):
+                yield [ScrapeResult(property_info=row) for row in chunk]
+
+
+@dataclass
+class ScrapeResultRef:
+    """A row of a saved scrape artifact, counted from 0 after the header"""
+
+    path: Path
+    row: int
+
+    def load(self) -> ScrapeResult:
+        """
+        reads the referenced row, scanning the file from the start
+        """
+        row = 0
+        for chunk in ScrapeResult.iter_chunks(self.path):
+            if self.row < row + len(chunk):
+                return chunk[self.row - row]
+            row += len(chunk)
+        raise IndexError(f"{self.path} has no row {self.row}")
+
+
+def _iter_csv_rows(f, fields: Optional[Iterable[str]]) -> Iterator[dict[str, str]]:
+    """
+    reads CSV rows as csv.DictReader does, or if fields is given, builds each row's dict
+    from just the matching columns instead of every column in the file
+    """
+    if fields is None:
+        yield from csv.DictReader(f, dialect=csv.unix_dialect)
+        return
+    reader = csv.reader(f, dialect=csv.unix_dialect)
+    header = next(reader, None)
+    if header is None:
+        return
+    field_set = set(fields)
+    columns = [(index, key) for index, key in enumerate(header) if key in field_set]
+    for row in reader:
+        if row:
+            yield {key: row[index] for index, key in columns if index < len(row)}
+
+
+def _iter_jsonl_rows(f, fields: Optional[Iterable[str]]) -> Iterator[dict[str, str]]:
+    field_set = set(fields) if fields is not None else None
+    for line in f:
+        if not line.strip():
+            continue
+        row = json_codec.loads(line)
+        yield (
+            row
+            if field_set is None
+            else {k: v for k, v in row.items() if k in field_set}
+        )
+
+
+def _parquet_columns(
+    file_path: Path, fields: Optional[Iterable[str]]
+) -> Optional[list[str]]:
+    """
+    the file's columns that are in fields, or None to read every column
+    """
+    if fields is None:
+        return None
+    import pyarrow.parquet as pq
+
+    field_set = set(fields)
+    return [name for name in pq.read_schema(file_path).names if name in field_set]
+
+
+class ScrapeResultWriter:
+    """
+    Writes scrape results to a CSV file one row at a time as they arrive, so a scrape
+    reaches disk while it runs instead of after every result is in memory
+
+    Columns are the declared fieldnames followed by any other keys in the order they are
+    first seen. A row with a key the header does not have yet rewrites the file once with
+    the wider header, padding the earlier rows with empty values.
+
+    Args:
+        destination_file (Path): the CSV file to write
+        fieldnames (Iterable[str]): columns to write first, in this order
+    """
+
+    def __init__(self, destination_file: Path, fieldnames: Iterable[str] = ()):
+        self.destination_file = Path(destination_file)
+        self.fieldnames: list[str] = list(dict.fromkeys(fieldnames))
+        self.rows_written = 0
+        self._file = open(self.destination_file, "w", newline="")
+        self._writer = self._start(self._file)
+
+    def write(self, result: "ScrapeResult") -> None:
+        new_keys = [k for k in result.property_info if k not in self._writer.fieldnames]
+        if new_keys:
+            self._widen(new_keys)
+        self._writer.writerow(result.property_info)
+        # scrapes are slow, flushing every row costs nothing and keeps the file current
+        self._file.flush()
+        self.rows_written += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "ScrapeResultWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _start(self, f) -> csv.DictWriter:
+        writer = csv.DictWriter(f, fieldnames=self.fieldnames, dialect=csv.unix_dialect)
+        writer.writeheader()
+        return writer
+
+    def _widen(self, new_keys: list[str]) -> None:
+        """
+        rewrites the rows written so far under a header with new_keys appended
+        """
+        self.fieldnames.extend(new_keys)
+        self._file.close()
+        if self.rows_written == 0:
+            self._file = open(self.destination_file, "w", newline="")
+            self._writer = self._start(self._file)
+            return
+        spill_file = self.destination_file.with_name(
+            f".{self.destination_file.name}.spill"
+        )
+        os.replace(self.destination_file, spill_file)
+        self._file = open(self.destination_file, "w", newline="")
+        self._writer = self._start(self._file)
+        with open(spill_file, "r", newline="") as f:
+            for row in csv.DictReader(f, dialect=csv.unix_dialect):
+                self._writer.writerow(row)
+        os.remove(spill_file)
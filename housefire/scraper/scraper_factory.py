@@ -1,25 +1,16 @@
 from housefire.logger import HousefireLoggerFactory
+from housefire.registry import SCRAPERS, TickerRegistry
 from housefire.scraper.scraper import Scraper
-from housefire.scraper.reits_by_ticker.pld import PldScraper
-from housefire.scraper.reits_by_ticker.spg import SpgScraper
-from housefire.scraper.reits_by_ticker.dlr import DlrScraper
-from housefire.scraper.reits_by_ticker.well import WellScraper
-from housefire.scraper.reits_by_ticker.eqix import EqixScraper
 import nodriver as uc
 
 
 class ScraperFactory:
     """
-    Factory class for creating Scraper instances
+    Factory class for creating Scraper instances, importing only the requested ticker's
+    scraper module
     """
 
-    scraper_map = {
-        "pld": PldScraper,
-        "spg": SpgScraper,
-        "dlr": DlrScraper,
-        "well": WellScraper,
-        "eqix": EqixScraper,
-    }
+    registry: TickerRegistry = SCRAPERS
 
     def __init__(
         self,
@@ -32,16 +23,13 @@ class ScraperFactory:
 
     @classmethod
     def supported_tickers(cls) -> set[str]:
-        return set(cls.scraper_map)
+        return cls.registry.names()
 
     async def get_scraper(self, ticker: str, temp_dir_path: str) -> Scraper:
         """
         Get a new instance of a Scraper subclass
         """
-        if ticker not in self.scraper_map:
-            raise ValueError(f"Unsupported ticker: {ticker}")
-
-        scraper = self.scraper_map[ticker]()
+        scraper = self.registry.load(ticker)()
         scraper.driver = await self._init_driver_instance(temp_dir_path)
         scraper.temp_dir_path = temp_dir_path
         scraper.ticker = ticker
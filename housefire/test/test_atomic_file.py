@@ -0,0 +1,41 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from housefire.atomic_file import atomic_write
+
+
+class TestAtomicWrite(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "cache.jsonl"
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_file_is_replaced_when_the_block_exits(self):
+        self.path.write_text("old")
+
+        with atomic_write(self.path, "w") as f:
+            f.write("new")
+            self.assertEqual(self.path.read_text(), "old")
+
+        self.assertEqual(self.path.read_text(), "new")
+        self.assertEqual(os.listdir(self.directory.name), ["cache.jsonl"])
+
+    def test_failed_write_keeps_the_old_file_and_removes_the_temp_file(self):
+        self.path.write_bytes(b"old")
+
+        with self.assertRaises(ConnectionError):
+            with atomic_write(self.path) as f:
+                f.write(b"partial")
+                raise ConnectionError("interrupted")
+
+        self.assertEqual(self.path.read_bytes(), b"old")
+        self.assertEqual(os.listdir(self.directory.name), ["cache.jsonl"])
+
+
+if __name__ == "__main__":
+    unittest.main()
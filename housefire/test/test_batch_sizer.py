@@ -0,0 +1,50 @@
+import unittest
+
+from housefire.dependency.housefire_client.batch_sizer import BatchSizer
+
+
+class TestBatchSizer(unittest.TestCase):
+
+    def test_fixed_size_ignores_observations(self):
+        sizer = BatchSizer(10, fixed=True)
+
+        sizer.record(10, 100_000_000, 100.0)
+
+        self.assertEqual(sizer.next_size(), 10)
+
+    def test_shrinks_to_byte_target(self):
+        sizer = BatchSizer(100, target_bytes=1000, target_seconds=60)
+
+        sizer.record(100, 10_000, 1.0)
+
+        self.assertEqual(sizer.next_size(), 10)
+
+    def test_shrinks_to_latency_target(self):
+        sizer = BatchSizer(100, target_bytes=10**9, target_seconds=2)
+
+        sizer.record(100, 1000, 10.0)
+
+        self.assertEqual(sizer.next_size(), 20)
+
+    def test_growth_is_limited_to_double_and_max_size(self):
+        sizer = BatchSizer(100, max_size=300, target_bytes=10**9)
+
+        sizer.record(100, 1000, 0.01)
+        self.assertEqual(sizer.next_size(), 200)
+        sizer.record(200, 2000, 0.01)
+        self.assertEqual(sizer.next_size(), 300)
+
+    def test_never_drops_below_min_size(self):
+        sizer = BatchSizer(10, min_size=5, target_bytes=1)
+
+        sizer.record(10, 10_000, 1.0)
+
+        self.assertEqual(sizer.next_size(), 5)
+
+    def test_rejects_empty_chunks(self):
+        with self.assertRaises(ValueError):
+            BatchSizer(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
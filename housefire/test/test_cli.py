@@ -1,17 +1,37 @@
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import Mock, patch
 
-from housefire.cli import _get_supported_tickers, sync_reits_main
-from housefire.dependency.housefire_client.housefire_object import Reit
+from click.testing import CliRunner
+
+from housefire.cli import (
+    _get_supported_tickers,
+    _scrape,
+    _upload_properties,
+    housefire,
+    sync_reits_main,
+)
+from housefire.dependency.housefire_client.client import (
+    HousefireClient,
+    PartialUploadError,
+    RejectedProperty,
+)
+from housefire.dependency.housefire_client.housefire_object import Property, Reit
+from housefire.scraper.scraper import ScrapeResult
 
 
 class TestReitSync(unittest.TestCase):
     @patch(
-        "housefire.cli.TransformerFactory.supported_tickers",
+        "housefire.registry.TRANSFORMERS.names",
         return_value={"pld", "eqix"},
     )
     @patch(
-        "housefire.cli.ScraperFactory.supported_tickers",
+        "housefire.registry.SCRAPERS.names",
         return_value={"pld", "spg"},
     )
     def test_get_supported_tickers_returns_sorted_uppercase_union(
@@ -19,7 +39,7 @@ class TestReitSync(unittest.TestCase):
     ):
         self.assertEqual(_get_supported_tickers(), ["EQIX", "PLD", "SPG"])
 
-    @patch("housefire.cli.HousefireClient")
+    @patch("housefire.dependency.housefire_client.client.HousefireClient")
     @patch(
         "housefire.cli._get_supported_tickers",
         return_value=["EQIX", "PLD", "SPG"],
@@ -29,10 +49,172 @@ class TestReitSync(unittest.TestCase):
         client.get_reits.return_value = [Reit(ticker="PLD")]
         client.post_reit.side_effect = lambda reit: reit
 
-        existing, created = sync_reits_main(Mock())
+        existing, created = sync_reits_main(Mock(temp_dir_path="/tmp/housefire"))
 
         self.assertEqual(existing, ["PLD"])
         self.assertEqual(created, ["EQIX", "SPG"])
         client.post_reit.assert_any_call(Reit(ticker="EQIX"))
         client.post_reit.assert_any_call(Reit(ticker="SPG"))
         self.assertEqual(client.post_reit.call_count, 2)
+
+
+class TestScrape(unittest.TestCase):
+    def test_csv_output_is_streamed_to_a_hidden_partial_file(self):
+        seen_in_temp_dir = []
+
+        class StreamingScraper:
+            result_fields = ("name", "address_input")
+            result_sink = None
+
+            async def scrape(self):
+                result = ScrapeResult({"address_input": "1 Main Street"})
+                self.result_sink(result)
+                seen_in_temp_dir.extend(os.listdir(directory))
+                return [result]
+
+        with tempfile.TemporaryDirectory() as directory:
+            output_path = Path(directory, "pld_scraped.csv")
+            data = asyncio.run(_scrape(StreamingScraper(), output_path, "csv"))
+            files = os.listdir(directory)
+            loaded = ScrapeResult.from_csv(output_path)
+
+        self.assertEqual(seen_in_temp_dir, [".pld_scraped.csv.partial"])
+        self.assertEqual(files, ["pld_scraped.csv"])
+        self.assertEqual(
+            [r.property_info for r in loaded],
+            [{"name": "", "address_input": "1 Main Street"}],
+        )
+        self.assertEqual(len(data), 1)
+
+
+class TestUploadProperties(unittest.TestCase):
+    def test_upload_uppercases_ticker_and_sets_dead_letter_path(self):
+        client = Mock()
+        data = [Property(address_input="1 Main Street", reit_ticker="PLD")]
+
+        _upload_properties(client, "pld", data, "/tmp/housefire")
+
+        ticker, uploaded = client.update_properties_by_ticker.call_args.args
+        dead_letter_path = client.update_properties_by_ticker.call_args.kwargs[
+            "dead_letter_path"
+        ]
+        self.assertEqual((ticker, uploaded), ("PLD", data))
+        self.assertEqual(str(dead_letter_path.parent), "/tmp/housefire")
+        self.assertTrue(dead_letter_path.name.startswith("pld_rejected_"))
+
+    def test_upload_exits_with_error_when_rows_are_rejected(self):
+        client = Mock()
+        client.update_properties_by_ticker.side_effect = PartialUploadError(
+            [], [RejectedProperty(0, {"addressInput": "1 Main Street"}, 400, "bad")]
+        )
+
+        with self.assertRaises(SystemExit) as context:
+            _upload_properties(client, "pld", [], "/tmp/housefire")
+
+        self.assertEqual(context.exception.code, 1)
+
+    @patch.object(HousefireClient, "update_properties_by_ticker_in_chunks")
+    def test_upload_command_reports_the_http_cache_when_rows_are_rejected(self, update):
+        update.side_effect = PartialUploadError(
+            [], [RejectedProperty(0, {"addressInput": "1 Main Street"}, 400, "bad")]
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            config_path = Path(directory, "housefire.ini")
+            config_path.write_text(
+                "[HOUSEFIRE]\n"
+                f"TEMP_DIR_PATH = {directory}\n"
+                "HOUSEFIRE_API_KEY = key\n"
+                "GOOGLE_MAPS_API_KEY = key\n"
+                "HOUSEFIRE_BASE_URL = https://example.com/api/\n"
+                "DEPLOY_ENV = production\n"
+                f"LOG_DIR_PATH = {directory}\n"
+            )
+            csv_path = Path(directory, "pld_transformed.csv")
+            Property.to_csv(
+                [Property(address_input="1 Main Street", reit_ticker="PLD")], csv_path
+            )
+
+            result = CliRunner().invoke(
+                housefire,
+                ["--config-path", str(config_path), "upload", "pld", str(csv_path)],
+            )
+
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("HTTP cache: 0 hits, 0 misses", result.output)
+
+
+class TestStartupImports(unittest.TestCase):
+    ROOT = Path(__file__).resolve().parents[2]
+    BROWSER_MODULES = ("nodriver", "googlemaps")
+    # imported only by the commands that read or write data frames or call the API
+    DATA_MODULES = ("pandas", "numpy", "pyarrow", "requests")
+
+    def get_imported_modules(self, code: str) -> set[str]:
+        """
+        every module a fresh interpreter running code imports, read from -X importtime
+        """
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=self.ROOT,
+            env={**os.environ, "PYTHONPATH": str(self.ROOT)},
+        )
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        return {
+            line.split("|")[-1].strip()
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:")
+        }
+
+    def get_command_imported_modules(self, *args: str) -> set[str]:
+        return self.get_imported_modules(
+            "import sys\n"
+            "from housefire.cli import main\n"
+            f"sys.argv = ['housefire', {', '.join(map(repr, args))}]\n"
+            "main()\n"
+        )
+
+    def test_help_skips_heavy_dependencies(self):
+        for command in ((), ("init",), ("upload",)):
+            with self.subTest(command=command):
+                modules = self.get_command_imported_modules(*command, "--help")
+
+                self.assertIn("housefire.cli", modules)
+                for module in (*self.BROWSER_MODULES, *self.DATA_MODULES):
+                    self.assertNotIn(module, modules)
+
+    def test_upload_skips_the_browser_stack(self):
+        with tempfile.TemporaryDirectory() as directory:
+            config_path = Path(directory, "housefire.ini")
+            config_path.write_text(
+                "[HOUSEFIRE]\n"
+                f"TEMP_DIR_PATH = {directory}\n"
+                "HOUSEFIRE_API_KEY = key\n"
+                "GOOGLE_MAPS_API_KEY = key\n"
+                "HOUSEFIRE_BASE_URL = https://example.com/api/\n"
+                "DEPLOY_ENV = production\n"
+                f"LOG_DIR_PATH = {directory}\n"
+            )
+            csv_path = Path(directory, "pld_transformed.csv")
+            Property.to_csv(
+                [Property(address_input="1 Main Street", reit_ticker="PLD")], csv_path
+            )
+
+            # the real upload command with only the API call replaced, not patched, since
+            # modules patch imports through importlib are missing from -X importtime
+            modules = self.get_imported_modules(
+                "import sys\n"
+                "from housefire.cli import main\n"
+                "from housefire.dependency.housefire_client.client import HousefireClient\n"
+                "HousefireClient.update_properties_by_ticker_in_chunks = (\n"
+                "    lambda *args, **kwargs: None\n"
+                ")\n"
+                f"sys.argv = ['housefire', '--config-path', {str(config_path)!r},"
+                f" 'upload', 'pld', {str(csv_path)!r}]\n"
+                "main()\n"
+            )
+
+        self.assertIn("housefire.dependency.housefire_client.client", modules)
+        for module in self.BROWSER_MODULES:
+            self.assertNotIn(module, modules)
@@ -1,7 +1,20 @@
+import csv
+import gzip
+import json
+import tempfile
+import time
 import unittest
-from unittest.mock import Mock, patch
+from pathlib import Path
+from unittest.mock import ANY, Mock, call, patch
 
-from housefire.dependency.housefire_client.client import HousefireClient
+from requests.structures import CaseInsensitiveDict
+
+from housefire.dependency.housefire_client.client import (
+    DeleteResult,
+    HousefireClient,
+    PartialUploadError,
+)
+from housefire.dependency.housefire_client.property_batch import PropertyBatch
 from housefire.dependency.housefire_client.housefire_object import (
     Geocode,
     Property,
@@ -12,12 +25,19 @@ from housefire.dependency.housefire_client.housefire_object import (
 class TestHousefireClient(unittest.TestCase):
 
     def setUp(self):
-        self.client = HousefireClient("api-key", "https://example.com/api/")
+        self.client = HousefireClient(
+            "api-key", "https://example.com/api/", requests_per_second=1000
+        )
 
     def get_response(self, status_code, payload):
         response = Mock()
         response.status_code = status_code
         response.json.return_value = payload
+        response.content = json.dumps(payload).encode()
+        response.iter_content.side_effect = lambda chunk_size: iter(
+            [json.dumps(payload).encode()]
+        )
+        response.headers = {}
         return response
 
     def get_property(self, address_input, property_id=None):
@@ -27,6 +47,9 @@ class TestHousefireClient(unittest.TestCase):
             id=property_id,
         )
 
+    def get_posted_payload(self, post_call):
+        return json.loads(post_call.kwargs["body"])
+
     def test_construct_url_handles_leading_slash(self):
         self.assertEqual(
             self.client._construct_url("/properties"),
@@ -49,6 +72,7 @@ class TestHousefireClient(unittest.TestCase):
             "https://example.com/api/properties",
             headers=self.client.headers,
             params={"limit": 2},
+            stream=False,
         )
 
     @patch("housefire.dependency.housefire_client.client.r.post")
@@ -65,6 +89,30 @@ class TestHousefireClient(unittest.TestCase):
             json={"name": "Warehouse"},
         )
 
+    @patch("housefire.dependency.housefire_client.client.r.post")
+    def test_post_sends_pre_encoded_body(self, post):
+        post.return_value = self.get_response(200, {})
+
+        self.client._post("/properties", body=b"[]")
+
+        post.assert_called_once_with(
+            "https://example.com/api/properties",
+            headers=self.client.headers,
+            data=b"[]",
+        )
+
+    @patch("housefire.dependency.housefire_client.client.r.delete")
+    def test_delete_sends_json_body_when_given(self, delete):
+        delete.return_value = self.get_response(200, {"count": 1})
+
+        self.client._delete("/properties", {"ids": ["1"]})
+
+        delete.assert_called_once_with(
+            "https://example.com/api/properties",
+            headers=self.client.headers,
+            json={"ids": ["1"]},
+        )
+
     @patch("housefire.dependency.housefire_client.client.r.delete")
     def test_delete_sends_headers(self, delete):
         response = self.get_response(204, None)
@@ -78,6 +126,163 @@ class TestHousefireClient(unittest.TestCase):
             headers=self.client.headers,
         )
 
+    @patch("housefire.dependency.housefire_client.client.r.post")
+    def test_post_gzips_large_bodies(self, post):
+        post.return_value = self.get_response(200, [])
+        self.client.compress_min_bytes = 10
+        body = json.dumps([{"label": "Clear Height"}] * 20).encode()
+
+        self.client._post("/properties", body=body)
+
+        kwargs = post.call_args.kwargs
+        self.assertEqual(kwargs["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(kwargs["data"]), body)
+        self.assertLess(len(kwargs["data"]), len(body))
+
+    @patch("housefire.dependency.housefire_client.client.r.post")
+    def test_post_sends_small_bodies_uncompressed(self, post):
+        post.return_value = self.get_response(200, [])
+        self.client.compress_min_bytes = 1024
+
+        self.client._post("/properties", body=b"[]")
+
+        kwargs = post.call_args.kwargs
+        self.assertNotIn("Content-Encoding", kwargs["headers"])
+        self.assertEqual(kwargs["data"], b"[]")
+        self.assertIn("gzip", kwargs["headers"]["Accept-Encoding"])
+
+    @patch("housefire.dependency.housefire_client.client.r.post")
+    def test_post_stops_compressing_after_unsupported_media_type(self, post):
+        post.side_effect = [
+            self.get_response(415, None),
+            self.get_response(200, []),
+            self.get_response(200, []),
+        ]
+        self.client.compress_min_bytes = 1
+
+        self.client._post("/properties", body=b"[1]")
+        self.client._post("/properties", body=b"[2]")
+
+        self.assertEqual(
+            [c.kwargs["data"] for c in post.call_args_list[1:]], [b"[1]", b"[2]"]
+        )
+        self.assertEqual(
+            post.call_args_list[0].kwargs["headers"]["Content-Encoding"], "gzip"
+        )
+
+    @patch("housefire.dependency.housefire_client.client.r.post")
+    def test_post_compresses_nothing_by_default(self, post):
+        post.return_value = self.get_response(200, [])
+        client = HousefireClient("api-key", "https://example.com/api/")
+
+        client._post("/properties", body=b"[1]" * 100_000)
+
+        self.assertNotIn("Content-Encoding", post.call_args.kwargs["headers"])
+
+    @patch("housefire.dependency.housefire_client.client.r.post")
+    def test_post_retries_a_bad_request_uncompressed(self, post):
+        post.side_effect = [
+            self.get_response(400, None),
+            self.get_response(200, []),
+            self.get_response(200, []),
+        ]
+        self.client.compress_min_bytes = 1
+
+        response = self.client._post("/properties", body=b"[1]")
+        self.client._post("/properties", body=b"[2]")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [c.kwargs["headers"].get("Content-Encoding") for c in post.call_args_list],
+            ["gzip", None, None],
+        )
+        self.assertEqual(post.call_args_list[2].kwargs["data"], b"[2]")
+
+    @patch("housefire.dependency.housefire_client.client.r.post")
+    def test_post_keeps_compressing_when_both_bodies_are_rejected(self, post):
+        post.side_effect = [
+            self.get_response(400, None),
+            self.get_response(400, None),
+            self.get_response(200, []),
+        ]
+        self.client.compress_min_bytes = 1
+
+        response = self.client._post("/properties", body=b"[1]")
+        self.client._post("/properties", body=b"[2]")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            [c.kwargs["headers"].get("Content-Encoding") for c in post.call_args_list],
+            ["gzip", None, "gzip"],
+        )
+
+    @patch("housefire.dependency.housefire_client.client.r.get")
+    def test_get_revalidates_cached_responses(self, get):
+        stored = self.get_response(200, [{"ticker": "PLD"}])
+        stored.headers = CaseInsensitiveDict({"etag": '"v1"'})
+        get.side_effect = [stored, self.get_response(304, None)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            client = HousefireClient(
+                "api-key", "https://example.com/api/", cache_dir=Path(directory)
+            )
+            first = client.get_reits()
+            second = client.get_reits()
+
+        self.assertEqual([reit.ticker for reit in first], ["PLD"])
+        self.assertEqual([reit.ticker for reit in second], ["PLD"])
+        self.assertNotIn("If-None-Match", get.call_args_list[0].kwargs["headers"])
+        self.assertEqual(
+            get.call_args_list[1].kwargs["headers"]["If-None-Match"], '"v1"'
+        )
+        self.assertEqual((client.http_cache.hits, client.http_cache.misses), (1, 1))
+        self.assertEqual(client.http_cache.summary(), "HTTP cache: 1 hits, 1 misses")
+
+    @patch("housefire.dependency.housefire_client.client.r.get")
+    def test_get_streams_cached_properties_on_not_modified(self, get):
+        stored = self.get_response(
+            200, [{"addressInput": "1 Main Street", "reitTicker": "PLD"}]
+        )
+        stored.headers = CaseInsensitiveDict(
+            {"Last-Modified": "Mon, 19 Oct 2026 00:00:00 GMT"}
+        )
+        get.side_effect = [stored, self.get_response(304, None)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            client = HousefireClient(
+                "api-key", "https://example.com/api/", cache_dir=Path(directory)
+            )
+            client.get_properties_by_ticker("PLD")
+            properties = client.get_properties_by_ticker("PLD")
+
+        self.assertEqual([p.address_input for p in properties], ["1 Main Street"])
+        self.assertEqual(
+            get.call_args_list[1].kwargs["headers"]["If-Modified-Since"],
+            "Mon, 19 Oct 2026 00:00:00 GMT",
+        )
+
+    @patch("housefire.dependency.housefire_client.client.r.get")
+    def test_get_does_not_cache_responses_without_validators(self, get):
+        response = self.get_response(
+            200, {"addressInput": "1", "latitude": 1, "longitude": 2}
+        )
+        response.headers = CaseInsensitiveDict()
+        not_found = self.get_response(404, None)
+        get.side_effect = [response, not_found, response]
+
+        with tempfile.TemporaryDirectory() as directory:
+            client = HousefireClient(
+                "api-key", "https://example.com/api/", cache_dir=Path(directory)
+            )
+            client.get_geocode_by_address_input("1")
+            self.assertIsNone(client.get_geocode_by_address_input("2"))
+            client.get_geocode_by_address_input("1")
+            cached_files = list(Path(directory).iterdir())
+
+        self.assertEqual(cached_files, [])
+        self.assertNotIn("If-None-Match", get.call_args_list[2].kwargs["headers"])
+        self.assertEqual(client.http_cache.misses, 3)
+
     def test_get_properties_returns_objects(self):
         response = self.get_response(
             200,
@@ -89,11 +294,62 @@ class TestHousefireClient(unittest.TestCase):
         with patch.object(self.client, "_get", return_value=response) as get:
             properties = self.client.get_properties_by_ticker("PLD")
 
-        get.assert_called_once_with("/properties/byTicker/PLD")
+        get.assert_called_once_with(
+            "/properties/byTicker/PLD", params=None, stream=True
+        )
+        response.close.assert_called_once()
         self.assertEqual(
             [p.address_input for p in properties], ["1 Main Street", "2 Main Street"]
         )
 
+    def test_iter_properties_decodes_streamed_chunks(self):
+        body = json.dumps(
+            [
+                {"addressInput": "1 Main Street", "reitTicker": "PLD"},
+                {"addressInput": "2 Main Street", "reitTicker": "PLD"},
+            ]
+        ).encode()
+        response = self.get_response(200, None)
+        response.iter_content.side_effect = lambda chunk_size: iter(
+            body[i : i + 7] for i in range(0, len(body), 7)
+        )
+        with patch.object(self.client, "_get", return_value=response):
+            properties = self.client.iter_properties_by_ticker("PLD")
+            first = next(properties)
+            rest = list(properties)
+
+        self.assertEqual(first.address_input, "1 Main Street")
+        self.assertEqual([p.address_input for p in rest], ["2 Main Street"])
+
+    def test_iter_properties_follows_pagination_cursor(self):
+        self.client.properties_page_size = 1
+        first_page = self.get_response(
+            200, [{"addressInput": "1 Main Street", "reitTicker": "PLD"}]
+        )
+        first_page.headers = {"X-Next-Cursor": "abc"}
+        second_page = self.get_response(
+            200, [{"addressInput": "2 Main Street", "reitTicker": "PLD"}]
+        )
+        with patch.object(
+            self.client, "_get", side_effect=[first_page, second_page]
+        ) as get:
+            properties = list(self.client.iter_properties_by_ticker("PLD"))
+
+        self.assertEqual(
+            [p.address_input for p in properties], ["1 Main Street", "2 Main Street"]
+        )
+        self.assertEqual(
+            get.call_args_list,
+            [
+                call("/properties/byTicker/PLD", params={"limit": 1}, stream=True),
+                call(
+                    "/properties/byTicker/PLD",
+                    params={"limit": 1, "cursor": "abc"},
+                    stream=True,
+                ),
+            ],
+        )
+
     def test_get_reits_returns_objects(self):
         response = self.get_response(200, [{"ticker": "PLD"}, {"ticker": "DLR"}])
         with patch.object(self.client, "_get", return_value=response) as get:
@@ -137,7 +393,10 @@ class TestHousefireClient(unittest.TestCase):
         with patch.object(self.client, "_post", return_value=response) as post:
             properties = self.client.post_properties([property_object])
 
-        post.assert_called_once_with("/properties", [property_object.to_dict()])
+        post.assert_called_once_with("/properties", body=ANY)
+        self.assertEqual(
+            self.get_posted_payload(post.call_args), [property_object.to_dict()]
+        )
         self.assertEqual(properties[0].address_input, "1 Main Street")
 
     def test_post_properties_sends_facts_in_json_payload(self):
@@ -159,8 +418,9 @@ class TestHousefireClient(unittest.TestCase):
         with patch.object(self.client, "_post", return_value=response) as post:
             properties = self.client.post_properties([property_object])
 
-        post.assert_called_once_with(
-            "/properties",
+        post.assert_called_once()
+        self.assertEqual(
+            self.get_posted_payload(post.call_args),
             [
                 {
                     "addressInput": "1 Main Street",
@@ -173,12 +433,174 @@ class TestHousefireClient(unittest.TestCase):
             properties[0].facts, [{"label": "Year built", "value": "2022"}]
         )
 
+    def test_post_properties_uploads_fixed_chunks_in_input_order(self):
+        properties = [self.get_property(f"{index} Main Street") for index in range(5)]
+
+        def post(endpoint, body):
+            payload = json.loads(body)
+            # finish later chunks first to check results are merged in input order
+            time.sleep(0.01 * (5 - len(payload)))
+            return self.get_response(201, payload)
+
+        with patch.object(self.client, "_post", side_effect=post) as post_mock:
+            created = self.client.post_properties(properties, chunk_size=2)
+
+        self.assertEqual(
+            [len(self.get_posted_payload(c)) for c in post_mock.call_args_list],
+            [2, 2, 1],
+        )
+        self.assertEqual(
+            [p.address_input for p in created],
+            [p.address_input for p in properties],
+        )
+
+    def test_post_properties_uses_client_chunk_size_by_default(self):
+        self.client.upload_chunk_size = 1
+        properties = [self.get_property("1 Main Street"), self.get_property("2")]
+        with patch.object(
+            self.client,
+            "_post",
+            side_effect=lambda endpoint, body: self.get_response(201, json.loads(body)),
+        ) as post:
+            self.client.post_properties(properties)
+
+        self.assertEqual(post.call_count, 2)
+
+    @patch("housefire.dependency.housefire_client.client.time.sleep")
+    def test_post_properties_retries_only_unprocessed_responses(self, sleep):
+        responses = iter(
+            [
+                self.get_response(503, None),
+                self.get_response(
+                    201, [{"addressInput": "1 Main Street", "reitTicker": "PLD"}]
+                ),
+            ]
+        )
+        with patch.object(
+            self.client, "_post", side_effect=lambda *args, **kwargs: next(responses)
+        ) as post:
+            created = self.client.post_properties([self.get_property("1 Main Street")])
+
+        self.assertEqual(post.call_count, 2)
+        self.assertEqual(created[0].address_input, "1 Main Street")
+
+    def test_post_properties_does_not_retry_server_errors(self):
+        with patch.object(
+            self.client, "_post", return_value=self.get_response(500, None)
+        ) as post:
+            with self.assertRaises(Exception):
+                self.client.post_properties([self.get_property("1 Main Street")])
+
+        post.assert_called_once()
+
     def test_post_properties_raises_value_error_for_validation_error(self):
         response = self.get_response(400, {"error": "invalid"})
         with patch.object(self.client, "_post", return_value=response):
             with self.assertRaises(ValueError):
                 self.client.post_properties([self.get_property("1 Main Street")])
 
+    def test_post_properties_bisects_validation_errors_to_invalid_rows(self):
+        properties = [self.get_property(f"{index} Main Street") for index in range(8)]
+        invalid = {"2 Main Street", "5 Main Street"}
+
+        def post(endpoint, body):
+            payload = json.loads(body)
+            if any(row["addressInput"] in invalid for row in payload):
+                response = self.get_response(400, {"error": "invalid"})
+                response.text = '{"error": "invalid"}'
+                return response
+            return self.get_response(201, payload)
+
+        with tempfile.TemporaryDirectory() as directory:
+            dead_letter_path = Path(directory) / "rejected.csv"
+            with patch.object(self.client, "_post", side_effect=post) as post_mock:
+                with self.assertRaises(PartialUploadError) as context:
+                    self.client.post_properties(
+                        properties, chunk_size=8, dead_letter_path=dead_letter_path
+                    )
+            with open(dead_letter_path, "r") as file:
+                rows = list(csv.DictReader(file, dialect=csv.unix_dialect))
+
+        error = context.exception
+        self.assertIsInstance(error, ValueError)
+        self.assertEqual(
+            [p.address_input for p in error.created],
+            [p.address_input for p in properties if p.address_input not in invalid],
+        )
+        self.assertEqual([r.index for r in error.rejected], [2, 5])
+        # 1 full chunk + 2 halves + 4 quarters + 4 single rows
+        self.assertEqual(post_mock.call_count, 11)
+        self.assertEqual(
+            [(row["index"], row["addressInput"]) for row in rows],
+            [("2", "2 Main Street"), ("5", "5 Main Street")],
+        )
+        self.assertEqual(rows[0]["statusCode"], "400")
+        self.assertEqual(rows[0]["error"], '{"error": "invalid"}')
+        self.assertEqual(rows[0]["reitTicker"], "PLD")
+
+    def test_update_properties_passes_dead_letter_path_to_upload(self):
+        new = [self.get_property("1 Main Street")]
+        with (
+            patch.object(self.client, "iter_properties_by_ticker", return_value=[]),
+            patch.object(self.client, "post_properties", return_value=[]) as post,
+        ):
+            self.client.update_properties_by_ticker(
+                "PLD", new, dead_letter_path=Path("rejected.csv")
+            )
+
+        post.assert_called_once_with(
+            new, dead_letter_path=Path("rejected.csv"), on_created=None
+        )
+
+    def test_update_properties_resumes_from_journal_after_interruption(self):
+        existing = [
+            self.get_property("1 Main Street", "property-1"),
+            self.get_property("2 Main Street", "property-2"),
+        ]
+        new = [self.get_property(f"{index} Main Street") for index in range(3, 7)]
+
+        def post(endpoint, body):
+            payload = json.loads(body)
+            if payload[0]["addressInput"] == "5 Main Street" and not resumed:
+                raise ConnectionError("interrupted")
+            return self.get_response(201, payload)
+
+        with tempfile.TemporaryDirectory() as directory:
+            self.client.journal_dir = Path(directory)
+            self.client.upload_chunk_size = 2
+            self.client.max_chunks_in_flight = 1
+            with (
+                patch.object(
+                    self.client, "iter_properties_by_ticker", return_value=existing
+                ) as get,
+                patch.object(
+                    self.client,
+                    "_delete",
+                    return_value=self.get_response(200, {"count": 2}),
+                ) as delete,
+                patch.object(self.client, "_post", side_effect=post) as post_mock,
+            ):
+                resumed = False
+                with self.assertRaises(ConnectionError):
+                    self.client.update_properties_by_ticker("PLD", new)
+                resumed = True
+                created = self.client.update_properties_by_ticker("PLD", new)
+                journal_files = list(Path(directory).iterdir())
+
+        get.assert_called_once()
+        delete.assert_called_once()
+        self.assertEqual(
+            [
+                self.get_posted_payload(c)[0]["addressInput"]
+                for c in post_mock.call_args_list
+            ],
+            ["3 Main Street", "5 Main Street", "5 Main Street"],
+        )
+        self.assertEqual(
+            [p.address_input for p in created], ["5 Main Street", "6 Main Street"]
+        )
+        self.assertEqual(journal_files, [])
+
     def test_delete_properties_returns_count(self):
         response = self.get_response(200, {"count": 2})
         with patch.object(self.client, "_delete", return_value=response) as delete:
@@ -216,9 +638,13 @@ class TestHousefireClient(unittest.TestCase):
 
         with (
             patch.object(
-                self.client, "get_properties_by_ticker", return_value=existing
+                self.client, "iter_properties_by_ticker", return_value=existing
             ),
-            patch.object(self.client, "delete_property_by_id") as delete,
+            patch.object(
+                self.client,
+                "delete_properties_by_ids",
+                return_value=DeleteResult(deleted=1),
+            ) as delete,
             patch.object(
                 self.client, "post_properties", return_value=[created]
             ) as post,
@@ -226,18 +652,282 @@ class TestHousefireClient(unittest.TestCase):
         ):
             result = self.client.update_properties_by_ticker("PLD", new)
 
-        delete.assert_called_once_with("property-2")
-        post.assert_called_once_with([new[1]])
-        sleep.assert_called_once_with(1)
+        delete.assert_called_once_with(["property-2"], on_deleted=None)
+        post.assert_called_once_with([new[1]], dead_letter_path=None, on_created=None)
+        sleep.assert_not_called()
         self.assertEqual(result, [created])
 
+    def test_update_property_batch_diffs_and_uploads_columns(self):
+        existing = [
+            self.get_property("1 Main Street", "property-1"),
+            self.get_property("2 Main Street", "property-2"),
+        ]
+        new = PropertyBatch.from_properties(
+            [self.get_property("1 Main Street"), self.get_property("3 Main Street")]
+        )
+
+        with (
+            patch.object(
+                self.client, "iter_properties_by_ticker", return_value=existing
+            ),
+            patch.object(
+                self.client,
+                "delete_properties_by_ids",
+                return_value=DeleteResult(deleted=1),
+            ) as delete,
+            patch.object(
+                self.client,
+                "_post",
+                side_effect=lambda endpoint, body: self.get_response(
+                    201, [{**p, "id": "property-3"} for p in json.loads(body)]
+                ),
+            ) as post,
+        ):
+            result = self.client.update_properties_by_ticker("PLD", new)
+
+        delete.assert_called_once_with(["property-2"], on_deleted=None)
+        self.assertEqual(
+            self.get_posted_payload(post.call_args),
+            [{"addressInput": "3 Main Street", "reitTicker": "PLD"}],
+        )
+        self.assertIsInstance(result, PropertyBatch)
+        self.assertEqual(
+            [(p.id, p.address_input) for p in result.to_properties()],
+            [("property-3", "3 Main Street")],
+        )
+
+    def test_update_properties_in_chunks_diffs_whole_input_and_uploads_chunks(self):
+        existing = [
+            self.get_property("1 Main Street", "property-1"),
+            self.get_property("2 Main Street", "property-2"),
+        ]
+        new = [
+            self.get_property("1 Main Street"),
+            self.get_property("3 Main Street"),
+            self.get_property("4 Main Street"),
+        ]
+        chunk_types = {
+            "batch": lambda p: PropertyBatch.from_properties([p]),
+            "payloads": lambda p: [p.to_dict()],
+        }
+
+        for chunk_type, to_chunk in chunk_types.items():
+            with self.subTest(chunk_type=chunk_type):
+                with (
+                    patch.object(
+                        self.client, "iter_properties_by_ticker", return_value=existing
+                    ),
+                    patch.object(
+                        self.client,
+                        "delete_properties_by_ids",
+                        return_value=DeleteResult(deleted=1),
+                    ) as delete,
+                    patch.object(
+                        self.client,
+                        "_post",
+                        side_effect=lambda endpoint, body: self.get_response(
+                            201,
+                            [
+                                {**p, "id": p["addressInput"][0]}
+                                for p in json.loads(body)
+                            ],
+                        ),
+                    ) as post,
+                ):
+                    result = self.client.update_properties_by_ticker_in_chunks(
+                        "PLD", lambda: (to_chunk(p) for p in new)
+                    )
+
+                delete.assert_called_once_with(["property-2"], on_deleted=None)
+                self.assertEqual(
+                    [self.get_posted_payload(call) for call in post.call_args_list],
+                    [
+                        [{"addressInput": "3 Main Street", "reitTicker": "PLD"}],
+                        [{"addressInput": "4 Main Street", "reitTicker": "PLD"}],
+                    ],
+                )
+                self.assertEqual(
+                    list(zip(result.frame["id"], result.address_inputs())),
+                    [("3", "3 Main Street"), ("4", "4 Main Street")],
+                )
+
+    def test_streaming_update_uploads_chunks_as_they_arrive_and_deletes_at_finish(
+        self,
+    ):
+        existing = [
+            self.get_property("1 Main Street", "property-1"),
+            self.get_property("2 Main Street", "property-2"),
+        ]
+
+        with (
+            patch.object(
+                self.client, "iter_properties_by_ticker", return_value=existing
+            ),
+            patch.object(
+                self.client,
+                "delete_properties_by_ids",
+                return_value=DeleteResult(deleted=1),
+            ) as delete,
+            patch.object(
+                self.client,
+                "_post",
+                side_effect=lambda endpoint, body: self.get_response(
+                    201,
+                    [{**p, "id": p["addressInput"][0]} for p in json.loads(body)],
+                ),
+            ) as post,
+        ):
+            update = self.client.start_streaming_update("PLD")
+            created_counts = [
+                update.upload([self.get_property("1 Main Street")]),
+                update.upload(
+                    [self.get_property("3 Main Street")]
+                    + [self.get_property("3 Main Street")]
+                ),
+            ]
+            # nothing is deleted until every chunk has been seen
+            delete.assert_not_called()
+            result = update.finish()
+
+        self.assertEqual(created_counts, [0, 1])
+        self.assertEqual(
+            [self.get_posted_payload(call) for call in post.call_args_list],
+            [[{"addressInput": "3 Main Street", "reitTicker": "PLD"}]],
+        )
+        delete.assert_called_once_with(["property-2"], on_deleted=None)
+        self.assertEqual(
+            list(zip(result.frame["id"], result.address_inputs())),
+            [("3", "3 Main Street")],
+        )
+
+    def test_streaming_update_raises_partial_upload_error_after_deleting(self):
+        with (
+            patch.object(self.client, "iter_properties_by_ticker", return_value=[]),
+            patch.object(
+                self.client,
+                "_post",
+                return_value=self.get_response(400, {"error": "invalid"}),
+            ),
+            tempfile.TemporaryDirectory() as directory,
+        ):
+            dead_letter_path = Path(directory, "rejected.csv")
+            update = self.client.start_streaming_update("PLD", dead_letter_path)
+            update.upload([self.get_property("1 Main Street")])
+
+            with self.assertRaises(PartialUploadError) as raised:
+                update.finish()
+
+            self.assertTrue(dead_letter_path.exists())
+        self.assertEqual(len(raised.exception.rejected), 1)
+        self.assertEqual(len(raised.exception.created), 0)
+
+    def test_streaming_update_without_rows_does_not_delete(self):
+        existing = [self.get_property("1 Main Street", "property-1")]
+
+        with (
+            patch.object(
+                self.client, "iter_properties_by_ticker", return_value=existing
+            ),
+            patch.object(self.client, "delete_properties_by_ids") as delete,
+        ):
+            update = self.client.start_streaming_update("PLD")
+            with self.assertRaises(Exception):
+                update.finish()
+
+        delete.assert_not_called()
+
+    def test_update_properties_raises_when_stale_deletes_fail(self):
+        existing = [self.get_property("1 Main Street", "property-1")]
+        new = [self.get_property("2 Main Street")]
+
+        with (
+            patch.object(
+                self.client, "iter_properties_by_ticker", return_value=existing
+            ),
+            patch.object(
+                self.client,
+                "delete_properties_by_ids",
+                return_value=DeleteResult(failed=1, failed_ids=["property-1"]),
+            ),
+            patch.object(self.client, "post_properties") as post,
+        ):
+            with self.assertRaises(Exception):
+                self.client.update_properties_by_ticker("PLD", new)
+
+        post.assert_not_called()
+
+    def test_delete_properties_by_ids_sends_chunked_bulk_requests(self):
+        self.client.delete_chunk_size = 2
+        with patch.object(
+            self.client, "_delete", return_value=self.get_response(200, {"count": 2})
+        ) as delete:
+            result = self.client.delete_properties_by_ids(["p-1", "p-2", "p-3"])
+
+        self.assertEqual(
+            delete.call_args_list,
+            [
+                call("/properties", {"ids": ["p-1", "p-2"]}),
+                call("/properties", {"ids": ["p-3"]}),
+            ],
+        )
+        self.assertEqual(result, DeleteResult(deleted=3))
+
+    def test_delete_properties_by_ids_falls_back_to_single_deletes(self):
+        responses = {
+            "/properties": self.get_response(405, None),
+            "/properties/p-1": self.get_response(204, None),
+            "/properties/p-2": self.get_response(404, None),
+        }
+        with patch.object(
+            self.client,
+            "_delete",
+            side_effect=lambda endpoint, data=None: responses[endpoint],
+        ) as delete:
+            result = self.client.delete_properties_by_ids(["p-1", "p-2"])
+            second_result = self.client.delete_properties_by_ids(["p-1"])
+
+        self.assertEqual(result, DeleteResult(deleted=2))
+        self.assertEqual(second_result, DeleteResult(deleted=1))
+        # the bulk route is only probed once per client
+        self.assertEqual(delete.call_args_list.count(call("/properties", ANY)), 1)
+
+    @patch("housefire.dependency.housefire_client.client.time.sleep")
+    def test_delete_properties_by_ids_retries_transient_errors(self, sleep):
+        self.client._bulk_delete_supported = False
+        self.client.max_retries = 2
+        responses = {
+            "/properties/p-1": iter(
+                [self.get_response(503, None), self.get_response(204, None)]
+            ),
+            "/properties/p-2": iter([self.get_response(500, None)] * 3),
+            "/properties/p-3": iter([self.get_response(403, None)]),
+        }
+        with patch.object(
+            self.client,
+            "_delete",
+            side_effect=lambda endpoint: next(responses[endpoint]),
+        ):
+            result = self.client.delete_properties_by_ids(["p-1", "p-2", "p-3"])
+
+        self.assertEqual(result.deleted, 1)
+        self.assertEqual(result.failed, 2)
+        self.assertEqual(result.retried, 3)
+        self.assertEqual(result.failed_ids, ["p-2", "p-3"])
+
+    def test_delete_properties_by_ids_is_a_noop_for_empty_input(self):
+        with patch.object(self.client, "_delete") as delete:
+            result = self.client.delete_properties_by_ids([])
+
+        delete.assert_not_called()
+        self.assertEqual(result, DeleteResult())
+
     def test_update_properties_returns_empty_when_everything_exists(self):
         existing = [self.get_property("1 Main Street", "property-1")]
         new = [self.get_property("1 Main Street")]
 
         with (
             patch.object(
-                self.client, "get_properties_by_ticker", return_value=existing
+                self.client, "iter_properties_by_ticker", return_value=existing
             ),
             patch.object(self.client, "post_properties") as post,
         ):
@@ -251,7 +941,7 @@ class TestHousefireClient(unittest.TestCase):
         new = [self.get_property("2 Main Street")]
 
         with patch.object(
-            self.client, "get_properties_by_ticker", return_value=existing
+            self.client, "iter_properties_by_ticker", return_value=existing
         ):
             with self.assertRaises(Exception):
                 self.client.update_properties_by_ticker("PLD", new)
@@ -43,6 +43,35 @@ class TestHousefireConfig(unittest.TestCase):
         with self.assertRaises(ValueError):
             HousefireConfig(config_object)
 
+    def test_transform_workers_default_to_one_and_are_read_from_config(self):
+        config_object = self.get_initialized_config()
+        self.assertEqual(HousefireConfig(config_object).transform_workers, 1)
+
+        config_object[self.TEST_HOUSEFIRE_CONFIG_KEY]["TRANSFORM_WORKERS"] = "4"
+        self.assertEqual(HousefireConfig(config_object).transform_workers, 4)
+
+        config_object[self.TEST_HOUSEFIRE_CONFIG_KEY]["TRANSFORM_WORKERS"] = "0"
+        with self.assertRaises(ValueError):
+            HousefireConfig(config_object)
+
+    def test_upload_workers_default_to_two_and_are_read_from_config(self):
+        config_object = self.get_initialized_config()
+        self.assertEqual(HousefireConfig(config_object).upload_workers, 2)
+
+        config_object[self.TEST_HOUSEFIRE_CONFIG_KEY]["UPLOAD_WORKERS"] = "4"
+        self.assertEqual(HousefireConfig(config_object).upload_workers, 4)
+
+        config_object[self.TEST_HOUSEFIRE_CONFIG_KEY]["UPLOAD_WORKERS"] = "0"
+        with self.assertRaises(ValueError):
+            HousefireConfig(config_object)
+
+    def test_compress_uploads_is_off_unless_set_in_config(self):
+        config_object = self.get_initialized_config()
+        self.assertFalse(HousefireConfig(config_object).compress_uploads)
+
+        config_object[self.TEST_HOUSEFIRE_CONFIG_KEY]["COMPRESS_UPLOADS"] = "true"
+        self.assertTrue(HousefireConfig(config_object).compress_uploads)
+
     def get_initialized_config(self):
         config_object = configparser.ConfigParser()
         config_object[self.TEST_HOUSEFIRE_CONFIG_KEY] = {
@@ -38,6 +38,14 @@ class TestTransformerFactory(unittest.TestCase):
         self.assertEqual(transformer.ticker, "pld")
         self.assertFalse(hasattr(transformer, "google_geocode_api_client"))
 
+    def test_get_transformer_sets_transform_workers(self):
+        factory = TransformerFactory(
+            self.logger_factory, self.google_geocode_api_client, transform_workers=4
+        )
+
+        self.assertEqual(factory.get_transformer("pld").transform_workers, 4)
+        self.assertEqual(self.factory.get_transformer("pld").transform_workers, 1)
+
     def test_get_transformer_rejects_unsupported_ticker(self):
         with self.assertRaises(ValueError):
             self.factory.get_transformer("unknown")
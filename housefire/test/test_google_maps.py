@@ -1,3 +1,4 @@
+import threading
 import unittest
 from unittest.mock import Mock, patch
 
@@ -100,6 +101,39 @@ class TestGoogleGeocodeAPI(unittest.TestCase):
         sleep.assert_called_once_with(3)
         self.assertEqual(api.client.geocode.call_count, 2)
 
+    @patch("housefire.dependency.google_maps.time.sleep")
+    def test_google_requests_from_several_threads_are_not_sent_at_once(self, sleep):
+        housefire_client = Mock()
+        housefire_client.get_geocode_by_address_input.return_value = None
+        api, _ = self.get_api(housefire_client)
+        in_request = threading.Event()
+        overlapping = []
+
+        def geocode(address_input):
+            overlapping.append(in_request.is_set())
+            in_request.set()
+            # time.sleep is patched, give the other threads a chance to overlap
+            threading.Event().wait(0.005)
+            return [self.get_google_response()]
+
+        api.client.geocode.side_effect = geocode
+        # the request ends once its wait_time has passed
+        sleep.side_effect = lambda seconds: in_request.clear()
+        threads = [
+            threading.Thread(
+                target=api.geocode_addresses,
+                args=([f"{i} Main Street", f"{i} Side Street"],),
+            )
+            for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(overlapping, [False] * 8)
+        self.assertEqual(sleep.call_count, 8)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,6 @@
 import csv
+import json
+import pickle
 import tempfile
 import unittest
 from datetime import datetime
@@ -150,6 +152,27 @@ class TestHousefireObject(unittest.TestCase):
 
         self.assertEqual(properties[0].facts, facts)
 
+    def test_property_to_csv_streams_from_iterator(self):
+        properties = (
+            Property(address_input=f"{index} Main Street", reit_ticker="PLD")
+            for index in range(3)
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "properties.csv"
+            Property.to_csv(properties, path)
+            loaded = Property.from_csv(path)
+
+        self.assertEqual(
+            [p.address_input for p in loaded],
+            ["0 Main Street", "1 Main Street", "2 Main Street"],
+        )
+
+    def test_to_csv_rejects_empty_data(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(ValueError):
+                Property.to_csv([], Path(directory) / "properties.csv")
+
     def test_property_from_dict_converts_dates_and_numeric_values(self):
         property_object = Property.from_dict(
             {
@@ -172,6 +195,111 @@ class TestHousefireObject(unittest.TestCase):
         self.assertEqual(property_object.longitude, -73.0)
         self.assertEqual(property_object.square_footage, 12500.0)
 
+    def test_property_json_round_trip_uses_api_field_names(self):
+        prop = Property(
+            address_input="1 Main Street",
+            reit_ticker="PLD",
+            latitude=1.5,
+            facts=[{"label": "Clear Height", "value": "36'"}],
+        )
+
+        encoded = prop.to_json()
+
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(json.loads(encoded), prop.to_dict())
+        self.assertEqual(Property.from_json(encoded), prop)
+
+    def test_list_from_json_decodes_api_metadata(self):
+        geocodes = Geocode.list_from_json(
+            b'[{"addressInput": "1 Main Street", "latitude": 1, "longitude": 2,'
+            b' "createdAt": "2026-01-01T00:00:00"}]'
+        )
+
+        self.assertEqual(len(geocodes), 1)
+        self.assertEqual(geocodes[0].longitude, 2.0)
+        self.assertEqual(
+            geocodes[0].created_at, datetime.fromisoformat("2026-01-01T00:00:00")
+        )
+        self.assertEqual(
+            json.loads(Geocode.list_to_json(geocodes)), [geocodes[0].to_dict()]
+        )
+
+    def test_records_are_slotted(self):
+        prop = Property(address_input="1 Main Street", reit_ticker="PLD")
+        geocode = Geocode(address_input="1 Main Street", latitude=1, longitude=2)
+
+        for record in (prop, geocode, Reit(ticker="PLD")):
+            self.assertFalse(hasattr(record, "__dict__"))
+        with self.assertRaises(AttributeError):
+            prop.not_a_field = 1
+
+    def test_property_interns_repeated_strings(self):
+        first = Property.from_dict(
+            json.loads(
+                '{"addressInput": "1", "reitTicker": "PLD", "state": "CA",'
+                ' "facts": [{"label": "Clear Height", "value": "36"}]}'
+            )
+        )
+        second = Property.from_dict(
+            json.loads(
+                '{"addressInput": "2", "reitTicker": "PLD", "state": "CA",'
+                ' "facts": [{"label": "Clear Height", "value": "40"}]}'
+            )
+        )
+
+        self.assertIs(first.reit_ticker, second.reit_ticker)
+        self.assertIs(first.state, second.state)
+        self.assertIs(first.facts[0]["label"], second.facts[0]["label"])
+
+    def test_property_from_dict_decodes_timestamps_and_facts_on_first_access(self):
+        prop = Property.from_dict(
+            {
+                "addressInput": "1 Main Street",
+                "reitTicker": "PLD",
+                "createdAt": "2026-01-01T00:00:00",
+                "facts": '[{"label": "Clear Height", "value": "36"}]',
+            }
+        )
+        slot = type(prop).__dict__["created_at"].slot
+
+        self.assertEqual(slot.__get__(prop), "2026-01-01T00:00:00")
+        self.assertEqual(prop.created_at, datetime.fromisoformat("2026-01-01T00:00:00"))
+        self.assertIs(prop.created_at, prop.created_at)
+        self.assertIsInstance(slot.__get__(prop), datetime)
+        self.assertEqual(prop.facts, [{"label": "Clear Height", "value": "36"}])
+        self.assertIsNone(prop.updated_at)
+
+    def test_lazy_fields_accept_parsed_values_and_raw_strings(self):
+        geocode = Geocode(address_input="1", latitude=1, longitude=2)
+
+        geocode.updated_at = "2026-01-02T00:00:00"
+        self.assertEqual(
+            geocode.updated_at, datetime.fromisoformat("2026-01-02T00:00:00")
+        )
+        geocode.updated_at = datetime.fromisoformat("2026-01-03T00:00:00")
+        self.assertEqual(
+            geocode.updated_at, datetime.fromisoformat("2026-01-03T00:00:00")
+        )
+
+    def test_property_facts_set_after_construction_are_interned(self):
+        first = Property(address_input="1", reit_ticker="PLD")
+        second = Property(address_input="2", reit_ticker="PLD")
+
+        first.facts = json.loads('[{"label": "Rail Served", "value": "Yes"}]')
+        second.facts = json.loads('[{"label": "Rail Served", "value": "Yes"}]')
+
+        self.assertIs(first.facts[0]["label"], second.facts[0]["label"])
+        self.assertIs(first.facts[0]["value"], second.facts[0]["value"])
+
+    def test_slotted_records_pickle(self):
+        prop = Property(
+            address_input="1 Main Street",
+            reit_ticker="PLD",
+            facts=[{"label": "Clear Height", "value": "36'"}],
+        )
+
+        self.assertEqual(pickle.loads(pickle.dumps(prop)), prop)
+
     def test_geocode_from_csv_reads_required_fields(self):
         with tempfile.TemporaryDirectory() as directory:
             path = Path(directory) / "geocodes.csv"
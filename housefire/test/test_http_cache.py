@@ -0,0 +1,71 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from requests.structures import CaseInsensitiveDict
+
+from housefire.dependency.housefire_client.http_cache import HttpCache
+
+
+class TestHttpCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.directory.name) / "http_cache"
+        self.headers = CaseInsensitiveDict({"ETag": '"v1"'})
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def store(self, cache, url, body=b"[]"):
+        return cache.store(url, None, self.headers, [body])
+
+    def age(self, cache, url, seconds):
+        key = cache._key(url, None)
+        past = time.time() - seconds
+        for suffix in (".json", ".body"):
+            os.utime(self.cache_dir / f"{key}{suffix}", (past, past))
+
+    def test_entries_unused_for_max_age_are_deleted_on_open(self):
+        cache = HttpCache(self.cache_dir, max_age_seconds=60)
+        self.store(cache, "https://example.com/api/old")
+        self.store(cache, "https://example.com/api/used")
+        self.age(cache, "https://example.com/api/old", 120)
+        self.age(cache, "https://example.com/api/used", 120)
+        # a lookup counts as a use
+        cache.lookup("https://example.com/api/used")
+
+        reopened = HttpCache(self.cache_dir, max_age_seconds=60)
+
+        self.assertIsNone(reopened.lookup("https://example.com/api/old"))
+        self.assertIsNotNone(reopened.lookup("https://example.com/api/used"))
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 2)
+
+    def test_least_recently_used_entries_are_deleted_past_max_bytes(self):
+        cache = HttpCache(self.cache_dir)
+        for age, url in enumerate(["c", "b", "a"]):
+            self.store(cache, f"https://example.com/api/{url}", b"x" * 100)
+            self.age(cache, f"https://example.com/api/{url}", 10 * (3 - age))
+
+        reopened = HttpCache(self.cache_dir, max_bytes=150)
+
+        self.assertIsNone(reopened.lookup("https://example.com/api/c"))
+        self.assertIsNone(reopened.lookup("https://example.com/api/b"))
+        self.assertIsNotNone(reopened.lookup("https://example.com/api/a"))
+
+    def test_temp_files_left_by_interrupted_stores_expire(self):
+        self.cache_dir.mkdir()
+        leftover = self.cache_dir / "tmpabc123"
+        leftover.write_bytes(b"partial")
+        past = time.time() - 120
+        os.utime(leftover, (past, past))
+
+        HttpCache(self.cache_dir, max_age_seconds=60)
+
+        self.assertFalse(leftover.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+from unittest.mock import patch
+
+from housefire.dependency.housefire_client import json_codec
+
+
+class TestJsonCodec(unittest.TestCase):
+
+    def test_round_trips_unicode_as_utf8(self):
+        encoded = json_codec.dumps({"name": "Zürich", "facts": [1, 2.5, None]})
+
+        self.assertEqual(encoded, '{"name":"Zürich","facts":[1,2.5,null]}'.encode())
+        self.assertEqual(
+            json_codec.loads(encoded), {"name": "Zürich", "facts": [1, 2.5, None]}
+        )
+
+    def test_falls_back_to_stdlib_json_without_orjson(self):
+        with patch.object(json_codec, "orjson", None):
+            encoded = json_codec.dumps([{"label": "Zürich"}])
+            decoded = json_codec.loads(encoded.decode())
+
+        self.assertEqual(encoded, '[{"label":"Zürich"}]'.encode())
+        self.assertEqual(decoded, [{"label": "Zürich"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import json
+import unittest
+
+from housefire.dependency.housefire_client.json_stream import iter_json_array
+
+
+def split_bytes(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestIterJsonArray(unittest.TestCase):
+
+    def test_decodes_elements_across_any_chunk_boundary(self):
+        values = [{"label": "Café", "value": "2,000"}, [1, 2.5], 12345, "x", None, True]
+        encoded = json.dumps(values, ensure_ascii=False).encode()
+
+        for size in (1, 2, 3, 7, len(encoded)):
+            with self.subTest(size=size):
+                self.assertEqual(
+                    list(iter_json_array(split_bytes(encoded, size))), values
+                )
+
+    def test_yields_elements_before_the_stream_ends(self):
+        def chunks():
+            yield b'[{"a": 1},'
+            raise AssertionError("read past the first element")
+
+        self.assertEqual(next(iter_json_array(chunks())), {"a": 1})
+
+    def test_decodes_empty_array_with_whitespace(self):
+        self.assertEqual(list(iter_json_array([b" [ ", b" ] \n"])), [])
+
+    def test_rejects_malformed_streams(self):
+        for body in (b"", b"{}", b"[1,2", b"[1 2]", b"[1]x", b"[1,]"):
+            with self.subTest(body=body):
+                with self.assertRaises(json.JSONDecodeError):
+                    list(iter_json_array(split_bytes(body, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
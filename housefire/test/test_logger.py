@@ -1,26 +1,30 @@
+import gzip
+import json
+import multiprocessing
 import unittest
 import os
 import tempfile
 import shutil
 import logging
-from housefire.logger import HousefireLoggerFactory
+import logging.handlers
+from concurrent.futures import ProcessPoolExecutor
+from housefire.logger import HousefireLoggerFactory, Lazy, log_event, summarize
+
+
+def log_in_worker(index):
+    logging.getLogger("housefire").getChild("worker").info("worker record %d", index)
+    logging.getLogger("housefire").getChild("worker").debug("hidden record %d", index)
 
 
 class TestHousefireLogger(unittest.TestCase):
     def setUp(self):
         self.log_dir = tempfile.mkdtemp()
-        # It's important to reset the logging configuration between tests
-        # to prevent handlers from accumulating.
-        logging.shutdown()
-        # Re-initialize the logging system after shutdown.
-        for handler in logging.root.handlers:
-            logging.root.removeHandler(handler)
+        self.log_path = os.path.join(self.log_dir, "housefire.log")
 
     def tearDown(self):
+        # stop the listener thread and detach its handler so tests do not share it
+        HousefireLoggerFactory.shutdown()
         shutil.rmtree(self.log_dir)
-        logging.shutdown()
-        for handler in logging.root.handlers[:]:
-            logging.root.removeHandler(handler)
 
     def test_get_logger_aproduction(self):
         logger_factory = HousefireLoggerFactory(
@@ -30,12 +34,19 @@ class TestHousefireLogger(unittest.TestCase):
         self.assertIsInstance(logger, logging.Logger)
         self.assertEqual(logger.name, "housefire.test_prod_logger")
 
-        # The 'housefire' logger is the one configured with handlers.
+        # The 'housefire' logger only queues records, the listener writes them.
         housefire_logger = logging.getLogger("housefire")
+        self.assertEqual(len(housefire_logger.handlers), 1)
+        self.assertIsInstance(
+            housefire_logger.handlers[0], logging.handlers.QueueHandler
+        )
         self.assertTrue(
-            all(isinstance(h, logging.FileHandler) for h in housefire_logger.handlers)
+            all(
+                isinstance(h, logging.FileHandler)
+                for h in HousefireLoggerFactory._listener.handlers
+            )
         )
-        self.assertTrue(os.path.exists(os.path.join(self.log_dir, "housefire.log")))
+        self.assertTrue(os.path.exists(self.log_path))
 
     def test_get_logger_development(self):
         logger_factory = HousefireLoggerFactory(
@@ -45,12 +56,171 @@ class TestHousefireLogger(unittest.TestCase):
         self.assertIsInstance(logger, logging.Logger)
         self.assertEqual(logger.name, "housefire.test_dev_logger")
 
-        # The 'housefire' logger is the one configured with handlers.
-        housefire_logger = logging.getLogger("housefire")
         self.assertTrue(
-            any(isinstance(h, logging.StreamHandler) for h in housefire_logger.handlers)
+            any(
+                not isinstance(h, logging.FileHandler)
+                for h in HousefireLoggerFactory._listener.handlers
+            )
+        )
+        self.assertTrue(os.path.exists(self.log_path))
+
+    def test_repeated_factories_write_each_record_once(self):
+        HousefireLoggerFactory(deploy_env="production", log_dir_path=self.log_dir)
+        logger = HousefireLoggerFactory(
+            deploy_env="production", log_dir_path=self.log_dir
+        ).get_logger("test_repeated")
+
+        logger.info("written once")
+        HousefireLoggerFactory.shutdown()
+
+        self.assertEqual(len(logging.getLogger("housefire").handlers), 0)
+        with open(self.log_path) as f:
+            self.assertEqual(f.read().count("written once"), 1)
+
+    def test_json_lines_output_includes_event_fields(self):
+        logger = HousefireLoggerFactory(
+            deploy_env="production", log_dir_path=self.log_dir, json_lines=True
+        ).get_logger("test_json")
+
+        log_event(logger, logging.INFO, "uploaded", ticker="pld", rows=[1, 2])
+        HousefireLoggerFactory.shutdown()
+
+        with open(self.log_path) as f:
+            entry = json.loads(f.readline())
+        self.assertEqual(entry["logger"], "housefire.test_json")
+        self.assertEqual(entry["level"], "INFO")
+        self.assertEqual(entry["message"], "uploaded ticker=pld rows=2 items [1, 2]")
+        self.assertEqual(entry["ticker"], "pld")
+        self.assertEqual(entry["rows"], "2 items [1, 2]")
+
+    def test_json_lines_output_keeps_exception_separate_from_message(self):
+        logger = HousefireLoggerFactory(
+            deploy_env="production", log_dir_path=self.log_dir, json_lines=True
+        ).get_logger("test_json_exception")
+
+        try:
+            raise ValueError("bad row")
+        except ValueError:
+            logger.exception("upload failed for %s", "pld")
+        HousefireLoggerFactory.shutdown()
+
+        with open(self.log_path) as f:
+            entry = json.loads(f.readline())
+        self.assertEqual(entry["message"], "upload failed for pld")
+        self.assertIn("Traceback", entry["exception"])
+        self.assertIn("ValueError: bad row", entry["exception"])
+
+    def test_text_output_keeps_exception_traceback(self):
+        logger = HousefireLoggerFactory(
+            deploy_env="production", log_dir_path=self.log_dir
+        ).get_logger("test_text_exception")
+
+        try:
+            raise ValueError("bad row")
+        except ValueError:
+            logger.exception("upload failed")
+        HousefireLoggerFactory.shutdown()
+
+        with open(self.log_path) as f:
+            content = f.read()
+        self.assertIn("upload failed\nTraceback", content)
+        self.assertEqual(content.count("ValueError: bad row"), 1)
+
+    def test_process_pool_workers_log_through_the_parent_listener(self):
+        HousefireLoggerFactory(deploy_env="production", log_dir_path=self.log_dir)
+
+        for start_method in ("fork", "spawn"):
+            with (
+                self.subTest(start_method=start_method),
+                HousefireLoggerFactory.process_pool_logging(
+                    multiprocessing.get_context(start_method)
+                ) as options,
+                ProcessPoolExecutor(2, **options) as executor,
+            ):
+                list(executor.map(log_in_worker, range(2)))
+        HousefireLoggerFactory.shutdown()
+
+        with open(self.log_path) as f:
+            log_contents = f.read()
+        for index in range(2):
+            self.assertEqual(log_contents.count(f"worker record {index}"), 2)
+        # workers use the parent's level
+        self.assertNotIn("hidden record", log_contents)
+
+    def test_process_pool_logging_only_sets_the_context_without_a_factory(self):
+        context = multiprocessing.get_context("spawn")
+        with HousefireLoggerFactory.process_pool_logging(context) as options:
+            self.assertEqual(options, {"mp_context": context})
+
+    def test_rotated_files_can_be_compressed(self):
+        logger = HousefireLoggerFactory(
+            deploy_env="production",
+            log_dir_path=self.log_dir,
+            compress_rotated=True,
+        ).get_logger("test_rotation")
+        logger.info("before rotation")
+        file_handler = HousefireLoggerFactory._listener.handlers[0]
+        HousefireLoggerFactory.shutdown()
+
+        file_handler.doRollover()
+        file_handler.close()
+
+        with gzip.open(f"{self.log_path}.1.gz", "rt") as f:
+            self.assertIn("before rotation", f.read())
+        self.assertFalse(os.path.exists(f"{self.log_path}.1"))
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestLoggingHelpers(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger("housefire.test_logging_helpers")
+        self.logger.propagate = False
+        self.handler = RecordingHandler()
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        self.logger.removeHandler(self.handler)
+        self.logger.setLevel(logging.NOTSET)
+
+    def test_summarize_shows_size_and_first_items(self):
+        self.assertEqual(str(summarize(list(range(10)))), "10 items [0, 1, 2, ...]")
+        self.assertEqual(str(summarize({"a": 1})), "1 items [('a', 1)]")
+        self.assertEqual(str(summarize("x" * 300, max_chars=5)), "'xxxx... (302 chars)")
+
+    def test_disabled_levels_format_nothing(self):
+        self.logger.setLevel(logging.INFO)
+        calls = []
+        expensive = Lazy(lambda: calls.append(1))
+
+        self.logger.debug("data: %s", expensive)
+        log_event(self.logger, logging.DEBUG, "transforming", data=expensive)
+
+        self.assertEqual(calls, [])
+        self.assertEqual(self.handler.records, [])
+
+    def test_log_event_renders_fields_and_attaches_them_to_the_record(self):
+        self.logger.setLevel(logging.DEBUG)
+        rows = list(range(5))
+
+        log_event(self.logger, logging.DEBUG, "transformed", ticker="pld", rows=rows)
+
+        record = self.handler.records[0]
+        self.assertEqual(
+            record.getMessage(), "transformed ticker=pld rows=5 items [0, 1, 2, ...]"
+        )
+        self.assertEqual(record.fields, {"ticker": "pld", "rows": rows})
+        self.assertEqual(
+            record.funcName,
+            "test_log_event_renders_fields_and_attaches_them_to_the_record",
         )
-        self.assertTrue(os.path.exists(os.path.join(self.log_dir, "housefire.log")))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,228 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from housefire.dependency.housefire_client.housefire_object import Property
+from housefire.dependency.housefire_client.property_batch import PropertyBatch
+from housefire.pipeline import PipelineSettings, StagedPipeline
+from housefire.scraper.scraper import Scraper, ScrapeResult
+from housefire.transformer.transformer import Transformer, TransformResult
+
+
+class FakeScraper(Scraper):
+
+    def __init__(self, address_inputs, emit=True, error=None):
+        super().__init__()
+        self.ticker = "pld"
+        self.logger = Mock()
+        self.address_inputs = address_inputs
+        self.emit = emit
+        self.error = error
+        self.events = []
+
+    async def execute_scrape(self):
+        results = []
+        for address_input in self.address_inputs:
+            result = ScrapeResult({"address_input": address_input})
+            results.append(self._emit(result) if self.emit else result)
+            # a page load, giving the other stages a turn
+            await asyncio.sleep(0.001)
+        if self.error is not None:
+            raise self.error
+        self.events.append("scraped")
+        return results
+
+    async def _debug_scrape(self):
+        return []
+
+
+class FakeTransformer(Transformer):
+
+    def __init__(self, transform_seconds=None):
+        super().__init__()
+        self.ticker = "pld"
+        self.logger = Mock()
+        # seconds to transform a chunk by its first address input
+        self.transform_seconds = transform_seconds or {}
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def execute_transform(self, data):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(
+            self.transform_seconds.get(data[0].property_info["address_input"], 0)
+        )
+        with self.lock:
+            self.running -= 1
+        if data[0].property_info["address_input"] == "Unknown Street":
+            raise ValueError("Unsupported address")
+        return [
+            TransformResult(
+                property=Property(
+                    address_input=d.property_info["address_input"], reit_ticker="pld"
+                ),
+                scrape_result=d,
+            )
+            for d in data
+        ]
+
+
+class FakeStreamingUpdate:
+
+    def __init__(self, events, upload_seconds=0.0, pipeline=None):
+        self.events = events
+        self.upload_seconds = upload_seconds
+        self.pipeline = pipeline
+        self.chunks = []
+        self.max_chunks_waiting = 0
+        self.finished = False
+
+    def upload(self, chunk):
+        self.events.append("uploaded")
+        self.chunks.append([p.address_input for p in chunk])
+        if self.pipeline is not None:
+            uploaded = sum(len(c) for c in self.chunks)
+            self.max_chunks_waiting = max(
+                self.max_chunks_waiting, self.pipeline.transformed_rows - uploaded
+            )
+        time.sleep(self.upload_seconds)
+        return len(chunk)
+
+    def finish(self):
+        self.finished = True
+        addresses = [a for c in self.chunks for a in c]
+        return PropertyBatch.from_columns({"id": addresses, "addressInput": addresses})
+
+
+class TestStagedPipeline(unittest.TestCase):
+
+    def get_pipeline(self, scraper, update, settings=None, transformer=None):
+        client = Mock()
+        client.start_streaming_update.return_value = update
+        pipeline = StagedPipeline(
+            scraper,
+            transformer or FakeTransformer(),
+            client,
+            "pld",
+            settings,
+            logger=Mock(),
+        )
+        return pipeline, client
+
+    def test_chunks_are_uploaded_while_the_scrape_runs(self):
+        scraper = FakeScraper([f"{i} Main Street" for i in range(5)])
+        update = FakeStreamingUpdate(scraper.events)
+        pipeline, client = self.get_pipeline(
+            scraper, update, PipelineSettings(chunk_size=2, queue_size=1)
+        )
+
+        created = asyncio.run(pipeline.run())
+
+        client.start_streaming_update.assert_called_once_with("PLD", None)
+        self.assertEqual(
+            update.chunks,
+            [
+                ["0 Main Street", "1 Main Street"],
+                ["2 Main Street", "3 Main Street"],
+                ["4 Main Street"],
+            ],
+        )
+        self.assertLess(
+            scraper.events.index("uploaded"), scraper.events.index("scraped")
+        )
+        self.assertTrue(update.finished)
+        self.assertEqual(len(created), 5)
+        self.assertEqual(pipeline.scraped_rows, 5)
+        self.assertIsNone(scraper.result_sink)
+
+    def test_slow_upload_holds_back_the_transform(self):
+        scraper = FakeScraper([f"{i} Main Street" for i in range(20)])
+        update = FakeStreamingUpdate(scraper.events, upload_seconds=0.01)
+        pipeline, _ = self.get_pipeline(
+            scraper, update, PipelineSettings(chunk_size=1, queue_size=2)
+        )
+        update.pipeline = pipeline
+
+        asyncio.run(pipeline.run())
+
+        self.assertEqual(len(update.chunks), 20)
+        # the queued chunks and the one waiting to be queued, never the whole scrape
+        self.assertLessEqual(update.max_chunks_waiting, 3)
+
+    def test_chunks_are_transformed_at_once_and_uploaded_in_order(self):
+        scraper = FakeScraper(
+            ["0 Main Street", "1 Main Street", "2 Main Street", "0 Main Street"],
+            emit=False,
+        )
+        update = FakeStreamingUpdate(scraper.events)
+        # the first chunk finishes last, its address is still the one kept
+        transformer = FakeTransformer(
+            {"0 Main Street": 0.05, "1 Main Street": 0.02, "2 Main Street": 0.02}
+        )
+        transformer.transform_workers = 3
+        pipeline, _ = self.get_pipeline(
+            scraper,
+            update,
+            PipelineSettings(chunk_size=1, queue_size=4),
+            transformer,
+        )
+
+        asyncio.run(pipeline.run())
+
+        self.assertEqual(transformer.max_running, 3)
+        self.assertEqual(pipeline.transformed_rows, 3)
+        self.assertEqual(
+            update.chunks, [["0 Main Street"], ["1 Main Street"], ["2 Main Street"], []]
+        )
+
+    def test_results_sent_once_the_scrape_finishes_are_chunked(self):
+        scraper = FakeScraper([f"{i} Main Street" for i in range(5)], emit=False)
+        update = FakeStreamingUpdate(scraper.events)
+        pipeline, _ = self.get_pipeline(
+            scraper, update, PipelineSettings(chunk_size=2, queue_size=1)
+        )
+
+        asyncio.run(pipeline.run())
+
+        self.assertEqual([len(c) for c in update.chunks], [2, 2, 1])
+
+    def test_failed_scrape_never_finishes_the_update(self):
+        scraper = FakeScraper(["1 Main Street"], error=RuntimeError("blocked"))
+        update = FakeStreamingUpdate(scraper.events)
+        pipeline, _ = self.get_pipeline(scraper, update)
+
+        with self.assertRaisesRegex(RuntimeError, "blocked"):
+            asyncio.run(pipeline.run())
+
+        self.assertFalse(update.finished)
+
+    def test_failed_transform_never_finishes_the_update(self):
+        scraper = FakeScraper(["1 Main Street", "Unknown Street", "2 Main Street"])
+        update = FakeStreamingUpdate(scraper.events)
+        transformer = FakeTransformer()
+        transformer.transform_workers = 2
+        pipeline, _ = self.get_pipeline(
+            scraper, update, PipelineSettings(chunk_size=1), transformer
+        )
+
+        with self.assertRaisesRegex(ValueError, "Unsupported address"):
+            asyncio.run(pipeline.run())
+
+        # chunks after the failed one are never uploaded
+        self.assertNotIn(["2 Main Street"], update.chunks)
+        self.assertFalse(update.finished)
+
+    def test_settings_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            PipelineSettings(chunk_size=0)
+        with self.assertRaises(ValueError):
+            PipelineSettings(queue_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+from housefire.dependency.housefire_client.housefire_object import Property
+from housefire.dependency.housefire_client.property_batch import (
+    PropertyBatch,
+    PropertyBatchWriter,
+)
+from housefire.dependency.housefire_client.property_csv import iter_property_payloads
+
+
+class TestPropertyBatch(unittest.TestCase):
+
+    def get_properties(self):
+        return [
+            Property(
+                address_input="1 Main Street",
+                reit_ticker="PLD",
+                name="Park 1",
+                latitude=1.5,
+                longitude=-2.25,
+                facts=[{"label": "Clear Height", "value": "36'"}],
+            ),
+            Property(address_input="NA", reit_ticker="PLD", square_footage=1000.0),
+        ]
+
+    def test_payloads_match_property_to_dict(self):
+        properties = self.get_properties()
+
+        batch = PropertyBatch.from_properties(properties)
+
+        self.assertEqual(batch.to_payloads(), [p.to_dict() for p in properties])
+        self.assertEqual(batch.to_properties(), properties)
+
+    def test_csv_is_interchangeable_with_property_csv(self):
+        properties = self.get_properties()
+        with tempfile.TemporaryDirectory() as directory:
+            property_csv = Path(directory, "properties.csv")
+            batch_csv = Path(directory, "batch.csv")
+            Property.to_csv(properties, property_csv)
+
+            batch = PropertyBatch.from_csv(property_csv)
+            batch.to_csv(batch_csv)
+
+            self.assertEqual(property_csv.read_text(), batch_csv.read_text())
+            self.assertEqual(batch.to_properties(), Property.from_csv(property_csv))
+            self.assertEqual(
+                batch.to_payloads(),
+                [p.to_dict() for p in Property.from_csv(property_csv)],
+            )
+
+    def test_diff_returns_rows_to_create_and_stale_ids(self):
+        batch = PropertyBatch.from_records(
+            [
+                {"addressInput": "1 Main Street", "reitTicker": "PLD"},
+                {"addressInput": "3 Main Street", "reitTicker": "PLD"},
+            ]
+        )
+        existing = PropertyBatch.from_columns(
+            {"id": ["p1", "p2"], "addressInput": ["1 Main Street", "2 Main Street"]}
+        )
+
+        to_create, to_delete = batch.diff(existing)
+
+        self.assertEqual(to_create.address_inputs(), ["3 Main Street"])
+        self.assertEqual(to_delete, ["p2"])
+
+    def test_diff_rejects_stale_rows_without_ids(self):
+        batch = PropertyBatch.from_records(
+            [{"addressInput": "1 Main Street", "reitTicker": "PLD"}]
+        )
+        existing = PropertyBatch.from_columns(
+            {"id": [None], "addressInput": ["2 Main Street"]}
+        )
+
+        with self.assertRaisesRegex(Exception, "2 Main Street"):
+            batch.diff(existing)
+
+    def test_dedup_and_select_by_address_input(self):
+        batch = PropertyBatch.from_records(
+            [
+                {"addressInput": "1", "reitTicker": "PLD", "name": "old"},
+                {"addressInput": "2", "reitTicker": "PLD"},
+                {"addressInput": "1", "reitTicker": "PLD", "name": "new"},
+            ]
+        )
+
+        deduped = batch.dedup()
+
+        self.assertEqual(
+            [(p["addressInput"], p.get("name")) for p in deduped.to_payloads()],
+            [("2", None), ("1", "new")],
+        )
+        self.assertEqual(batch.select({"2"}).address_inputs(), ["2"])
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("pyarrow"), "Parquet support needs pyarrow"
+    )
+    def test_parquet_round_trip(self):
+        properties = self.get_properties()
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory, "properties.parquet")
+            PropertyBatch.from_properties(properties).to_parquet(path)
+
+            batch = PropertyBatch.from_parquet(path)
+
+        self.assertEqual(batch.to_payloads(), [p.to_dict() for p in properties])
+
+    def test_writer_appends_chunks_that_read_back_in_chunks(self):
+        properties = self.get_properties()
+        formats = ["csv", "jsonl"]
+        if importlib.util.find_spec("pyarrow"):
+            formats.append("parquet")
+        readers = {
+            "csv": PropertyBatch.iter_csv,
+            "parquet": PropertyBatch.iter_parquet,
+            "jsonl": PropertyBatch.iter_jsonl,
+        }
+        for file_format in formats:
+            with (
+                self.subTest(file_format=file_format),
+                tempfile.TemporaryDirectory() as directory,
+            ):
+                path = Path(directory, f"properties.{file_format}")
+                with PropertyBatchWriter(path, file_format) as writer:
+                    for p in properties:
+                        writer.write(PropertyBatch.from_properties([p]))
+
+                chunks = list(readers[file_format](path, chunk_size=1))
+
+                expected = properties
+                if file_format == "csv":
+                    expected_path = Path(directory, "expected.csv")
+                    Property.to_csv(properties, expected_path)
+                    self.assertEqual(path.read_text(), expected_path.read_text())
+                    expected = Property.from_csv(expected_path)
+                self.assertEqual(writer.rows_written, 2)
+                self.assertEqual([len(c) for c in chunks], [1, 1])
+                self.assertEqual(
+                    [payload for c in chunks for payload in c.to_payloads()],
+                    [p.to_dict() for p in expected],
+                )
+
+    def test_empty_facts_round_trip_through_every_format(self):
+        properties = [
+            Property(address_input="1 Main Street", reit_ticker="PLD", facts=[]),
+            Property(address_input="2 Main Street", reit_ticker="PLD"),
+        ]
+        expected = [p.to_dict() for p in properties]
+        formats = ["csv", "jsonl"]
+        if importlib.util.find_spec("pyarrow"):
+            formats.append("parquet")
+        readers = {
+            "csv": PropertyBatch.from_csv,
+            "parquet": PropertyBatch.from_parquet,
+            "jsonl": PropertyBatch.from_jsonl,
+        }
+        for file_format in formats:
+            with (
+                self.subTest(file_format=file_format),
+                tempfile.TemporaryDirectory() as directory,
+            ):
+                path = Path(directory, f"properties.{file_format}")
+                with PropertyBatchWriter(path, file_format) as writer:
+                    writer.write(PropertyBatch.from_properties(properties))
+
+                payloads = readers[file_format](path).to_payloads()
+                if file_format == "csv":
+                    # CSV reads missing text back as empty strings, as Property does
+                    csv_expected = [p.to_dict() for p in Property.from_csv(path)]
+                    self.assertEqual(payloads, csv_expected)
+                    self.assertEqual(
+                        [p for c in iter_property_payloads(path) for p in c],
+                        csv_expected,
+                    )
+                else:
+                    self.assertEqual(payloads, expected)
+                self.assertEqual(payloads[0]["facts"], [])
+                self.assertNotIn("facts", payloads[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from housefire.dependency.housefire_client.housefire_object import Property
+from housefire.dependency.housefire_client.property_csv import iter_property_payloads
+
+
+class TestPropertyCsv(unittest.TestCase):
+
+    def get_properties(self):
+        return [
+            Property(
+                address_input="1 Main Street",
+                reit_ticker="PLD",
+                name="Park 1",
+                latitude=1.5,
+                longitude=-2.25,
+                facts=[{"label": "Clear Height", "value": "36'"}],
+            ),
+            Property(address_input="NA", reit_ticker="PLD", square_footage=1000.0),
+            Property(address_input="2 Main Street", reit_ticker="PLD", facts=[]),
+        ]
+
+    def test_payloads_match_property_csv_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory, "properties.csv")
+            Property.to_csv(self.get_properties(), path)
+
+            chunks = list(iter_property_payloads(path, chunk_size=2))
+            expected = [p.to_dict() for p in Property.from_csv(path)]
+
+        self.assertEqual([len(c) for c in chunks], [2, 1])
+        self.assertEqual([p for c in chunks for p in c], expected)
+
+    def test_invalid_values_name_the_line_and_column(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory, "properties.csv")
+            path.write_text(
+                '"addressInput","reitTicker","latitude"\n'
+                '"1 Main Street","PLD","1.5"\n'
+                '"2 Main Street","PLD","north"\n'
+            )
+
+            with self.assertRaisesRegex(ValueError, r":3: invalid latitude 'north'"):
+                list(iter_property_payloads(path))
+
+    def test_missing_required_columns_are_rejected(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory, "properties.csv")
+            path.write_text('"name","addressInput"\n"Park 1","1 Main Street"\n')
+
+            with self.assertRaisesRegex(ValueError, "reitTicker"):
+                list(iter_property_payloads(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
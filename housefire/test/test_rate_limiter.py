@@ -0,0 +1,37 @@
+import unittest
+from unittest.mock import patch
+
+from housefire.dependency.housefire_client.rate_limiter import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_rejects_non_positive_rate(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(0)
+
+    @patch("housefire.dependency.housefire_client.rate_limiter.time.sleep")
+    @patch("housefire.dependency.housefire_client.rate_limiter.time.monotonic")
+    def test_acquire_spaces_calls_by_interval(self, monotonic, sleep):
+        monotonic.return_value = 100.0
+        limiter = RateLimiter(4)
+
+        waits = [limiter.acquire() for _ in range(3)]
+
+        self.assertEqual(waits, [0.0, 0.25, 0.5])
+        self.assertEqual(sleep.call_count, 2)
+
+    @patch("housefire.dependency.housefire_client.rate_limiter.time.sleep")
+    @patch("housefire.dependency.housefire_client.rate_limiter.time.monotonic")
+    def test_acquire_does_not_wait_after_idle_period(self, monotonic, sleep):
+        limiter = RateLimiter(1)
+        monotonic.return_value = 10.0
+        limiter.acquire()
+        monotonic.return_value = 20.0
+
+        self.assertEqual(limiter.acquire(), 0.0)
+        sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import importlib.metadata
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from housefire.registry import (
+    SCRAPER_GROUP,
+    SCRAPER_MANIFEST,
+    SCRAPERS,
+    TRANSFORMER_GROUP,
+    TRANSFORMER_MANIFEST,
+    TRANSFORMERS,
+    TickerRegistry,
+)
+from housefire.transformer.reits_by_ticker.dlr import DlrTransformer
+from housefire.transformer.reits_by_ticker.pld import PldTransformer
+
+try:
+    import tomllib
+except ImportError:  # python 3.10
+    tomllib = None
+
+
+class TestTickerRegistry(unittest.TestCase):
+
+    def get_registry(self, entry_points=(), installed=False):
+        registry = TickerRegistry(
+            TRANSFORMER_GROUP,
+            {"pld": "housefire.transformer.reits_by_ticker.pld:PldTransformer"},
+        )
+        for patcher in (
+            patch(
+                "housefire.registry.importlib.metadata.entry_points",
+                return_value=list(entry_points),
+            ),
+            patch("housefire.registry._is_installed", return_value=installed),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return registry
+
+    def test_manifest_is_used_when_housefire_is_not_installed(self):
+        registry = self.get_registry()
+
+        self.assertEqual(registry.names(), {"pld"})
+        self.assertIn("pld", registry)
+        self.assertIs(registry.load("pld"), PldTransformer)
+
+    def test_manifest_is_ignored_when_housefire_is_installed(self):
+        registry = self.get_registry(
+            [
+                importlib.metadata.EntryPoint(
+                    name="dlr",
+                    value="housefire.transformer.reits_by_ticker.dlr:DlrTransformer",
+                    group=TRANSFORMER_GROUP,
+                )
+            ],
+            installed=True,
+        )
+
+        self.assertEqual(registry.names(), {"dlr"})
+        with self.assertRaisesRegex(ValueError, "Unsupported ticker: pld"):
+            registry.load("pld")
+
+    def test_entry_points_take_precedence_over_the_manifest(self):
+        registry = self.get_registry(
+            [
+                importlib.metadata.EntryPoint(
+                    name="pld",
+                    value="housefire.transformer.reits_by_ticker.dlr:DlrTransformer",
+                    group=TRANSFORMER_GROUP,
+                ),
+                importlib.metadata.EntryPoint(
+                    name="plugin",
+                    value="housefire.transformer.reits_by_ticker.pld:PldTransformer",
+                    group=TRANSFORMER_GROUP,
+                ),
+            ]
+        )
+
+        self.assertEqual(registry.names(), {"pld", "plugin"})
+        self.assertIs(registry.load("pld"), DlrTransformer)
+        self.assertEqual(
+            registry.reference("plugin"),
+            "housefire.transformer.reits_by_ticker.pld:PldTransformer",
+        )
+
+    def test_unknown_tickers_are_rejected(self):
+        with self.assertRaisesRegex(ValueError, "Unsupported ticker: unknown"):
+            self.get_registry().load("unknown")
+
+    def test_scrapers_and_transformers_cover_the_same_tickers(self):
+        self.assertEqual(SCRAPERS.names(), TRANSFORMERS.names())
+
+    @unittest.skipIf(tomllib is None, "tomllib needs python 3.11")
+    def test_pyproject_entry_points_match_the_manifests(self):
+        pyproject = Path(__file__).resolve().parents[2] / "pyproject.toml"
+        with open(pyproject, "rb") as f:
+            entry_points = tomllib.load(f)["project"]["entry-points"]
+
+        self.assertEqual(entry_points[SCRAPER_GROUP], SCRAPER_MANIFEST)
+        self.assertEqual(entry_points[TRANSFORMER_GROUP], TRANSFORMER_MANIFEST)
+
+
+class TestTickerRegistryImports(unittest.TestCase):
+    ROOT = Path(__file__).resolve().parents[2]
+
+    def get_imported_modules(self, code: str) -> set[str]:
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                code + "\nimport sys\nprint('\\n'.join(sys.modules))",
+            ],
+            capture_output=True,
+            text=True,
+            cwd=self.ROOT,
+            env={**os.environ, "PYTHONPATH": str(self.ROOT)},
+        )
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        return set(result.stdout.split())
+
+    def test_listing_tickers_imports_no_ticker_module(self):
+        modules = self.get_imported_modules(
+            "from housefire.registry import SCRAPERS, TRANSFORMERS\n"
+            "SCRAPERS.names() | TRANSFORMERS.names()"
+        )
+
+        self.assertFalse([m for m in modules if ".reits_by_ticker" in m])
+
+    def test_loading_a_ticker_imports_only_its_module(self):
+        modules = self.get_imported_modules(
+            "from housefire.registry import TRANSFORMERS\nTRANSFORMERS.load('pld')"
+        )
+
+        self.assertEqual(
+            {m for m in modules if ".reits_by_ticker." in m},
+            {"housefire.transformer.reits_by_ticker.pld"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,18 @@
 import asyncio
 import csv
+import importlib.util
 import json
+import os
+import subprocess
+import sys
 import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
 from housefire.scraper.reits_by_ticker.dlr import DlrScraper
-from housefire.scraper.scraper import ScrapeResult, Scraper
+from housefire.file_format import FILE_FORMATS
+from housefire.scraper.scraper import ScrapeResult, ScrapeResultWriter, Scraper
 
 
 class FakeElement:
@@ -59,6 +64,12 @@ class FakeScraper(Scraper):
         return self.results[:1]
 
 
+class StreamingFakeScraper(FakeScraper):
+
+    async def execute_scrape(self):
+        return [self._emit(result) for result in self.results]
+
+
 class TestScraper(unittest.TestCase):
 
     def setUp(self):
@@ -72,8 +83,13 @@ class TestScraper(unittest.TestCase):
         results = asyncio.run(self.scraper.scrape())
 
         self.assertEqual(results, self.scraper.results)
-        self.scraper.logger.debug.assert_any_call("Scraping data for REIT: pld")
-        self.scraper.logger.debug.assert_any_call("Scraped data for REIT: pld")
+        messages = [
+            c.args[0] % c.args[1:] for c in self.scraper.logger.debug.call_args_list
+        ]
+        self.assertIn("Scraping data for REIT: pld", messages)
+        self.assertIn(
+            f"Scraped data for REIT: pld, results: {len(results)} items", messages[-1]
+        )
 
     def test_wait_waits_for_requested_seconds(self):
         result = asyncio.run(self.scraper._wait(4))
@@ -107,6 +123,117 @@ class TestScraper(unittest.TestCase):
         self.assertEqual(loaded[0].property_info["state"], "")
         self.assertEqual(loaded[1].property_info["city"], "")
 
+    def test_projection_keeps_declared_fields_unless_raw_fields_are_kept(self):
+        row = {"Street Address 1": "1 Main Street", "City": "X", "Unused": "y"}
+        self.scraper.result_fields = ("City", "Street Address 1", "Missing")
+
+        self.assertEqual(
+            self.scraper._project(row),
+            {"City": "X", "Street Address 1": "1 Main Street"},
+        )
+        self.scraper.keep_raw_fields = True
+        self.assertEqual(self.scraper._project(row), row)
+
+    def test_scrape_results_read_only_requested_fields(self):
+        results = [
+            ScrapeResult({"name": "Park 1", "city": "New York", "unused": "x"}),
+            ScrapeResult({"name": "Park 2", "unused": "y"}),
+        ]
+
+        for file_format in FILE_FORMATS:
+            if file_format == "parquet" and not importlib.util.find_spec("pyarrow"):
+                continue
+            with (
+                self.subTest(file_format=file_format),
+                tempfile.TemporaryDirectory() as directory,
+            ):
+                path = Path(directory) / f"scrape-results.{file_format}"
+                ScrapeResult.write(results, path, file_format)
+
+                loaded = ScrapeResult.read(path, fields=("city", "name"))
+                chunks = list(
+                    ScrapeResult.iter_chunks(path, chunk_size=1, fields=("name",))
+                )
+
+            self.assertEqual(
+                loaded[0].property_info, {"name": "Park 1", "city": "New York"}
+            )
+            self.assertNotIn("unused", loaded[1].property_info)
+            self.assertEqual(
+                [d.property_info for c in chunks for d in c],
+                [{"name": "Park 1"}, {"name": "Park 2"}],
+            )
+
+    def test_scrape_passes_results_to_sink(self):
+        streamed = []
+        for scraper in (FakeScraper(), StreamingFakeScraper()):
+            scraper.ticker = "pld"
+            scraper.logger = Mock()
+            scraper.result_sink = streamed.append
+            with self.subTest(scraper=type(scraper).__name__):
+                streamed.clear()
+                results = asyncio.run(scraper.scrape())
+                self.assertEqual(streamed, results)
+
+    def test_writer_streams_rows_in_first_seen_column_order(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "scrape-results.csv"
+            with ScrapeResultWriter(path, ["name"]) as writer:
+                writer.write(ScrapeResult({"address_input": "1", "city": "NYC"}))
+                with open(path, "r") as file:
+                    rows_before_close = list(csv.reader(file))
+                writer.write(ScrapeResult({"state": "NY", "address_input": "2"}))
+            with open(path, "r") as file:
+                rows = list(csv.reader(file))
+
+        self.assertEqual(
+            rows_before_close, [["name", "address_input", "city"], ["", "1", "NYC"]]
+        )
+        self.assertEqual(
+            rows,
+            [
+                ["name", "address_input", "city", "state"],
+                ["", "1", "NYC", ""],
+                ["", "2", "", "NY"],
+            ],
+        )
+
+    def test_writer_rewrites_rows_with_quoted_newlines_when_widening(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "scrape-results.csv"
+            with ScrapeResultWriter(path) as writer:
+                writer.write(ScrapeResult({"description": "line 1\nline 2"}))
+                writer.write(ScrapeResult({"description": "x", "code": "A1"}))
+            loaded = ScrapeResult.from_csv(path)
+            leftover_files = sorted(p.name for p in Path(directory).iterdir())
+
+        self.assertEqual(
+            [r.property_info for r in loaded],
+            [
+                {"description": "line 1\nline 2", "code": ""},
+                {"description": "x", "code": "A1"},
+            ],
+        )
+        self.assertEqual(leftover_files, ["scrape-results.csv"])
+
+    def test_scrape_result_columnar_formats_keep_only_present_keys(self):
+        results = [
+            ScrapeResult({"address_input": "1 Main Street", "city": "New York"}),
+            ScrapeResult({"address_input": "2 Main Street", "state": "NY"}),
+        ]
+        file_formats = ["jsonl"]
+        if importlib.util.find_spec("pyarrow"):
+            file_formats.append("parquet")
+
+        for file_format in file_formats:
+            with self.subTest(file_format=file_format):
+                with tempfile.TemporaryDirectory() as directory:
+                    path = Path(directory) / f"scrape-results.{file_format}"
+                    ScrapeResult.write(results, path, file_format)
+                    loaded = ScrapeResult.read(path)
+
+                self.assertEqual(loaded, results)
+
 
 class TestDlrScraper(unittest.TestCase):
 
@@ -237,6 +364,9 @@ class TestDlrScraper(unittest.TestCase):
                 ),
             },
         )
+        # every emitted key is declared, so the saved columns never depend on which
+        # sections the first detail page happened to have
+        self.assertEqual(set(result.property_info), set(DlrScraper.result_fields))
 
     def test_execute_scrape_visits_detail_tabs_and_closes_tabs(self):
         scraper = DlrScraper()
@@ -307,11 +437,40 @@ class TestDlrScraper(unittest.TestCase):
 
         self.assertEqual(results, [])
         scraper.logger.warning.assert_called_once()
-        warning_message = scraper.logger.warning.call_args.args[0]
+        warning_args = scraper.logger.warning.call_args.args
+        warning_message = warning_args[0] % warning_args[1:]
         self.assertIn("ch1", warning_message)
         self.assertIn("detail unavailable", warning_message)
         self.assertTrue(detail_tab.closed)
 
 
+class TestPldScraper(unittest.TestCase):
+
+    def test_saves_the_columns_the_transformer_reads(self):
+        from housefire.scraper.reits_by_ticker.pld import PldScraper
+        from housefire.transformer.reits_by_ticker.pld import PldTransformer
+
+        self.assertEqual(PldScraper.result_fields, PldTransformer.input_fields)
+
+    def test_import_skips_the_transformer(self):
+        root = Path(__file__).resolve().parents[2]
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys\n"
+                "import housefire.scraper.reits_by_ticker.pld\n"
+                "print('housefire.transformer.reits_by_ticker.pld' in sys.modules)\n",
+            ],
+            capture_output=True,
+            text=True,
+            cwd=root,
+            env={**os.environ, "PYTHONPATH": str(root)},
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        self.assertEqual(result.stdout.strip(), "False")
+
+
 if __name__ == "__main__":
     unittest.main()
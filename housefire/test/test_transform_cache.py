@@ -0,0 +1,95 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from housefire.dependency.housefire_client.housefire_object import Property
+from housefire.transformer.transform_cache import TransformCache
+
+
+class TestTransformCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.directory.name) / "transform_cache"
+        self.row = {"Property Name": "Park 1", "City": "Joliet"}
+        self.property = Property(
+            address_input="1 Main Street Joliet",
+            reit_ticker="pld",
+            city="Joliet",
+            latitude=41.5,
+            facts=[{"label": "Rail Served", "value": "Yes"}],
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_key_depends_on_namespace_and_row_content(self):
+        cache = TransformCache(self.cache_dir, "pld", "PldTransformer:1")
+        key = cache.key(self.row)
+
+        self.assertEqual(key, cache.key(dict(reversed(list(self.row.items())))))
+        self.assertNotEqual(key, cache.key({**self.row, "City": "Aurora"}))
+        self.assertNotEqual(
+            key, TransformCache(self.cache_dir, "pld", "PldTransformer:2").key(self.row)
+        )
+
+    def test_saved_properties_are_reused_by_the_next_cache(self):
+        cache = TransformCache(self.cache_dir, "pld", "PldTransformer:1")
+        key = cache.key(self.row)
+        self.assertIsNone(cache.lookup(key))
+        cache.store(key, [self.property])
+        cache.save()
+
+        reopened = TransformCache(self.cache_dir, "pld", "PldTransformer:1")
+
+        self.assertEqual(reopened.lookup(key), [self.property])
+        self.assertIsNone(reopened.lookup(reopened.key({"City": "Aurora"})))
+        self.assertEqual(
+            reopened.summary(),
+            "Transform cache for pld: 1 hits, 1 misses (50% hit rate)",
+        )
+
+    def test_save_drops_entries_the_run_did_not_use(self):
+        cache = TransformCache(self.cache_dir, "pld", "PldTransformer:1")
+        old_key = cache.key({"City": "Aurora"})
+        cache.store(old_key, [self.property])
+        cache.save()
+
+        second_run = TransformCache(self.cache_dir, "pld", "PldTransformer:1")
+        second_run.store(second_run.key(self.row), [self.property])
+        second_run.save()
+
+        self.assertIsNone(
+            TransformCache(self.cache_dir, "pld", "PldTransformer:1").lookup(old_key)
+        )
+
+    def test_torn_lines_are_skipped(self):
+        cache = TransformCache(self.cache_dir, "pld", "PldTransformer:1")
+        key = cache.key(self.row)
+        cache.store(key, [self.property])
+        cache.save()
+        with open(cache.path, "a") as f:
+            f.write('{"key": "abc", "prop')
+
+        self.assertEqual(
+            TransformCache(self.cache_dir, "pld", "PldTransformer:1").lookup(key),
+            [self.property],
+        )
+
+    def test_entries_written_with_a_single_property_are_missed(self):
+        cache = TransformCache(self.cache_dir, "pld", "PldTransformer:1")
+        key = cache.key(self.row)
+        os.makedirs(self.cache_dir)
+        with open(cache.path, "w") as f:
+            f.write(json.dumps({"key": key, "property": self.property.to_dict()}))
+            f.write("\n")
+
+        self.assertIsNone(
+            TransformCache(self.cache_dir, "pld", "PldTransformer:1").lookup(key)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
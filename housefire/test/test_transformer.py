@@ -1,15 +1,24 @@
+import importlib.util
 import json
+import logging
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from housefire.dependency.housefire_client.housefire_object import Geocode, Property
 from housefire.scraper.scraper import ScrapeResult
 from housefire.transformer.geocode_transformer import GeocodeTransformer
 from housefire.transformer.reits_by_ticker.dlr import DlrTransformer
 from housefire.transformer.reits_by_ticker.pld import PldTransformer
-from housefire.transformer.transformer import TransformResult, Transformer
+from housefire.file_format import FILE_FORMATS, infer_file_format
+from housefire.transformer.transformer import (
+    TransformResult,
+    Transformer,
+    _transform_shard,
+)
 
 
 class FakeTransformer(Transformer):
@@ -51,6 +60,54 @@ class TestTransformer(unittest.TestCase):
         self.assertEqual(second.property.reit_ticker, "PLD")
         transformer.logger.debug.assert_called()
 
+    def test_transform_chunks_drops_duplicates_across_chunks(self):
+        first = self.get_transform_result("1 Main Street")
+        duplicate = self.get_transform_result("1 Main Street")
+        second = self.get_transform_result("2 Main Street")
+        transformer = FakeTransformer()
+        transformer.execute_transform = lambda chunk: [r for r, in chunk]
+        transformer.ticker = "pld"
+        transformer.logger = Mock()
+
+        chunks = list(
+            transformer.transform_chunks([[(first,)], [(duplicate,), (second,)]])
+        )
+
+        self.assertEqual(chunks, [[first], [second]])
+        self.assertEqual(second.property.reit_ticker, "PLD")
+
+    def test_released_scrape_results_are_reloaded_from_the_artifact(self):
+        data = [
+            ScrapeResult({"address_input": "1 Main Street"}),
+            ScrapeResult({"address_input": "2 Main Street"}),
+        ]
+        transformer = FakeTransformer()
+        transformer.execute_transform = lambda chunk: [
+            TransformResult(
+                property=Property(
+                    address_input=d.property_info["address_input"], reit_ticker="pld"
+                ),
+                scrape_result=d,
+            )
+            for d in chunk
+        ]
+        transformer.ticker = "pld"
+        transformer.logger = Mock()
+        transformer.release_scrape_results = True
+
+        with tempfile.TemporaryDirectory() as directory:
+            transformer.scrape_artifact = Path(directory) / "scraped.csv"
+            ScrapeResult.to_csv(data, transformer.scrape_artifact)
+            results = [
+                r
+                for chunk in transformer.transform_chunks([data[:1], data[1:]])
+                for r in chunk
+            ]
+
+            self.assertEqual([r.scrape_result for r in results], [None, None])
+            self.assertEqual([r.scrape_ref.row for r in results], [0, 1])
+            self.assertEqual([r.load_scrape_result() for r in results], data)
+
     def test_debug_transform_limits_input_to_five_results(self):
         data = [ScrapeResult({"address_input": str(index)}) for index in range(7)]
         transformer = FakeTransformer(
@@ -99,7 +156,50 @@ class TestTransformer(unittest.TestCase):
         self.assertEqual(len(properties), 1)
         self.assertEqual(properties[0].property.address_input, "1 Main Street")
         self.assertEqual(properties[0].property.name, "Warehouse")
-        self.assertEqual(properties[0].scrape_result.property_info, {})
+        self.assertIsNone(properties[0].scrape_result)
+
+    def test_transform_result_round_trips_every_file_format(self):
+        result = self.get_transform_result("1 Main Street")
+        result.property.latitude = 1.5
+        result.property.facts = [{"label": "Clear Height", "value": "36'"}]
+
+        for file_format in FILE_FORMATS:
+            if file_format == "parquet" and not importlib.util.find_spec("pyarrow"):
+                continue
+            with self.subTest(file_format=file_format):
+                with tempfile.TemporaryDirectory() as directory:
+                    path = Path(directory) / f"properties.{file_format}"
+                    TransformResult.write([result], path, file_format)
+                    loaded = TransformResult.read(path)
+                    batch = TransformResult.read_properties(path)
+
+                loaded_property = loaded[0].property
+                self.assertEqual(loaded_property.address_input, "1 Main Street")
+                self.assertEqual(loaded_property.latitude, 1.5)
+                self.assertEqual(loaded_property.facts, result.property.facts)
+                self.assertEqual(batch.to_payloads(), [loaded_property.to_dict()])
+
+    def test_scrape_results_read_in_chunks_in_every_file_format(self):
+        data = [ScrapeResult({"address": str(index)}) for index in range(5)]
+
+        for file_format in FILE_FORMATS:
+            if file_format == "parquet" and not importlib.util.find_spec("pyarrow"):
+                continue
+            with self.subTest(file_format=file_format):
+                with tempfile.TemporaryDirectory() as directory:
+                    path = Path(directory) / f"scraped.{file_format}"
+                    ScrapeResult.write(data, path, file_format)
+                    chunks = list(ScrapeResult.iter_chunks(path, chunk_size=2))
+
+                self.assertEqual([len(c) for c in chunks], [2, 2, 1])
+                self.assertEqual([d for c in chunks for d in c], data)
+
+    def test_read_infers_csv_for_unknown_extensions(self):
+        self.assertEqual(infer_file_format(Path("properties.parquet")), "parquet")
+        self.assertEqual(infer_file_format(Path("properties.JSONL")), "jsonl")
+        self.assertEqual(infer_file_format(Path("properties.txt")), "csv")
+        with self.assertRaises(ValueError):
+            TransformResult.write([], Path("properties.xml"), "xml")
 
 
 def transformer_parse_area_unit(area):
@@ -140,6 +240,21 @@ class TestPldTransformer(unittest.TestCase):
             "1 Main Street, New York, NY 10001, US",
         )
 
+    def test_input_fields_cover_every_column_the_transform_reads(self):
+        transformer = PldTransformer()
+        transformer.ticker = "pld"
+        row = {field: "1" for field in PldTransformer.input_fields}
+        row["Available Square Footage"] = "1 SF"
+        row["Unused Export Column"] = "ignored"
+
+        projected = ScrapeResult(
+            {k: v for k, v in row.items() if k in PldTransformer.input_fields}
+        )
+        expected = transformer.execute_transform([ScrapeResult(row)])[0].property
+        actual = transformer.execute_transform([projected])[0].property
+
+        self.assertEqual(actual, expected)
+
     def test_execute_transform_parses_ordered_property_facts(self):
         transformer = PldTransformer()
         transformer.ticker = "pld"
@@ -227,6 +342,228 @@ class TestPldTransformer(unittest.TestCase):
 
         self.assertIsNone(transformed[0].property.facts)
 
+    def get_export_rows(self):
+        areas = ("2 ac", "1,000 - 3,000 SF", "45,000 SF", "12 ft")
+        fact_values = ("Yes", " N/A ", "", " Cross-dock ", "tbd")
+        rows = []
+        for index in range(100):
+            rows.append(
+                {
+                    "Property Name": f"Park {index}",
+                    "Street Address 1": f"{index} Main Street" if index % 7 else "",
+                    "Neighborhood": "South" if index % 4 == 0 else "",
+                    "City": "Joliet",
+                    "State": "IL",
+                    "Postal Code": "60436",
+                    "Country": "US",
+                    "Latitude": f"{40 + index / 100}",
+                    "Longitude": "-88.1",
+                    "Available Square Footage": areas[index % 4],
+                    "Rail Served": fact_values[index % 5],
+                    "Key Feature 3": fact_values[index % 3],
+                    "Unused Export Column": "ignored",
+                }
+            )
+        return [ScrapeResult(row) for row in rows]
+
+    def test_transform_file_matches_row_transform(self):
+        transformer = PldTransformer()
+        transformer.ticker = "pld"
+        transformer.logger = Mock()
+        data = self.get_export_rows()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "pld_scraped.csv"
+            ScrapeResult.to_csv(data, path)
+            expected = transformer.transform(ScrapeResult.read(path))
+            transformer.release_scrape_results = True
+            transformer.scrape_artifact = path
+            actual = transformer.transform_file(path, PldTransformer.input_fields)
+
+            self.assertEqual(
+                [r.property for r in actual], [r.property for r in expected]
+            )
+            self.assertEqual(actual[1].load_scrape_result(), data[1])
+
+    def test_transform_file_raises_the_row_transform_error(self):
+        transformer = PldTransformer()
+        transformer.ticker = "pld"
+        transformer.logger = Mock()
+        transformer.release_scrape_results = True
+        data = [
+            ScrapeResult(
+                {"Latitude": "1", "Longitude": "2", "Available Square Footage": area}
+            )
+            for area in ("10 SF", "10 m2", "1-2-3 SF")
+        ]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "pld_scraped.csv"
+            ScrapeResult.to_csv(data, path)
+
+            with self.assertRaisesRegex(ValueError, "Unsupported area unit: 10 m2"):
+                transformer.transform_file(path)
+
+    def test_parallel_transform_matches_in_process_transform(self):
+        transformer = PldTransformer()
+        transformer.ticker = "pld"
+        # worker processes unpickle the transformer, which a Mock logger cannot be
+        transformer.logger = logging.getLogger(__name__)
+        transformer.PARALLEL_MIN_ROWS = 10
+        data = self.get_export_rows()
+        expected = transformer.transform(data)
+
+        transformer.transform_workers = 3
+        transformer.release_scrape_results = True
+        actual = transformer.transform(data)
+
+        self.assertEqual([r.property for r in actual], [r.property for r in expected])
+        self.assertTrue(all(r.scrape_result is None for r in actual))
+
+    def test_concurrent_chunk_stages_send_each_chunk_to_the_pool_whole(self):
+        transformer = PldTransformer()
+        transformer.ticker = "pld"
+        transformer.logger = Mock()
+        data = self.get_export_rows()
+        expected = transformer.transform(data)
+        shard_sizes = {}
+
+        for concurrent in (False, True):
+            with (
+                patch(
+                    "housefire.transformer.transformer._transform_shard",
+                    side_effect=_transform_shard,
+                ) as transform_shard,
+                ThreadPoolExecutor(2) as executor,
+            ):
+                transformer._transform_executor = lambda row_count: nullcontext(
+                    executor
+                )
+                with transformer.chunk_stages(concurrent) as (execute, finish):
+                    actual = finish(data, execute(data))
+            shard_sizes[concurrent] = [
+                len(c.args[1]) for c in transform_shard.call_args_list
+            ]
+            self.assertEqual(
+                [r.property for r in actual], [r.property for r in expected]
+            )
+
+        # a chunk under PARALLEL_MIN_ROWS is only sent to the pool when concurrent
+        self.assertEqual(shard_sizes, {False: [], True: [len(data)]})
+
+    def test_cached_rows_skip_execute_transform(self):
+        transformer = PldTransformer()
+        transformer.ticker = "pld"
+        transformer.logger = Mock()
+        data = self.get_export_rows()
+
+        with tempfile.TemporaryDirectory() as directory:
+            transformer.use_transform_cache(Path(directory))
+            expected = transformer.transform(data)
+            transformer.use_transform_cache(Path(directory))
+            data[3] = ScrapeResult({**data[3].property_info, "City": "Aurora"})
+            execute_transform = transformer.execute_transform
+            transformed_rows = []
+            transformer.execute_transform = lambda rows: (
+                transformed_rows.extend(rows) or execute_transform(rows)
+            )
+
+            actual = transformer.transform(data)
+
+        self.assertEqual(transformed_rows, [data[3]])
+        self.assertEqual(actual[3].property.city, "Aurora")
+        self.assertEqual(
+            [r.property for r in actual[:3] + actual[4:]],
+            [r.property for r in expected[:3] + expected[4:]],
+        )
+        self.assertIs(actual[0].scrape_result, data[0])
+        self.assertEqual(
+            (transformer.transform_cache.hits, transformer.transform_cache.misses),
+            (len(data) - 1, 1),
+        )
+
+    def test_cached_rows_keep_every_property_they_were_transformed_into(self):
+        class UnitTransformer(Transformer):
+            transformed_rows = 0
+
+            def execute_transform(self, data):
+                self.transformed_rows += len(data)
+                return [
+                    TransformResult(
+                        property=Property(
+                            address_input=f"{d.property_info['address']} Unit {unit}",
+                            reit_ticker="pld",
+                        ),
+                        scrape_result=d,
+                    )
+                    for d in data
+                    for unit in ("A", "B")
+                ]
+
+        transformer = UnitTransformer()
+        transformer.ticker = "pld"
+        transformer.logger = Mock()
+        data = [ScrapeResult({"address": "1 Main Street"})]
+
+        with tempfile.TemporaryDirectory() as directory:
+            transformer.use_transform_cache(Path(directory))
+            expected = transformer.transform(data)
+            transformer.use_transform_cache(Path(directory))
+            actual = transformer.transform(data)
+
+        self.assertEqual(transformer.transformed_rows, 1)
+        self.assertEqual(
+            [r.property.address_input for r in actual],
+            ["1 Main Street Unit A", "1 Main Street Unit B"],
+        )
+        self.assertEqual([r.property for r in actual], [r.property for r in expected])
+        self.assertTrue(all(r.scrape_result is data[0] for r in actual))
+
+    def test_transform_file_with_cache_transforms_only_changed_rows(self):
+        transformer = PldTransformer()
+        transformer.ticker = "pld"
+        transformer.logger = Mock()
+        transformer.release_scrape_results = True
+        data = self.get_export_rows()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "pld_scraped.csv"
+            cache_dir = Path(directory) / "cache"
+            ScrapeResult.to_csv(data, path)
+            # entries written by the row transform are hit by the frame transform
+            transformer.use_transform_cache(cache_dir)
+            expected = transformer.transform(
+                ScrapeResult.read(path, fields=PldTransformer.input_fields)
+            )
+            data[3] = ScrapeResult({**data[3].property_info, "City": "Aurora"})
+            ScrapeResult.to_csv(data, path)
+            transformer.use_transform_cache(cache_dir)
+            transform_frame = transformer._transform_frame
+            transformed_rows = []
+            transformer._transform_frame = lambda frame: (
+                transformed_rows.append(len(frame)) or transform_frame(frame)
+            )
+
+            actual = transformer.transform_file(path, PldTransformer.input_fields)
+
+        self.assertEqual(transformed_rows, [1])
+        self.assertEqual(actual[3].property.city, "Aurora")
+        self.assertEqual(
+            [r.property for r in actual[:3] + actual[4:]],
+            [r.property for r in expected[:3] + expected[4:]],
+        )
+        self.assertEqual(
+            (transformer.transform_cache.hits, transformer.transform_cache.misses),
+            (len(data) - 1, 1),
+        )
+
+    def test_geocode_transformers_are_not_run_in_parallel(self):
+        transformer = DlrTransformer()
+        transformer.transform_workers = 4
+
+        with transformer._transform_executor(None) as executor:
+            self.assertIsNone(executor)
+
 
 class TestGeocodeTransformer(unittest.TestCase):
 
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from housefire.dependency.housefire_client.upload_journal import UploadJournal
+
+
+class TestUploadJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.journal_dir = Path(self.directory.name) / "journal"
+        self.payloads = [
+            {"addressInput": "1 Main Street", "reitTicker": "PLD"},
+            {"addressInput": "2 Main Street", "reitTicker": "PLD"},
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_run_id_depends_on_ticker_and_payloads(self):
+        run_id = UploadJournal.run_id("PLD", self.payloads)
+
+        self.assertEqual(run_id, UploadJournal.run_id("PLD", list(self.payloads)))
+        self.assertNotEqual(run_id, UploadJournal.run_id("DLR", self.payloads))
+        self.assertNotEqual(run_id, UploadJournal.run_id("PLD", self.payloads[:1]))
+
+    def test_new_journal_has_no_plan(self):
+        journal = UploadJournal.open(self.journal_dir, "PLD", self.payloads)
+
+        self.assertFalse(journal.has_plan)
+        self.assertTrue(self.journal_dir.is_dir())
+
+    def test_reopened_journal_reports_remaining_work(self):
+        journal = UploadJournal.open(self.journal_dir, "PLD", self.payloads)
+        journal.record_plan(["p-1", "p-2"], ["1 Main Street", "2 Main Street"])
+        journal.record_deleted(["p-1"])
+        journal.record_created(["2 Main Street"])
+
+        reopened = UploadJournal.open(self.journal_dir, "PLD", self.payloads)
+
+        self.assertTrue(reopened.has_plan)
+        self.assertEqual(reopened.remaining_deletes(), ["p-2"])
+        self.assertEqual(reopened.remaining_creates(), {"1 Main Street"})
+
+    def test_torn_last_line_is_ignored(self):
+        journal = UploadJournal.open(self.journal_dir, "PLD", self.payloads)
+        journal.record_plan(["p-1"], [])
+        with open(journal.path, "a") as f:
+            f.write('{"event": "deleted", "ids": ["p-')
+
+        reopened = UploadJournal.open(self.journal_dir, "PLD", self.payloads)
+
+        self.assertEqual(reopened.remaining_deletes(), ["p-1"])
+
+    def test_entries_appended_after_a_torn_line_are_kept(self):
+        journal = UploadJournal.open(self.journal_dir, "PLD", self.payloads)
+        journal.record_plan([], ["1 Main Street", "2 Main Street"])
+        with open(journal.path, "a") as f:
+            f.write('{"event": "created", "addressInputs": ["x')
+
+        UploadJournal.open(self.journal_dir, "PLD", self.payloads).record_created(
+            ["1 Main Street"]
+        )
+        reopened = UploadJournal.open(self.journal_dir, "PLD", self.payloads)
+
+        self.assertEqual(reopened.remaining_creates(), {"2 Main Street"})
+
+    def test_opening_a_run_removes_the_tickers_older_journals(self):
+        stale = UploadJournal.open(self.journal_dir, "PLD", self.payloads[:1])
+        stale.record_plan([], ["1 Main Street"])
+        other_ticker = UploadJournal.open(self.journal_dir, "DLR", self.payloads)
+        other_ticker.record_plan([], ["1 Main Street"])
+
+        journal = UploadJournal.open(self.journal_dir, "PLD", self.payloads)
+        journal.record_plan([], ["1 Main Street", "2 Main Street"])
+
+        self.assertFalse(stale.path.exists())
+        self.assertTrue(other_ticker.path.exists())
+        self.assertTrue(
+            UploadJournal.open(self.journal_dir, "PLD", self.payloads).has_plan
+        )
+
+    def test_opening_a_run_removes_expired_journals(self):
+        expired = UploadJournal.open(self.journal_dir, "DLR", self.payloads)
+        expired.record_plan([], ["1 Main Street"])
+        mtime = time.time() - UploadJournal.MAX_AGE_SECONDS - 60
+        os.utime(expired.path, (mtime, mtime))
+
+        UploadJournal.open(self.journal_dir, "PLD", self.payloads)
+
+        self.assertFalse(expired.path.exists())
+
+    def test_complete_removes_journal(self):
+        journal = UploadJournal.open(self.journal_dir, "PLD", self.payloads)
+        journal.record_plan([], ["1 Main Street"])
+
+        journal.complete()
+
+        self.assertFalse(journal.path.exists())
+        self.assertFalse(
+            UploadJournal.open(self.journal_dir, "PLD", self.payloads).has_plan
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,12 @@
-from housefire.dependency.google_maps import GoogleGeocodeAPI
+from typing import TYPE_CHECKING
+
 from housefire.dependency.housefire_client.housefire_object import Property, Geocode
 from housefire.transformer.transformer import Transformer, TransformResult
 from housefire.scraper.scraper import ScrapeResult
 
+if TYPE_CHECKING:
+    from housefire.dependency.google_maps import GoogleGeocodeAPI
+
 
 class GeocodeTransformer(Transformer):
     """
@@ -10,7 +14,7 @@ class GeocodeTransformer(Transformer):
     """
 
     # instantiated by factory
-    google_geocode_api_client: GoogleGeocodeAPI
+    google_geocode_api_client: "GoogleGeocodeAPI"
 
     def __init__(self):
         super().__init__()
@@ -42,7 +46,7 @@ class GeocodeTransformer(Transformer):
                 self.logger.error("No address input found in property info")
                 continue
             if address_input not in housefire_geocode_map:
-                self.logger.error(f"Failed to geocode address: {address_input}")
+                self.logger.error("Failed to geocode address: %s", address_input)
                 continue
 
             property = Property(address_input=address_input, reit_ticker=self.ticker)
@@ -1,42 +1,31 @@
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
 from housefire.transformer.transformer import Transformer, TransformResult
 from housefire.dependency.housefire_client.housefire_object import Property
-from housefire.scraper.scraper import ScrapeResult
+from housefire.file_format import infer_file_format
+from housefire.scraper.pld_export import (
+    COLUMN_NAMES_MAP,
+    EXPORT_FIELDS,
+    FACTS_FIELD_MAP,
+)
+from housefire.scraper.scraper import ScrapeResult, ScrapeResultRef
 
 
 class PldTransformer(Transformer):
-    facts_field_map = (
-        ("Available Date", "Available Date"),
-        ("Market Property Type", "Market Property Type"),
-        ("Truck Court Depth", "Truck Court Depth"),
-        ("Rail Served", "Rail Served"),
-        *((f"Key Feature {index}", f"Key Feature {index}") for index in range(1, 7)),
-        ("Unit Name", "Unit Name"),
-        ("Unit Office Size", "Unit Office Size"),
-        ("# of Grade Level Doors", "Grade Level Doors"),
-        ("Warehouse Lighting Type", "Warehouse Lighting Type"),
-        ("Clear Height", "Clear Height"),
-        ("Main Breaker Size (AMPS)", "Main Breaker Size (AMPS)"),
-        ("Fire Suppression System", "Fire Suppression System"),
-        ("# of Dock High Doors", "Dock High Doors"),
-    )
+    facts_field_map = FACTS_FIELD_MAP
+    column_names_map = COLUMN_NAMES_MAP
+    input_fields = EXPORT_FIELDS
+
+    FACT_PLACEHOLDERS = ("N/A", "TBD")
+    side_effect_free = True
 
     def __init__(self):
         super().__init__()
 
-        self.column_names_map = {
-            "Property Name": "name",
-            "Street Address 1": "address",
-            "Street Address 2": "address2",
-            "Neighborhood": "neighborhood",
-            "City": "city",
-            "State": "state",
-            "Postal Code": "zip",
-            "Country": "country",
-            "Latitude": "latitude",
-            "Longitude": "longitude",
-            "Available Square Footage": "squareFootage",
-        }
-
     def execute_transform(self, data: list[ScrapeResult]) -> list[TransformResult]:
         results: list[TransformResult] = list()
         for result in data:
@@ -76,6 +65,222 @@ class PldTransformer(Transformer):
             results.append(TransformResult(property=prop, scrape_result=result))
         return results
 
+    def transform_file(
+        self, file_path: Path, fields: Optional[Iterable[str]] = None
+    ) -> list[TransformResult]:
+        """
+        transforms a CSV export read straight into a DataFrame, column by column, without
+        building a ScrapeResult per row, when scrape results are released anyway, with
+        only the rows missing from the transform cache transformed if it is set
+        """
+        if not self.release_scrape_results or infer_file_format(file_path) != "csv":
+            return super().transform_file(file_path, fields)
+        field_set = set(fields) if fields is not None else None
+        frame = pd.read_csv(
+            file_path,
+            dtype=object,
+            keep_default_na=False,
+            usecols=(
+                (lambda column: column in field_set) if field_set is not None else None
+            ),
+        )
+        self.logger.debug(
+            "Transforming %d rows from %s for REIT: %s",
+            len(frame),
+            file_path,
+            self.ticker,
+        )
+        results = [
+            TransformResult(
+                property=prop,
+                scrape_ref=(
+                    ScrapeResultRef(self.scrape_artifact, row)
+                    if self.scrape_artifact is not None
+                    else None
+                ),
+            )
+            for row, properties in enumerate(self._transform_frame_cached(frame))
+            for prop in properties
+        ]
+        self._save_transform_cache()
+        return self._drop_duplicates(results, set())
+
+    def _transform_frame_cached(self, frame: pd.DataFrame) -> list[list[Property]]:
+        """
+        the properties of each row of frame, from _transform_frame for the rows missing
+        from the transform cache and cached for the rest, in frame order
+
+        rows are keyed by the same string values as the ScrapeResults read from the file,
+        so the row and frame transforms share cache entries
+        """
+        cache = self.transform_cache
+        if cache is None:
+            return [[prop] for prop in self._transform_frame(frame)]
+        keys = [cache.key(row) for row in frame.to_dict(orient="records")]
+        properties = [cache.lookup(key) for key in keys]
+        missing = [row for row, props in enumerate(properties) if props is None]
+        if missing:
+            for row, prop in zip(missing, self._transform_frame(frame.iloc[missing])):
+                cache.store(keys[row], [prop])
+                properties[row] = [prop]
+        return properties
+
+    def _transform_frame(self, frame: pd.DataFrame) -> list[Property]:
+        """
+        transforms a frame of export rows column by column, equivalent to execute_transform
+        """
+        if len(frame) == 0:
+            return list()
+        text = {
+            column: self._text_column(frame, column)
+            for column in (
+                "Property Name",
+                "Street Address 2",
+                "Neighborhood",
+                "City",
+                "State",
+                "Postal Code",
+                "Country",
+            )
+        }
+        address = self._text_column(frame, "Street Address 1")
+        coordinates = dict()
+        for column in ("Latitude", "Longitude"):
+            if column not in frame or frame[column].isna().any():
+                raise KeyError(column)
+            coordinates[column] = frame[column].astype(float).tolist()
+        return [
+            Property(
+                name=name,
+                address=address_1,
+                address2=address_2,
+                neighborhood=neighborhood,
+                city=city,
+                state=state,
+                zip=zip_code,
+                country=country,
+                latitude=latitude,
+                longitude=longitude,
+                square_footage=square_footage,
+                facts=facts,
+                address_input=address_input,
+                reit_ticker=self.ticker,
+            )
+            for (
+                name,
+                address_1,
+                address_2,
+                neighborhood,
+                city,
+                state,
+                zip_code,
+                country,
+                latitude,
+                longitude,
+                square_footage,
+                facts,
+                address_input,
+            ) in zip(
+                text["Property Name"],
+                address,
+                text["Street Address 2"],
+                text["Neighborhood"],
+                text["City"],
+                text["State"],
+                text["Postal Code"],
+                text["Country"],
+                coordinates["Latitude"],
+                coordinates["Longitude"],
+                self._square_footage_column(frame),
+                self._facts_column(frame),
+                self._address_input_column(frame),
+            )
+        ]
+
+    @staticmethod
+    def _text_column(frame: pd.DataFrame, column: str) -> list[Optional[str]]:
+        if column not in frame:
+            return [None] * len(frame)
+        return PldTransformer._values(frame[column])
+
+    @staticmethod
+    def _values(series: pd.Series) -> list:
+        """
+        the series as a list of Python values with None for every missing value
+        """
+        return series.astype(object).where(series.notna(), None).tolist()
+
+    @classmethod
+    def _square_footage_column(cls, frame: pd.DataFrame) -> list[Optional[float]]:
+        column = "Available Square Footage"
+        if column not in frame:
+            return [None] * len(frame)
+        return cls._map_distinct(frame[column], cls.parse_and_convert_area)
+
+    @classmethod
+    def _facts_column(cls, frame: pd.DataFrame) -> list[Optional[list[dict[str, str]]]]:
+        """
+        _parse_facts with each distinct value of a fact column cleaned once, only the fact
+        lists are built per row
+        """
+        labels = list()
+        values = list()
+        for source_field, label in cls.facts_field_map:
+            if source_field in frame:
+                labels.append(label)
+                values.append(cls._map_distinct(frame[source_field], cls._fact_value))
+        if not values:
+            return [None] * len(frame)
+        return [
+            [
+                {"label": label, "value": value}
+                for label, value in zip(labels, row)
+                if value is not None
+            ]
+            or None
+            for row in zip(*values)
+        ]
+
+    @classmethod
+    def _fact_value(cls, value: str) -> Optional[str]:
+        value = value.strip()
+        if not value or value.upper() in cls.FACT_PLACEHOLDERS:
+            return None
+        return value
+
+    @staticmethod
+    def _map_distinct(series: pd.Series, function: Callable) -> list:
+        """
+        applies function once per distinct value of series, in order of first appearance so
+        the first failing row raises, with None for missing values
+        """
+        codes, distinct = pd.factorize(series)
+        mapped = np.array(
+            [*(function(value) for value in distinct), None], dtype=object
+        )
+        return mapped[codes].tolist()
+
+    @staticmethod
+    def _address_input_column(frame: pd.DataFrame) -> list[str]:
+        def column(name: str) -> pd.Series:
+            if name not in frame:
+                return pd.Series("", index=frame.index, dtype=object)
+            return frame[name].astype(object).where(frame[name].notna(), "")
+
+        address = column("Street Address 1")
+        address_input = (
+            address
+            + ", "
+            + column("City")
+            + ", "
+            + column("State")
+            + " "
+            + column("Postal Code")
+            + ", "
+            + column("Country")
+        )
+        return address_input.where(address != "", "").tolist()
+
     @classmethod
     def _parse_facts(cls, prop_info: dict) -> list[dict[str, str]] | None:
         facts = []
@@ -83,8 +288,8 @@ class PldTransformer(Transformer):
             value = prop_info.get(source_field)
             if value is None:
                 continue
-            value = value.strip()
-            if not value or value.upper() in {"N/A", "TBD"}:
+            value = cls._fact_value(value)
+            if value is None:
                 continue
             facts.append({"label": label, "value": value})
         return facts or None
@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from housefire.atomic_file import atomic_write
+from housefire.dependency.housefire_client import json_codec
+from housefire.dependency.housefire_client.housefire_object import Property
+
+
+class TransformCache:
+    """
+    On-disk cache of transformed properties keyed by a hash of the scraped row they came
+    from, so rows unchanged since the last run skip execute_transform, and with it
+    geocoding, and reuse their previous properties
+
+    Keys hash the transformer class, its version, and the row's property_info, so bumping
+    Transformer.version invalidates every entry. Each ticker's entries are one JSON-lines
+    file, rewritten by save with only the entries the latest run looked up, so rows that
+    disappeared from the source do not accumulate. Lookups and stores are thread-safe, so
+    chunks can be transformed in several threads at once.
+
+    Args:
+        cache_dir (Path): directory holding one file per ticker
+        ticker (str): the ticker whose rows are cached
+        namespace (str): the transformer class and version, part of every key
+    """
+
+    def __init__(self, cache_dir: Path, ticker: str, namespace: str):
+        self.path = Path(cache_dir, f"{ticker}.jsonl")
+        self.ticker = ticker
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self._stored: dict[str, list[dict]] = dict()
+        self._used: dict[str, list[dict]] = dict()
+        self._lock = threading.Lock()
+        if self.path.exists():
+            self._load()
+
+    def key(self, property_info: dict) -> str:
+        encoded = json.dumps(property_info, sort_keys=True, default=str)
+        return hashlib.sha256(f"{self.namespace}\n{encoded}".encode()).hexdigest()[:32]
+
+    def lookup(self, key: str) -> Optional[list[Property]]:
+        """
+        new properties built from the cached payloads for key, every property its row was
+        transformed into, counting a hit or a miss
+        """
+        with self._lock:
+            payloads = self._stored.get(key)
+            if payloads is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._used[key] = payloads
+        return [Property.from_dict(payload) for payload in payloads]
+
+    def store(self, key: str, properties: list[Property]) -> None:
+        payloads = [prop.to_dict() for prop in properties]
+        with self._lock:
+            self._used[key] = payloads
+
+    def save(self) -> None:
+        """
+        replaces the ticker's file with the entries looked up or stored since it was read
+        """
+        os.makedirs(self.path.parent, exist_ok=True)
+        with atomic_write(self.path) as f:
+            for key, payloads in self._used.items():
+                f.write(json_codec.dumps({"key": key, "properties": payloads}))
+                f.write(b"\n")
+        self._stored = dict(self._used)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Transform cache for {self.ticker}: {self.hits} hits, {self.misses} misses"
+            f" ({self.hit_rate:.0%} hit rate)"
+        )
+
+    def _load(self) -> None:
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    entry = json_codec.loads(line)
+                    self._stored[entry["key"]] = entry["properties"]
+                except (ValueError, KeyError):
+                    # a torn line, or one written before rows cached a list of
+                    # properties, is only a missed row, it is transformed again
+                    continue
@@ -1,10 +1,23 @@
+import logging
+import math
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
+from itertools import repeat
 from logging import Logger
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
 
-from housefire.dependency.housefire_client.housefire_object import Property
-from housefire.scraper.scraper import ScrapeResult
+from housefire.dependency.housefire_client.housefire_object import (
+    DEFAULT_CHUNK_SIZE,
+    Property,
+)
+from housefire.dependency.housefire_client.property_batch import PropertyBatch
+from housefire.file_format import check_file_format, infer_file_format
+from housefire.logger import HousefireLoggerFactory, log_event
+from housefire.scraper.scraper import ScrapeResult, ScrapeResultRef
+from housefire.transformer.transform_cache import TransformCache
 
 
 class Transformer(ABC):
@@ -12,10 +25,35 @@ class Transformer(ABC):
     # injected by factory
     logger: Logger
     ticker: str
+    # scrape result keys execute_transform reads, empty if it may read any key
+    input_fields: tuple[str, ...] = ()
+    # drop each result's ScrapeResult once transformed, so only the Property stays in
+    # memory, keeping a reference to its row of scrape_artifact if that is set
+    release_scrape_results: bool = False
+    scrape_artifact: Optional[Path] = None
+    # whether execute_transform only reads its input and the transformer's own settings,
+    # so shards of the input can be transformed in worker processes
+    side_effect_free: bool = False
+    # worker processes for side effect free transformers, injected by factory from config
+    transform_workers: int = 1
+    # inputs smaller than this are transformed in process, where starting workers and
+    # pickling rows would cost more than the transform itself
+    PARALLEL_MIN_ROWS = 5_000
+    # bump when execute_transform gives a different property for the same row, so cached
+    # properties from earlier versions are not reused
+    version: str = "1"
+    # reuses the properties of rows unchanged since the last run, if set
+    transform_cache: Optional[TransformCache] = None
 
     def __init__(self):
         pass
 
+    def __getstate__(self) -> dict:
+        # worker processes only run execute_transform, which never reads the cache
+        state = self.__dict__.copy()
+        state.pop("transform_cache", None)
+        return state
+
     @abstractmethod
     def execute_transform(self, data: list[ScrapeResult]) -> list["TransformResult"]:
         return NotImplemented
@@ -31,23 +69,258 @@ class Transformer(ABC):
         """
         transform data and log
         """
-        self.logger.debug(f"Transforming data for REIT: {self.ticker}, df: {data}")
-        transformed_data = self.execute_transform(data)
-        duplicate_addresses = set()
+        log_event(
+            self.logger, logging.DEBUG, "transforming", ticker=self.ticker, data=data
+        )
+        with self._transform_executor(len(data)) as executor:
+            transformed_data = self._execute_transform(data, executor)
+        results = self._drop_duplicates(transformed_data, set())
+        self._release_scrape_results(results, data, 0)
+        self._save_transform_cache()
+        log_event(
+            self.logger,
+            logging.DEBUG,
+            "transformed",
+            ticker=self.ticker,
+            results=results,
+        )
+        return results
+
+    def transform_file(
+        self, file_path: Path, fields: Optional[Iterable[str]] = None
+    ) -> list["TransformResult"]:
+        """
+        transform a saved scrape artifact, reading only the keys in fields if given,
+        transformers that can read the file faster than as ScrapeResults override this
+        """
+        return self.transform(ScrapeResult.read(file_path, fields=fields))
+
+    def transform_chunks(
+        self, chunks: Iterable[list[ScrapeResult]]
+    ) -> Iterator[list["TransformResult"]]:
+        """
+        transform data one chunk at a time, dropping duplicates across every chunk
+        """
+        with self.chunk_transform() as transform_chunk:
+            for chunk in chunks:
+                yield transform_chunk(chunk)
+
+    @contextmanager
+    def chunk_transform(
+        self,
+    ) -> Iterator[Callable[[list[ScrapeResult]], list["TransformResult"]]]:
+        """
+        a function transforming chunks one call at a time as transform_chunks does, for
+        callers handed chunks as they arrive instead of as an iterable, with the transform
+        cache saved once the context exits
+        """
+        with self.chunk_stages() as (execute_chunk, finish_chunk):
+            yield lambda chunk: finish_chunk(chunk, execute_chunk(chunk))
+
+    @contextmanager
+    def chunk_stages(self, concurrent: bool = False) -> Iterator[
+        tuple[
+            Callable[[list[ScrapeResult]], list["TransformResult"]],
+            Callable[
+                [list[ScrapeResult], list["TransformResult"]], list["TransformResult"]
+            ],
+        ]
+    ]:
+        """
+        chunk_transform split in two for callers transforming several chunks at once, the
+        first function transforms a chunk and may run for several chunks at once in
+        threads, the second drops duplicates and releases scrape results and must be called
+        with each chunk and its transformed results in the order the chunks arrived
+
+        If concurrent, each chunk goes to the process pool whole, however small, since the
+        concurrent chunks already keep the workers busy, instead of being sharded.
+        """
+        seen_addresses: set[str] = set()
+        offset = 0
+        index = 0
+        shards = 1 if concurrent else None
+
+        def execute_chunk(chunk: list[ScrapeResult]) -> list["TransformResult"]:
+            self.logger.debug(
+                "Transforming chunk of %d rows for REIT: %s", len(chunk), self.ticker
+            )
+            return self._execute_transform(chunk, executor, shards)
+
+        def finish_chunk(
+            chunk: list[ScrapeResult], transformed_data: list["TransformResult"]
+        ) -> list["TransformResult"]:
+            nonlocal offset, index
+            results = self._drop_duplicates(transformed_data, seen_addresses)
+            self._release_scrape_results(results, chunk, offset)
+            self.logger.debug(
+                "Transformed chunk %d of %d rows for REIT: %s",
+                index,
+                len(chunk),
+                self.ticker,
+            )
+            offset += len(chunk)
+            index += 1
+            return results
+
+        # one pool for every chunk, chunk sizes are not known up front
+        with self._transform_executor(None) as executor:
+            yield execute_chunk, finish_chunk
+        self._save_transform_cache()
+
+    def use_transform_cache(self, cache_dir: Path) -> TransformCache:
+        """
+        opens this transformer's cache in cache_dir and reuses it in every transform
+        """
+        self.transform_cache = TransformCache(
+            cache_dir, self.ticker, f"{type(self).__name__}:{self.version}"
+        )
+        return self.transform_cache
+
+    def _save_transform_cache(self) -> None:
+        if self.transform_cache is None:
+            return
+        self.transform_cache.save()
+        self.logger.info(self.transform_cache.summary())
+
+    def _transform_executor(self, row_count: Optional[int]):
+        """
+        a process pool if data of row_count rows, or of any size if None, should be
+        transformed in parallel, otherwise a context holding None
+        """
+        if (
+            not self.side_effect_free
+            or self.transform_workers <= 1
+            or (row_count is not None and row_count < self.PARALLEL_MIN_ROWS)
+        ):
+            return nullcontext(None)
+        return self._process_pool()
+
+    @contextmanager
+    def _process_pool(self) -> Iterator[ProcessPoolExecutor]:
+        # records logged in the workers reach the parent's log handlers
+        with HousefireLoggerFactory.process_pool_logging() as logging_options:
+            with ProcessPoolExecutor(
+                max_workers=self.transform_workers, **logging_options
+            ) as executor:
+                yield executor
+
+    def _execute_transform(
+        self,
+        data: list[ScrapeResult],
+        executor: Optional[Executor],
+        shards: Optional[int] = None,
+    ) -> list["TransformResult"]:
+        """
+        execute_transform of the rows missing from the transform cache, with cached
+        properties for the rest, in input order, see _execute_sharded for shards
+        """
+        cache = self.transform_cache
+        if cache is None:
+            return self._execute_sharded(data, executor, shards)
+        keys = [cache.key(scrape_result.property_info) for scrape_result in data]
+        cached = [cache.lookup(key) for key in keys]
+        rows = {id(scrape_result): index for index, scrape_result in enumerate(data)}
+        transformed: dict[int, list[TransformResult]] = dict()
+        unmatched = list()
+        for result in self._execute_sharded(
+            [d for d, props in zip(data, cached) if props is None], executor, shards
+        ):
+            row = rows.get(id(result.scrape_result))
+            if row is None:
+                unmatched.append(result)
+                continue
+            transformed.setdefault(row, []).append(result)
+        # a row may be transformed into several properties, they are cached together
+        for row, row_results in transformed.items():
+            cache.store(keys[row], [result.property for result in row_results])
         results = list()
+        for row, (scrape_result, props) in enumerate(zip(data, cached)):
+            if props is not None:
+                results.extend(
+                    TransformResult(property=prop, scrape_result=scrape_result)
+                    for prop in props
+                )
+            else:
+                results.extend(transformed.get(row, ()))
+        return results + unmatched
 
-        # drop duplicates and upper case reit tickers
+    def _execute_sharded(
+        self,
+        data: list[ScrapeResult],
+        executor: Optional[Executor],
+        shards: Optional[int] = None,
+    ) -> list["TransformResult"]:
+        """
+        execute_transform, sharded across executor's workers if it is set and data is
+        large enough, with the results merged back in input order, data is split into
+        shards pieces of any size if given, otherwise one per worker once it has
+        PARALLEL_MIN_ROWS rows
+        """
+        if executor is None or not data:
+            return self.execute_transform(data)
+        if shards is None:
+            if len(data) < self.PARALLEL_MIN_ROWS:
+                return self.execute_transform(data)
+            shards = self.transform_workers
+        shard_size = math.ceil(len(data) / shards)
+        starts = range(0, len(data), shard_size)
+        self.logger.debug(
+            "Transforming %d rows for REIT: %s in %d shards",
+            len(data),
+            self.ticker,
+            len(starts),
+        )
+        results = list()
+        for start, shard_results in zip(
+            starts,
+            executor.map(
+                _transform_shard,
+                repeat(self),
+                (data[start : start + shard_size] for start in starts),
+            ),
+        ):
+            # scrape results are matched back to the caller's objects instead of the
+            # copies the worker unpickled, so releasing them by identity still works
+            results.extend(
+                TransformResult(
+                    property=property,
+                    scrape_result=None if row is None else data[start + row],
+                )
+                for row, property in shard_results
+            )
+        return results
+
+    def _release_scrape_results(
+        self, results: list["TransformResult"], data: list[ScrapeResult], offset: int
+    ) -> None:
+        """
+        if release_scrape_results is set, replaces each result's ScrapeResult with a
+        reference to its row of scrape_artifact, where data starts at row offset
+        """
+        if not self.release_scrape_results:
+            return
+        rows = {id(scrape_result): index for index, scrape_result in enumerate(data)}
+        for result in results:
+            row = rows.get(id(result.scrape_result))
+            if self.scrape_artifact is not None and row is not None:
+                result.scrape_ref = ScrapeResultRef(self.scrape_artifact, offset + row)
+            result.scrape_result = None
+
+    def _drop_duplicates(
+        self, transformed_data: list["TransformResult"], seen_addresses: set[str]
+    ) -> list["TransformResult"]:
+        """
+        drop results whose address input is in seen_addresses or repeated, adding the kept
+        address inputs to seen_addresses, and upper case reit tickers
+        """
+        results = list()
         for result in transformed_data:
             result.property.reit_ticker = self.ticker.upper()
-            if result.property.address_input in duplicate_addresses:
-                self.logger.debug(f"Dropping duplicate: {result}")
+            if result.property.address_input in seen_addresses:
+                self.logger.debug("Dropping duplicate: %s", result)
                 continue
-            duplicate_addresses.add(result.property.address_input)
+            seen_addresses.add(result.property.address_input)
             results.append(result)
-
-        self.logger.debug(
-            f"Transformed data for REIT: {self.ticker}, results: {results}"
-        )
         return results
 
     @staticmethod
@@ -88,11 +361,36 @@ class Transformer(ABC):
         return float(digits)
 
 
+def _transform_shard(
+    transformer: Transformer, shard: list[ScrapeResult]
+) -> list[tuple[Optional[int], Property]]:
+    """
+    runs in a worker process, returning each result's property with the index of its
+    scrape result in shard, so the scrape results are not pickled back
+    """
+    rows = {id(scrape_result): index for index, scrape_result in enumerate(shard)}
+    return [
+        (rows.get(id(result.scrape_result)), result.property)
+        for result in transformer.execute_transform(shard)
+    ]
+
+
 @dataclass
 class TransformResult:
     property: Property
-    # TODO: remove scraperesult ???
-    scrape_result: ScrapeResult
+    # the raw result the property was transformed from, None once released or when the
+    # property was read back from a file
+    scrape_result: Optional[ScrapeResult] = None
+    # where to reload a released scrape result from
+    scrape_ref: Optional[ScrapeResultRef] = None
+
+    def load_scrape_result(self) -> Optional[ScrapeResult]:
+        """
+        the raw scrape result, reloaded from the scrape artifact if it was released
+        """
+        if self.scrape_result is None and self.scrape_ref is not None:
+            return self.scrape_ref.load()
+        return self.scrape_result
 
     @staticmethod
     def to_csv(data: list["TransformResult"], destination_path: Path) -> None:
@@ -100,7 +398,74 @@ class TransformResult:
 
     @staticmethod
     def from_csv(file_path: Path) -> list["TransformResult"]:
+        return [TransformResult(property=p) for p in Property.from_csv(file_path)]
+
+    @staticmethod
+    def iter_csv(
+        file_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[list["TransformResult"]]:
+        for chunk in Property.iter_csv(file_path, chunk_size):
+            yield [TransformResult(property=p) for p in chunk]
+
+    @staticmethod
+    def write(
+        data: list["TransformResult"], destination_path: Path, file_format: str
+    ) -> None:
+        """
+        writes the transformed properties as csv, parquet, or jsonl
+        """
+        if check_file_format(file_format) == "csv":
+            TransformResult.to_csv(data, destination_path)
+            return
+        batch = PropertyBatch.from_properties(d.property for d in data)
+        if file_format == "parquet":
+            batch.to_parquet(destination_path)
+        else:
+            batch.to_jsonl(destination_path)
+
+    @staticmethod
+    def read_properties(
+        file_path: Path, file_format: Optional[str] = None
+    ) -> PropertyBatch:
+        """
+        reads transformed properties into a PropertyBatch, in the given format or the one
+        inferred from the file extension
+        """
+        readers = {
+            "csv": PropertyBatch.from_csv,
+            "parquet": PropertyBatch.from_parquet,
+            "jsonl": PropertyBatch.from_jsonl,
+        }
+        return readers[check_file_format(file_format or infer_file_format(file_path))](
+            file_path
+        )
+
+    @staticmethod
+    def iter_properties(
+        file_path: Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        file_format: Optional[str] = None,
+    ) -> Iterator[PropertyBatch]:
+        """
+        reads transformed properties as read_properties does, in batches of up to
+        chunk_size rows
+        """
+        readers = {
+            "csv": PropertyBatch.iter_csv,
+            "parquet": PropertyBatch.iter_parquet,
+            "jsonl": PropertyBatch.iter_jsonl,
+        }
+        return readers[check_file_format(file_format or infer_file_format(file_path))](
+            file_path, chunk_size
+        )
+
+    @staticmethod
+    def read(
+        file_path: Path, file_format: Optional[str] = None
+    ) -> list["TransformResult"]:
         return [
-            TransformResult(property=p, scrape_result=ScrapeResult(dict()))
-            for p in Property.from_csv(file_path)
+            TransformResult(property=p)
+            for p in TransformResult.read_properties(
+                file_path, file_format
+            ).to_properties()
         ]
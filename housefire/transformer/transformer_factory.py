@@ -1,48 +1,43 @@
-from housefire.dependency.google_maps import GoogleGeocodeAPI
+from typing import TYPE_CHECKING
+
 from housefire.logger import HousefireLoggerFactory
+from housefire.registry import TRANSFORMERS, TickerRegistry
 from housefire.transformer.geocode_transformer import GeocodeTransformer
-from housefire.transformer.reits_by_ticker.pld import PldTransformer
-from housefire.transformer.reits_by_ticker.spg import SpgTransformer
-from housefire.transformer.reits_by_ticker.dlr import DlrTransformer
-from housefire.transformer.reits_by_ticker.well import WellTransformer
-from housefire.transformer.reits_by_ticker.eqix import EqixTransformer
 from housefire.transformer.transformer import Transformer
 
+if TYPE_CHECKING:
+    from housefire.dependency.google_maps import GoogleGeocodeAPI
+
 
 class TransformerFactory:
     """
-    Factory class for creating Transformer instances
+    Factory class for creating Transformer instances, importing only the requested
+    ticker's transformer module
     """
 
-    transformer_map = {
-        "pld": PldTransformer,
-        "spg": SpgTransformer,
-        "dlr": DlrTransformer,
-        "well": WellTransformer,
-        "eqix": EqixTransformer,
-    }
+    registry: TickerRegistry = TRANSFORMERS
 
     def __init__(
         self,
         logger_factory: HousefireLoggerFactory,
-        geocode_api_client: GoogleGeocodeAPI,
+        geocode_api_client: "GoogleGeocodeAPI",
+        transform_workers: int = 1,
     ):
         self.logger_factory = logger_factory
         self.google_geocode_api_client = geocode_api_client
+        self.transform_workers = transform_workers
 
     @classmethod
     def supported_tickers(cls) -> set[str]:
-        return set(cls.transformer_map)
+        return cls.registry.names()
 
     def get_transformer(self, ticker: str) -> Transformer:
         """
         Get a new instance of a Transformer subclass
         """
-        if ticker not in self.transformer_map:
-            raise ValueError(f"Unsupported ticker: {ticker}")
-
-        transformer = self.transformer_map[ticker]()
+        transformer = self.registry.load(ticker)()
         transformer.ticker = ticker
+        transformer.transform_workers = self.transform_workers
         transformer.logger = self.logger_factory.get_logger(
             transformer.__class__.__name__
         )
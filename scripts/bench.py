@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the upload and transform paths.
+
+Payloads are synthetic but shaped like real PLD and DLR transformer output: the
+same camelCase fields, fact labels, and value formats, with enough variation
+that compressors cannot cheat on identical rows.
+
+    python scripts/bench.py compression --rows 5000
+    python scripts/bench.py codec --rows 20000
+    python scripts/bench.py memory --rows 100000
+    python scripts/bench.py transform --rows 50000 --workers 4
+"""
+
+import argparse
+import dataclasses
+import gc
+import gzip
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from housefire.dependency.housefire_client import json_codec  # noqa: E402
+from housefire.dependency.housefire_client.client import HousefireClient  # noqa: E402
+from housefire.dependency.housefire_client.housefire_object import (  # noqa: E402
+    Geocode,
+    Property,
+)
+from housefire.scraper.scraper import ScrapeResult  # noqa: E402
+from housefire.transformer.reits_by_ticker.pld import PldTransformer  # noqa: E402
+
+STREETS = ("Logistics Way", "Commerce Drive", "Industrial Pkwy", "Harbor Blvd")
+CITIES = (
+    ("Ontario", "CA", "91761"),
+    ("Joliet", "IL", "60436"),
+    ("Dallas", "TX", "75261"),
+    ("Edison", "NJ", "08837"),
+)
+PLD_FEATURES = (
+    "ESFR Sprinklers",
+    "LED Lighting",
+    "Cross Dock",
+    "Trailer Parking",
+    "Fenced Yard",
+    "Rail Access",
+)
+DLR_CERTIFICATIONS = ("ISO 27001", "SOC 1 Type II", "SOC 2 Type II", "PCI DSS")
+
+
+def pld_payload(rng: random.Random, index: int) -> dict:
+    city, state, postal_code = rng.choice(CITIES)
+    street = f"{rng.randint(100, 9999)} {rng.choice(STREETS)}"
+    facts = [
+        {"label": "Available Date", "value": f"2026-{rng.randint(1, 12):02d}-01"},
+        {"label": "Market Property Type", "value": "Industrial"},
+        {"label": "Clear Height", "value": f"{rng.randint(24, 40)}'"},
+        {"label": "Dock High Doors", "value": str(rng.randint(4, 80))},
+        {"label": "Grade Level Doors", "value": str(rng.randint(0, 6))},
+        {"label": "Rail Served", "value": rng.choice(("Yes", "No"))},
+    ]
+    for feature_index, feature in enumerate(rng.sample(PLD_FEATURES, 3), start=1):
+        facts.append({"label": f"Key Feature {feature_index}", "value": feature})
+    return {
+        "name": f"Prologis Park {index}",
+        "addressInput": f"{street}, {city}, {state} {postal_code}, US",
+        "address": street,
+        "city": city,
+        "state": state,
+        "zip": postal_code,
+        "country": "US",
+        "latitude": round(rng.uniform(25, 48), 6),
+        "longitude": round(rng.uniform(-122, -71), 6),
+        "squareFootage": float(rng.randint(20_000, 1_200_000)),
+        "facts": facts,
+        "reitTicker": "PLD",
+    }
+
+
+def dlr_payload(rng: random.Random, index: int) -> dict:
+    city, state, postal_code = rng.choice(CITIES)
+    street = f"{rng.randint(100, 9999)} {rng.choice(STREETS)}"
+    facts = [
+        {"label": "Facility Code", "value": f"{state}{index:04d}"},
+        {
+            "label": "Description",
+            "value": f"Carrier-neutral data center with {rng.randint(2, 40)} MW of "
+            "critical IT load and direct access to major cloud on-ramps.",
+        },
+        {"label": "Building Structure", "value": "Purpose-built"},
+        {"label": "Total Building Size", "value": f"{rng.randint(50, 500)},000 sq ft"},
+        {"label": "UPS Redundancy", "value": rng.choice(("N+1", "2N", "N+2"))},
+        {"label": "Cooling Redundancy", "value": rng.choice(("N+1", "N+2"))},
+    ]
+    for certification in rng.sample(DLR_CERTIFICATIONS, 2):
+        facts.append({"label": "Compliance Certification", "value": certification})
+    return {
+        "name": f"DLR {city} {index}",
+        "addressInput": f"{street}, {city}, {state} {postal_code}, US",
+        "address": street,
+        "city": city,
+        "state": state,
+        "zip": postal_code,
+        "country": "US",
+        "latitude": round(rng.uniform(25, 48), 6),
+        "longitude": round(rng.uniform(-122, -71), 6),
+        "squareFootage": float(rng.randint(50_000, 500_000)),
+        "facts": facts,
+        "reitTicker": "DLR",
+    }
+
+
+def spg_payload(rng: random.Random, index: int) -> dict:
+    """geocode-only rows, like SPG, EQIX, and WELL, where most fields stay empty"""
+    city, state, postal_code = rng.choice(CITIES)
+    street = f"{rng.randint(100, 9999)} {rng.choice(STREETS)}"
+    return {
+        "addressInput": f"{street}, {city}, {state} {postal_code}, US",
+        "address": street,
+        "city": city,
+        "state": state,
+        "zip": postal_code,
+        "country": "US",
+        "latitude": round(rng.uniform(25, 48), 6),
+        "longitude": round(rng.uniform(-122, -71), 6),
+        "reitTicker": "SPG",
+    }
+
+
+PAYLOAD_FACTORIES: dict[str, Callable[[random.Random, int], dict]] = {
+    "pld": pld_payload,
+    "dlr": dlr_payload,
+    "spg": spg_payload,
+}
+
+
+def sample_payloads(ticker: str, rows: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    factory = PAYLOAD_FACTORIES[ticker]
+    return [factory(rng, index) for index in range(rows)]
+
+
+def timed(function: Callable[[], object], repeat: int) -> tuple[object, float]:
+    """
+    runs function repeat times with the garbage collector paused, like timeit, returning
+    its result and the best time in seconds
+    """
+    best = float("inf")
+    result = None
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            result = None
+            started = time.perf_counter()
+            result = function()
+            best = min(best, time.perf_counter() - started)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return result, best
+
+
+def bench_compression(args: argparse.Namespace) -> None:
+    codecs: dict[str, Callable[[bytes], bytes]] = {
+        "gzip-1": lambda body: gzip.compress(body, compresslevel=1),
+        f"gzip-{HousefireClient.GZIP_COMPRESS_LEVEL}": lambda body: gzip.compress(
+            body, compresslevel=HousefireClient.GZIP_COMPRESS_LEVEL
+        ),
+        "gzip-9": lambda body: gzip.compress(body, compresslevel=9),
+    }
+    try:
+        import zstandard
+
+        codecs["zstd-3"] = zstandard.ZstdCompressor(level=3).compress
+    except ImportError:
+        pass
+
+    upload_header = f"total s @ {args.mbit_per_second:g} Mbit/s"
+    print(
+        f"{'ticker':<6} {'codec':<8} {'bytes/chunk':>12} {'ratio':>6} "
+        f"{'ms/chunk':>9} {upload_header:>21}"
+    )
+    for ticker in args.tickers:
+        payloads = sample_payloads(ticker, args.rows)
+        bodies = [
+            json.dumps(payloads[i : i + args.chunk_rows]).encode()
+            for i in range(0, len(payloads), args.chunk_rows)
+        ]
+        raw_bytes = sum(len(body) for body in bodies)
+        rows = [("none", raw_bytes, 0.0)]
+        for name, compress in codecs.items():
+            compressed, seconds = timed(
+                lambda: [compress(body) for body in bodies], args.repeat
+            )
+            rows.append((name, sum(len(c) for c in compressed), seconds))
+        for name, total_bytes, seconds in rows:
+            wire_seconds = total_bytes * 8 / (args.mbit_per_second * 1_000_000)
+            print(
+                f"{ticker:<6} {name:<8} {total_bytes // len(bodies):>12} "
+                f"{raw_bytes / total_bytes:>6.1f} "
+                f"{seconds * 1000 / len(bodies):>9.2f} "
+                f"{wire_seconds + seconds:>21.2f}"
+            )
+
+
+def api_response(payload: dict, index: int) -> dict:
+    """adds the metadata fields the API returns on top of an uploaded payload"""
+    return {
+        "id": f"clx{index:021d}",
+        "createdAt": "2026-10-01T12:00:00.000000",
+        "updatedAt": "2026-10-02T08:30:00.000000",
+        **payload,
+    }
+
+
+def geocode_response(payload: dict, index: int) -> dict:
+    return api_response(
+        {
+            "addressInput": payload["addressInput"],
+            "streetNumber": payload["address"].split(" ", 1)[0],
+            "route": payload["address"].split(" ", 1)[1],
+            "locality": payload["city"],
+            "administrativeAreaLevel1": payload["state"],
+            "country": payload["country"],
+            "postalCode": payload["zip"],
+            "formattedAddress": payload["addressInput"],
+            "latitude": payload["latitude"],
+            "longitude": payload["longitude"],
+        },
+        index,
+    )
+
+
+def bench_codec(args: argparse.Namespace) -> None:
+    print(f"orjson installed: {json_codec.HAS_ORJSON}")
+    print(f"{'dataset':<9} {'path':<16} {'encode us/obj':>14} {'decode us/obj':>14}")
+    datasets = {
+        ticker: (
+            Property,
+            [
+                api_response(payload, i)
+                for i, payload in enumerate(sample_payloads(ticker, args.rows))
+            ],
+        )
+        for ticker in PAYLOAD_FACTORIES
+    }
+    datasets["geocode"] = (
+        Geocode,
+        [
+            geocode_response(payload, i)
+            for i, payload in enumerate(sample_payloads("pld", args.rows))
+        ],
+    )
+    for name, (cls, responses) in datasets.items():
+        objects = [cls.from_dict(response) for response in responses]
+        body = json.dumps(responses).encode()
+        paths = {
+            "stdlib json": (
+                lambda: json.dumps([o.to_dict() for o in objects]).encode(),
+                lambda: [cls.from_dict(d) for d in json.loads(body)],
+            ),
+            "json_codec": (
+                lambda: cls.list_to_json(objects),
+                lambda: cls.list_from_json(body),
+            ),
+        }
+        for path, (encode, decode) in paths.items():
+            _, encode_seconds = timed(encode, args.repeat)
+            _, decode_seconds = timed(decode, args.repeat)
+            print(
+                f"{name:<9} {path:<16} "
+                f"{encode_seconds * 1e6 / len(objects):>14.2f} "
+                f"{decode_seconds * 1e6 / len(objects):>14.2f}"
+            )
+
+
+# Property as it was before records were slotted and interned, for the memory baseline
+DictProperty = dataclasses.make_dataclass(
+    "DictProperty",
+    [
+        (f.name, f.type, dataclasses.field(default=f.default))
+        for f in dataclasses.fields(Property)
+    ],
+)
+API_TO_FIELD = {
+    "id": "id",
+    "name": "name",
+    "addressInput": "address_input",
+    "address": "address",
+    "address2": "address2",
+    "neighborhood": "neighborhood",
+    "city": "city",
+    "state": "state",
+    "zip": "zip",
+    "country": "country",
+    "latitude": "latitude",
+    "longitude": "longitude",
+    "squareFootage": "square_footage",
+    "facts": "facts",
+    "reitTicker": "reit_ticker",
+}
+
+
+def retained_bytes(build: Callable[[], list]) -> tuple[int, int]:
+    """returns the bytes still allocated by build's result, and its length"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, len(result)
+
+
+def bench_memory(args: argparse.Namespace) -> None:
+    print(f"{'ticker':<6} {'record':<24} {'MiB':>8} {'bytes/row':>10}")
+    for ticker in args.tickers:
+        body = json.dumps(sample_payloads(ticker, args.rows)).encode()
+        builders = {
+            "dataclass with __dict__": lambda: [
+                DictProperty(**{API_TO_FIELD[k]: v for k, v in d.items()})
+                for d in json.loads(body)
+            ],
+            "slotted, interned": lambda: [
+                Property.from_dict(d) for d in json.loads(body)
+            ],
+        }
+        for name, build in builders.items():
+            retained, rows = retained_bytes(build)
+            print(
+                f"{ticker:<6} {name:<24} {retained / 2**20:>8.1f} "
+                f"{retained // rows:>10}"
+            )
+
+
+def pld_export_row(rng: random.Random, index: int) -> dict:
+    """a row of the Prologis CSV export, every value a string as read from the file"""
+    payload = pld_payload(rng, index)
+    facts = {fact["label"]: fact["value"] for fact in payload["facts"]}
+    area = rng.choice(
+        (
+            f"{int(payload['squareFootage']):,} SF",
+            f"{rng.randint(5, 90)} AC",
+            f"{rng.randint(10, 40) * 1000:,} - {rng.randint(41, 90) * 1000:,} SF",
+        )
+    )
+    return {
+        "Property Name": payload["name"],
+        "Street Address 1": payload["address"],
+        "Street Address 2": rng.choice(("", "Suite 100", "Building B")),
+        "Neighborhood": rng.choice(("", "Inland Empire West", "I-55 Corridor")),
+        "City": payload["city"],
+        "State": payload["state"],
+        "Postal Code": payload["zip"],
+        "Country": payload["country"],
+        "Latitude": str(payload["latitude"]),
+        "Longitude": str(payload["longitude"]),
+        "Available Square Footage": area,
+        "Available Date": facts["Available Date"],
+        "Market Property Type": facts["Market Property Type"],
+        "Truck Court Depth": rng.choice(("130.0000", "185.0000", "N/A")),
+        "Rail Served": facts["Rail Served"],
+        **{f"Key Feature {n}": facts.get(f"Key Feature {n}", "") for n in range(1, 7)},
+        "Unit Name": rng.choice(("", "Unit A", "Unit 200")),
+        "Unit Office Size": f"{rng.randint(1, 20) * 1000:,} SF",
+        "# of Grade Level Doors": facts["Grade Level Doors"],
+        "Warehouse Lighting Type": rng.choice(("LED", "T5", " TBD ")),
+        "Clear Height": facts["Clear Height"],
+        "Main Breaker Size (AMPS)": rng.choice(("2,000", "3,000", "")),
+        "Fire Suppression System": rng.choice(("ESFR", "Wet", "")),
+        "# of Dock High Doors": facts["Dock High Doors"],
+    }
+
+
+def bench_transform(args: argparse.Namespace) -> None:
+    rng = random.Random(0)
+    data = [ScrapeResult(pld_export_row(rng, i)) for i in range(args.rows)]
+    transformer = PldTransformer()
+    transformer.ticker = "pld"
+    transformer.logger = logging.getLogger("bench")
+    transformer.release_scrape_results = True
+    fields = PldTransformer.input_fields
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory, "pld_scraped.csv")
+        ScrapeResult.to_csv(data, path)
+        paths = {
+            # transform without its debug logging, which formats every row
+            "row loop": lambda: transformer._drop_duplicates(
+                transformer.execute_transform(ScrapeResult.read(path, fields=fields)),
+                set(),
+            ),
+            "vectorized": lambda: transformer.transform_file(path, fields),
+        }
+        if args.workers > 1:
+            transformer.transform_workers = args.workers
+            paths["parallel"] = lambda: parallel_transform(
+                transformer, ScrapeResult.read(path, fields=fields)
+            )
+        results = dict()
+        print(f"{'path':<12} {'seconds':>8} {'us/row':>8}")
+        for name, transform in paths.items():
+            results[name], seconds = timed(transform, args.repeat)
+            print(f"{name:<12} {seconds:>8.3f} {seconds * 1e6 / len(data):>8.2f}")
+    for name, transformed in results.items():
+        if [r.property for r in transformed] != [
+            r.property for r in results["row loop"]
+        ]:
+            raise SystemExit(f"{name} transform does not match the row loop")
+
+
+def parallel_transform(transformer: PldTransformer, data: list[ScrapeResult]) -> list:
+    """
+    the sharded row loop, including process pool startup
+    """
+    with transformer._transform_executor(len(data)) as executor:
+        return transformer._drop_duplicates(
+            transformer._execute_transform(data, executor), set()
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    compression = subparsers.add_parser(
+        "compression", help="request body size and time per upload chunk by codec"
+    )
+    compression.add_argument("--rows", type=int, default=5000)
+    compression.add_argument("--chunk-rows", type=int, default=250)
+    compression.add_argument("--repeat", type=int, default=3)
+    compression.add_argument("--mbit-per-second", type=float, default=10.0)
+    compression.add_argument(
+        "--tickers",
+        nargs="+",
+        default=list(PAYLOAD_FACTORIES),
+        choices=PAYLOAD_FACTORIES,
+    )
+    compression.set_defaults(run=bench_compression)
+
+    codec = subparsers.add_parser(
+        "codec", help="per-object JSON encode and decode cost of housefire objects"
+    )
+    codec.add_argument("--rows", type=int, default=20000)
+    codec.add_argument("--repeat", type=int, default=3)
+    codec.set_defaults(run=bench_codec)
+
+    memory = subparsers.add_parser(
+        "memory", help="memory retained by decoded property records"
+    )
+    memory.add_argument("--rows", type=int, default=100_000)
+    memory.add_argument(
+        "--tickers",
+        nargs="+",
+        default=list(PAYLOAD_FACTORIES),
+        choices=PAYLOAD_FACTORIES,
+    )
+    memory.set_defaults(run=bench_memory)
+
+    transform = subparsers.add_parser(
+        "transform",
+        help="PLD transform time from a saved export, row loop against vectorized",
+    )
+    transform.add_argument("--rows", type=int, default=50_000)
+    transform.add_argument("--repeat", type=int, default=3)
+    transform.add_argument(
+        "--workers", type=int, default=1, help="also time the row loop sharded"
+    )
+    transform.set_defaults(run=bench_transform)
+
+    args = parser.parse_args(argv)
+    args.run(args)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())